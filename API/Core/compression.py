@@ -0,0 +1,96 @@
+import gzip
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from Core.config import COMPRESSION_MIN_SIZE, GZIP_LEVEL, BROTLI_QUALITY
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def NegotiateEncoding(acceptEncoding: str) -> Optional[str]:
+    accepted = {}
+    for part in acceptEncoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if quality > 0:
+            accepted[name.strip()] = quality
+
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    candidates = [name for name in candidates if name in accepted or "*" in accepted]
+    if not candidates:
+        return None
+    # Highest q wins; on a tie keep the preference order above (br first)
+    return max(candidates, key=lambda name: accepted.get(name, accepted.get("*", 0)))
+
+
+def Compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    Brotli or gzip compression, negotiated from Accept-Encoding, for complete JSON/text
+    responses of at least `minimumSize` bytes. Streamed bodies (file downloads) pass through.
+    """
+
+    def __init__(self, app, minimumSize: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimumSize = minimumSize
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = NegotiateEncoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        pendingStart = None
+
+        async def SendCompressed(message):
+            nonlocal pendingStart
+            if message["type"] == "http.response.start":
+                # Hold the headers back until the first body chunk shows whether to compress
+                pendingStart = message
+                return
+            if message["type"] != "http.response.body" or pendingStart is None:
+                await send(message)
+                return
+
+            start, pendingStart = pendingStart, None
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimumSize
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            compressed = await run_in_threadpool(Compress, body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, SendCompressed)
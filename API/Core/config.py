@@ -1,14 +1,132 @@
 import os
-from sqlalchemy.engine.url import URL
+from sqlalchemy.engine.url import URL, make_url
 
 DATABASE_CONFIG_SERVER = {
-    "drivername": "mysql+pymysql",
-    "host": "localhost",
-    "port": "3307",
-    "username": "mabaszada",
-    "password": "YU3TIV",
-    "database": "Team7",
+    "drivername": os.getenv("DB_DRIVER", "mysql+pymysql"),
+    "host": os.getenv("DB_HOST", "localhost"),
+    "port": os.getenv("DB_PORT", "3307"),
+    "username": os.getenv("DB_USER", "mabaszada"),
+    "password": os.getenv("DB_PASSWORD", "YU3TIV"),
+    "database": os.getenv("DB_NAME", "Team7"),
 }
 
-DATABASE_URL = URL.create(**DATABASE_CONFIG_SERVER)
-print(DATABASE_URL)
\ No newline at end of file
+DATABASE_URL = make_url(os.getenv("DATABASE_URL")) if os.getenv("DATABASE_URL") else URL.create(**DATABASE_CONFIG_SERVER)
+
+# Connection pool. Size the pool so that workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+# stays below MySQL max_connections; /internal/db-pool shows the real usage.
+DATABASE_POOL_CONFIG = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_use_lifo": os.getenv("DB_POOL_USE_LIFO", "false").lower() == "true",
+}
+
+# "pessimistic" pings every connection on checkout, "optimistic" relies on
+# DB_POOL_RECYCLE and lets a dropped connection fail the request it was used in.
+DATABASE_PRE_PING_STRATEGY = os.getenv("DB_PRE_PING_STRATEGY", "pessimistic").lower()
+
+# Async engine used by the async read endpoints. Derived from DATABASE_URL by swapping
+# in an async driver (aiomysql, or asyncmy via DB_ASYNC_DRIVER; aiosqlite for local SQLite).
+ASYNC_DRIVERS = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+ASYNC_DATABASE_URL = (
+    make_url(os.getenv("ASYNC_DATABASE_URL")) if os.getenv("ASYNC_DATABASE_URL")
+    else DATABASE_URL.set(drivername=os.getenv("DB_ASYNC_DRIVER") or ASYNC_DRIVERS.get(DATABASE_URL.get_backend_name(), DATABASE_URL.drivername))
+)
+
+# Owner-or-member answers cached across requests, keyed by (userId, projectId). The cache lives
+# in each worker process and membership changes only evict it in the worker that made them, so
+# with several workers a removed member keeps access on the others for up to
+# PROJECT_ACCESS_CACHE_TTL seconds. Keep it short; 0 disables the cache.
+PROJECT_ACCESS_CACHE_SIZE = int(os.getenv("PROJECT_ACCESS_CACHE_SIZE", "10000"))
+PROJECT_ACCESS_CACHE_TTL = int(os.getenv("PROJECT_ACCESS_CACHE_TTL", "10"))
+
+# Authenticated principal caches: decoded tokens live until their own expiry (decoding gives the
+# same answer on every worker, so there is nothing to revoke). User snapshots live until
+# USER_CACHE_TTL or the next write to that user in the same worker: with several workers a
+# deleted or changed user stays cached on the others for up to USER_CACHE_TTL seconds.
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "10"))
+
+# bcrypt runs in its own process pool ("process") or in a request thread ("inline").
+# Login, register and reset-password are async and await the pool, so callers waiting for
+# a worker hold no request thread. Requests beyond workers + queue wait at most
+# PASSWORD_HASH_QUEUE_TIMEOUT seconds and then get a 503.
+PASSWORD_HASH_MODE = os.getenv("PASSWORD_HASH_MODE", "process").lower()
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "2"))
+
+# Keyset pagination for list endpoints. Every list is paged, DEFAULT_PAGE_SIZE rows unless ?limit=
+# says otherwise; clients follow the X-Next-Cursor header (Frontend/src/lib/pagination.ts does).
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "500"))
+
+# /internal/* reports pool sizing, the SFTP host and load patterns. It only answers requests that
+# send INTERNAL_API_TOKEN in the X-Internal-Token header; with no token configured it is a 404.
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "")
+
+# Upper bound on the number of rows a single bulk endpoint call may carry
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "500"))
+
+# Files move to and from storage UPLOAD_CHUNK_SIZE bytes at a time, so a worker holds at most
+# one chunk per transfer in memory whatever the file size
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+# Where uploads are stored: "sftp" (the university web host) or "local" (UPLOAD_FOLDER, for development and tests)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "sftp").lower()
+UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "./uploads")
+
+SFTP_HOST = os.getenv("SFTP_HOST", "clabsql.clamv.constructor.university")
+SFTP_PORT = int(os.getenv("SFTP_PORT", "22"))
+SFTP_USER = os.getenv("SFTP_USER", "mabaszada")
+SFTP_PASSWORD = os.getenv("SFTP_PASSWORD", "YU3TIV")
+SFTP_HOME_DIR = os.getenv("SFTP_HOME_DIR", "/home/mabaszada")
+# Files are only served through signed download links, so SFTP_REMOTE_DIR must not be under the
+# host's web root (public_html); anything stored there could be fetched by anyone who guesses the path
+SFTP_REMOTE_DIR = os.getenv("SFTP_REMOTE_DIR", "/home/mabaszada/attachments")
+
+# Authenticated SFTP sessions are pooled per worker. A session idle for longer than
+# SFTP_POOL_HEALTH_CHECK_AFTER seconds is probed before reuse and closed after
+# SFTP_POOL_IDLE_TIMEOUT; uploads beyond SFTP_POOL_SIZE wait SFTP_POOL_WAIT_TIMEOUT, then get a 503.
+SFTP_POOL_SIZE = int(os.getenv("SFTP_POOL_SIZE", "4"))
+# Streamed downloads hold a session until the client has read the whole file, so they get a
+# separate pool of SFTP_DOWNLOAD_POOL_SIZE sessions and never take one from an upload
+SFTP_DOWNLOAD_POOL_SIZE = int(os.getenv("SFTP_DOWNLOAD_POOL_SIZE", "8"))
+SFTP_POOL_IDLE_TIMEOUT = float(os.getenv("SFTP_POOL_IDLE_TIMEOUT", "300"))
+SFTP_POOL_HEALTH_CHECK_AFTER = float(os.getenv("SFTP_POOL_HEALTH_CHECK_AFTER", "30"))
+SFTP_POOL_WAIT_TIMEOUT = float(os.getenv("SFTP_POOL_WAIT_TIMEOUT", "10"))
+
+# /attachments/upload stages the file in UPLOAD_STAGING_DIR, answers with a Pending attachment and
+# leaves the transfer to UPLOAD_WORKERS background threads (0 runs it in the request thread right
+# after commit). Up to UPLOAD_MAX_QUEUE transfers may wait for a worker; further uploads wait
+# UPLOAD_QUEUE_TIMEOUT seconds for room and then get a 503. A failed transfer is tried
+# UPLOAD_MAX_ATTEMPTS times in total, backing off from UPLOAD_RETRY_DELAY seconds.
+UPLOAD_STAGING_DIR = os.getenv("UPLOAD_STAGING_DIR", os.path.join(UPLOAD_FOLDER, ".staging"))
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", str(SFTP_POOL_SIZE)))
+UPLOAD_MAX_QUEUE = int(os.getenv("UPLOAD_MAX_QUEUE", "64"))
+UPLOAD_QUEUE_TIMEOUT = float(os.getenv("UPLOAD_QUEUE_TIMEOUT", "5"))
+UPLOAD_MAX_ATTEMPTS = int(os.getenv("UPLOAD_MAX_ATTEMPTS", "3"))
+UPLOAD_RETRY_DELAY = float(os.getenv("UPLOAD_RETRY_DELAY", "2"))
+
+# Attachments carry HMAC-signed download links to GET /attachments/files/{token}, which streams
+# the file without a login or a database lookup. A link is valid for DOWNLOAD_URL_TTL to twice
+# that; expiry is rounded so the same file keeps the same URL (and cache entry) in between.
+# Without DOWNLOAD_URL_SECRET every worker signs with its own random key, so links only work on
+# the worker that issued them and until it restarts: set it wherever more than one worker runs.
+DOWNLOAD_URL_SECRET = os.getenv("DOWNLOAD_URL_SECRET", "")
+DOWNLOAD_URL_TTL = int(os.getenv("DOWNLOAD_URL_TTL", "3600"))
+PUBLIC_API_URL = os.getenv("PUBLIC_API_URL", "http://localhost:8000")
+
+# Response compression: brotli (when the brotli package is installed) or gzip,
+# negotiated per request, for JSON/text bodies of at least COMPRESSION_MIN_SIZE bytes.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+# Startup. The schema is owned by Alembic (`python migrate.py`); create_all on boot is
+# only kept as an opt-in for throwaway local databases. Workers open DB_POOL_PREWARM
+# connections before they start serving, so the first requests skip the connect cost.
+DB_CREATE_ALL_ON_STARTUP = os.getenv("DB_CREATE_ALL_ON_STARTUP", "false").lower() == "true"
+DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", "0"))
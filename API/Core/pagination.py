@@ -0,0 +1,79 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, or_, tuple_
+
+from Core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def EncodeCursor(sortValue: Optional[datetime], rowId: str) -> str:
+    raw = json.dumps([sortValue.isoformat() if sortValue is not None else None, str(rowId)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def DecodeCursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sortValue, rowId = json.loads(raw)
+        return (datetime.fromisoformat(sortValue) if sortValue is not None else None), str(rowId)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+class PageParams:
+    """Query parameters shared by every paginated list endpoint."""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None, description=f"Opaque cursor taken from the {NEXT_CURSOR_HEADER} response header"),
+    ):
+        self.limit = limit
+        self.after = DecodeCursor(cursor) if cursor else None
+
+
+class Page:
+    def __init__(self, items: List[Any], nextCursor: Optional[str]):
+        self.items = items
+        self.nextCursor = nextCursor
+
+
+def After(after, sortColumn, idColumn):
+    # A NULL sort key never compares greater than anything, so NULL-keyed rows get their own
+    # branch. They sort first in MySQL and SQLite: after one come the remaining NULL-keyed
+    # rows by Id, then every row with a value; after a value no NULL-keyed row is left.
+    sortValue, rowId = after
+    if sortValue is None:
+        return or_(and_(sortColumn.is_(None), idColumn > rowId), sortColumn.is_not(None))
+    return tuple_(sortColumn, idColumn) > tuple_(sortValue, rowId)
+
+def Paginate(statement, page: PageParams, sortColumn, idColumn):
+    """
+    Keyset pagination on (sortColumn, idColumn). Fetches one extra row to know whether
+    another page exists, so no COUNT query is needed.
+    """
+    if page.after:
+        statement = statement.where(After(page.after, sortColumn, idColumn))
+    return statement.order_by(sortColumn, idColumn).limit(page.limit + 1)
+
+def ToPage(rows, page: PageParams, sortColumn, idColumn) -> Page:
+    rows = list(rows)
+    if len(rows) <= page.limit:
+        return Page(rows, None)
+    last = rows[page.limit - 1]
+    return Page(rows[:page.limit], EncodeCursor(getattr(last, sortColumn.key), getattr(last, idColumn.key)))
+
+def FetchPage(db, statement, page: PageParams, sortColumn, idColumn) -> Page:
+    return ToPage(db.scalars(Paginate(statement, page, sortColumn, idColumn)), page, sortColumn, idColumn)
+
+async def FetchPageAsync(db, statement, page: PageParams, sortColumn, idColumn) -> Page:
+    return ToPage(await db.scalars(Paginate(statement, page, sortColumn, idColumn)), page, sortColumn, idColumn)
+
+def PageResponse(response: Response, page: Page) -> List[Any]:
+    """Keeps list endpoints returning a plain list; the next cursor travels in a header."""
+    if page.nextCursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.nextCursor
+    return page.items
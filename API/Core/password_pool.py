@@ -0,0 +1,139 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from threading import BoundedSemaphore, Lock
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from passlib.context import CryptContext
+
+from Core.config import PASSWORD_HASH_MODE, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_QUEUE_TIMEOUT
+from Db.pool_metrics import Histogram
+
+PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def HashInWorker(password: str) -> str:
+    return PWD_CONTEXT.hash(password)
+
+def VerifyInWorker(plainPassword: str, hashedPassword: str) -> bool:
+    return PWD_CONTEXT.verify(plainPassword, hashedPassword)
+
+
+class PasswordPool:
+    """
+    Runs bcrypt in a bounded process pool and keeps queue-depth and latency metrics.
+    Endpoints await RunAsync, so callers queued for a worker hold no request thread;
+    Run is the blocking form for code outside the event loop.
+    """
+
+    def __init__(self, mode: str, workers: int, maxQueue: int, queueTimeout: float):
+        self.mode = mode
+        self.workers = workers
+        self.maxQueue = maxQueue
+        self.queueTimeout = queueTimeout
+        self.admission = BoundedSemaphore(workers + maxQueue)
+        self.asyncAdmission = None
+        self.executor = None
+        self.lock = Lock()
+        self.inFlight = 0
+        self.peakInFlight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.latency = Histogram()
+
+    def GetExecutor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self.executor
+
+    def GetAsyncAdmission(self) -> asyncio.Semaphore:
+        # One event loop per worker process; a new loop (tests) gets its own semaphore
+        loop = asyncio.get_running_loop()
+        if self.asyncAdmission is None or self.asyncAdmission[0] is not loop:
+            self.asyncAdmission = (loop, asyncio.BoundedSemaphore(self.workers + self.maxQueue))
+        return self.asyncAdmission[1]
+
+    def Reject(self):
+        with self.lock:
+            self.rejected += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many password operations in progress, please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+    def Started(self) -> float:
+        with self.lock:
+            self.inFlight += 1
+            self.peakInFlight = max(self.peakInFlight, self.inFlight)
+        return time.perf_counter()
+
+    def Finished(self, start: float, succeeded: bool):
+        with self.lock:
+            self.inFlight -= 1
+            if succeeded:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self.latency.Observe((time.perf_counter() - start) * 1000)
+
+    async def RunAsync(self, fn, *args):
+        admission = self.GetAsyncAdmission()
+        try:
+            await asyncio.wait_for(admission.acquire(), self.queueTimeout)
+        except asyncio.TimeoutError:
+            self.Reject()
+
+        start, succeeded = self.Started(), False
+        try:
+            if self.mode == "inline":
+                result = await run_in_threadpool(fn, *args)
+            else:
+                result = await asyncio.wrap_future(self.GetExecutor().submit(fn, *args))
+            succeeded = True
+            return result
+        finally:
+            self.Finished(start, succeeded)
+            admission.release()
+
+    def Run(self, fn, *args):
+        if not self.admission.acquire(timeout=self.queueTimeout):
+            self.Reject()
+
+        start, succeeded = self.Started(), False
+        try:
+            if self.mode == "inline":
+                result = fn(*args)
+            else:
+                result = self.GetExecutor().submit(fn, *args).result()
+            succeeded = True
+            return result
+        finally:
+            self.Finished(start, succeeded)
+            self.admission.release()
+
+    def Shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def Snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "max_queue": self.maxQueue,
+                "in_flight": self.inFlight,
+                "queued": max(0, self.inFlight - self.workers),
+                "peak_in_flight": self.peakInFlight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "latency": self.latency.Snapshot(),
+            }
+
+
+passwordPool = PasswordPool(PASSWORD_HASH_MODE, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_QUEUE_TIMEOUT)
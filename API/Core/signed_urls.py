@@ -0,0 +1,53 @@
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+import warnings
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from Core.config import DOWNLOAD_URL_SECRET, DOWNLOAD_URL_TTL, PUBLIC_API_URL
+
+if DOWNLOAD_URL_SECRET:
+    SIGNING_KEY = DOWNLOAD_URL_SECRET.encode()
+else:
+    # A key anyone can read in the repository would let anyone sign a link to any stored file
+    warnings.warn("DOWNLOAD_URL_SECRET is not set; download links are signed with a random per-process key")
+    SIGNING_KEY = secrets.token_bytes(32)
+
+
+def Encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def Decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def Signature(payload: str) -> str:
+    return Encode(hmac.new(SIGNING_KEY, payload.encode(), hashlib.sha256).digest())
+
+
+def SignDownloadUrl(filePath: str, fileName: str, fileType: Optional[str], fileSize: Optional[int], contentHash: Optional[str]) -> str:
+    """
+    A link that streams the file to whoever holds it until it expires. Everything the download
+    needs travels in the signed token, so serving it never touches the database.
+    """
+    if filePath.startswith("http://") or filePath.startswith("https://"):
+        return filePath
+    expires = (int(time.time()) // DOWNLOAD_URL_TTL + 2) * DOWNLOAD_URL_TTL
+    claims = {"p": filePath, "n": fileName, "t": fileType, "s": fileSize, "h": contentHash, "e": expires}
+    payload = Encode(json.dumps(claims, separators=(",", ":")).encode())
+    return f"{PUBLIC_API_URL}/attachments/files/{payload}.{Signature(payload)}"
+
+
+def VerifyDownloadToken(token: str) -> dict:
+    payload, _, signature = token.rpartition(".")
+    # compare_digest only takes ASCII str, and the token comes straight from the URL
+    if not payload or not hmac.compare_digest(signature.encode(), Signature(payload).encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid download link.")
+    claims = json.loads(Decode(payload))
+    if claims["e"] < time.time():
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Download link has expired.")
+    return claims
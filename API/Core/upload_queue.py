@@ -0,0 +1,151 @@
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Callable
+
+from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from Core.config import UPLOAD_WORKERS, UPLOAD_MAX_QUEUE, UPLOAD_QUEUE_TIMEOUT, UPLOAD_MAX_ATTEMPTS, UPLOAD_RETRY_DELAY
+from Db.pool_metrics import Histogram
+
+
+class UploadQueue:
+    """
+    Runs upload jobs on a bounded thread pool once the request that created them has committed.
+    A job is called with its attempt number and retried with exponential backoff until it
+    succeeds or runs out of attempts, at which point onFailure gets the last error.
+    """
+
+    def __init__(self, workers: int, maxQueue: int, queueTimeout: float, maxAttempts: int, retryDelay: float):
+        self.workers = workers
+        self.maxQueue = maxQueue
+        self.queueTimeout = queueTimeout
+        self.maxAttempts = maxAttempts
+        self.retryDelay = retryDelay
+        self.admission = BoundedSemaphore(max(workers, 1) + maxQueue)
+        self.executor = None
+        self.lock = Lock()
+        self.reserved = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.abandoned = 0
+        self.rejected = 0
+        self.waitLatency = Histogram()
+        self.runLatency = Histogram()
+
+    def GetExecutor(self) -> ThreadPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="upload")
+            return self.executor
+
+    def Reserve(self):
+        """Takes a queue slot for one job, or raises a 503 once the queue stays full for queueTimeout."""
+        if not self.admission.acquire(timeout=self.queueTimeout):
+            with self.lock:
+                self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many uploads in progress, please retry shortly.",
+                headers={"Retry-After": "5"},
+            )
+        with self.lock:
+            self.reserved += 1
+
+    def Release(self):
+        with self.lock:
+            self.reserved -= 1
+        self.admission.release()
+
+    def SubmitAfterCommit(self, db: Session, job: Callable[[int], None], onFailure: Callable[[Exception], None], onAbandon: Callable[[], None]):
+        """
+        Queues job when db commits, so a worker never looks for a row the request has not
+        committed yet. A rollback calls onAbandon instead. Needs a slot taken with Reserve().
+        """
+        handedOver = []
+
+        def AfterCommit(session):
+            if not handedOver:
+                handedOver.append(True)
+                self.Submit(job, onFailure)
+
+        def AfterRollback(session):
+            if not handedOver:
+                handedOver.append(True)
+                with self.lock:
+                    self.abandoned += 1
+                try:
+                    onAbandon()
+                finally:
+                    self.Release()
+
+        event.listen(db, "after_commit", AfterCommit, once=True)
+        event.listen(db, "after_rollback", AfterRollback, once=True)
+
+    def Submit(self, job: Callable[[int], None], onFailure: Callable[[Exception], None]):
+        queuedAt = time.perf_counter()
+        if self.workers == 0:
+            self.Execute(job, onFailure, queuedAt)
+            return
+        self.GetExecutor().submit(self.Execute, job, onFailure, queuedAt)
+
+    def Execute(self, job: Callable[[int], None], onFailure: Callable[[Exception], None], queuedAt: float):
+        start = time.perf_counter()
+        with self.lock:
+            self.running += 1
+            self.waitLatency.Observe((start - queuedAt) * 1000)
+        try:
+            for attempt in range(1, self.maxAttempts + 1):
+                try:
+                    job(attempt)
+                    with self.lock:
+                        self.completed += 1
+                    return
+                except Exception as error:
+                    if attempt == self.maxAttempts:
+                        with self.lock:
+                            self.failed += 1
+                        onFailure(error)
+                        return
+                    with self.lock:
+                        self.retried += 1
+                    time.sleep(self.retryDelay * 2 ** (attempt - 1))
+        except Exception:
+            # Nothing above the worker would report it
+            traceback.print_exc()
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.runLatency.Observe((time.perf_counter() - start) * 1000)
+            self.Release()
+
+    def Shutdown(self):
+        # Jobs that have not started stay Pending with their staged file; requeue_uploads.py picks them up
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def Snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.maxQueue,
+                "running": self.running,
+                "queued": max(0, self.reserved - self.running),
+                "completed": self.completed,
+                "failed": self.failed,
+                "retried": self.retried,
+                "abandoned": self.abandoned,
+                "rejected": self.rejected,
+                "wait_latency": self.waitLatency.Snapshot(),
+                "run_latency": self.runLatency.Snapshot(),
+            }
+
+
+uploadQueue = UploadQueue(UPLOAD_WORKERS, UPLOAD_MAX_QUEUE, UPLOAD_QUEUE_TIMEOUT, UPLOAD_MAX_ATTEMPTS, UPLOAD_RETRY_DELAY)
@@ -0,0 +1,40 @@
+from functools import lru_cache
+from typing import List, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+
+def NestedSchema(annotation) -> Optional[type]:
+    """The pydantic model inside Optional[X] / List[X] / X, if there is one."""
+    if get_origin(annotation) in (Union, list, List):
+        for argument in get_args(annotation):
+            nested = NestedSchema(argument)
+            if nested is not None:
+                return nested
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+@lru_cache(maxsize=None)
+def LoadProfile(model, schema) -> tuple:
+    """
+    Loader options that fetch exactly what `schema` serializes from `model`: its columns via
+    load_only, nested schemas via selectinload, and raiseload for every other relationship,
+    so serializing the response can never fall back to a lazy query.
+    """
+    mapper = inspect(model)
+    fields = schema.model_fields
+    options = [load_only(*[mapper.column_attrs[name].class_attribute for name in fields if name in mapper.column_attrs])]
+
+    for name, field in fields.items():
+        nested = NestedSchema(field.annotation)
+        if name in mapper.relationships and nested is not None:
+            relationship = mapper.relationships[name]
+            options.append(selectinload(relationship.class_attribute).options(*LoadProfile(relationship.mapper.class_, nested)))
+
+    options.append(raiseload("*"))
+    return tuple(options)
@@ -0,0 +1,136 @@
+import time
+from bisect import bisect_left
+from threading import Lock
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds of the histogram buckets, in milliseconds
+BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0
+        self.sumMs = 0.0
+        self.maxMs = 0.0
+
+    def Observe(self, valueMs: float):
+        self.counts[bisect_left(BUCKETS_MS, valueMs)] += 1
+        self.total += 1
+        self.sumMs += valueMs
+        self.maxMs = max(self.maxMs, valueMs)
+
+    def Snapshot(self) -> dict:
+        buckets = {f"le_{bound}ms": count for bound, count in zip(BUCKETS_MS, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.total,
+            "avg_ms": round(self.sumMs / self.total, 3) if self.total else 0.0,
+            "max_ms": round(self.maxMs, 3),
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """Collects connection pool usage from SQLAlchemy pool events."""
+
+    def __init__(self):
+        self.lock = Lock()
+        self.engine = None
+        self.waitTime = Histogram()
+        self.holdTime = Histogram()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.peakCheckedOut = 0
+
+    def Attach(self, engine):
+        self.engine = engine
+        pool = engine.pool
+        event.listen(pool, "connect", self.OnConnect)
+        event.listen(pool, "checkout", self.OnCheckout)
+        event.listen(pool, "checkin", self.OnCheckin)
+        event.listen(pool, "invalidate", self.OnInvalidate)
+        event.listen(pool, "soft_invalidate", self.OnInvalidate)
+
+    def OnConnect(self, dbapiConnection, connectionRecord):
+        with self.lock:
+            self.connects += 1
+
+    def OnCheckout(self, dbapiConnection, connectionRecord, connectionProxy):
+        connectionRecord.info["checked_out_at"] = time.perf_counter()
+        checkedOut = self.engine.pool.checkedout() if isinstance(self.engine.pool, QueuePool) else 0
+        with self.lock:
+            self.checkouts += 1
+            self.peakCheckedOut = max(self.peakCheckedOut, checkedOut)
+
+    def OnCheckin(self, dbapiConnection, connectionRecord):
+        checkedOutAt = connectionRecord.info.pop("checked_out_at", None)
+        with self.lock:
+            self.checkins += 1
+            if checkedOutAt is not None:
+                self.holdTime.Observe((time.perf_counter() - checkedOutAt) * 1000)
+
+    def OnInvalidate(self, dbapiConnection, connectionRecord, exception):
+        with self.lock:
+            self.invalidations += 1
+
+    def RecordWait(self, seconds: float, timedOut: bool = False):
+        with self.lock:
+            self.waitTime.Observe(seconds * 1000)
+            if timedOut:
+                self.timeouts += 1
+
+    def Snapshot(self) -> dict:
+        pool = self.engine.pool
+        state = {"pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            state.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout_s": pool.timeout(),
+            })
+
+        with self.lock:
+            state.update({
+                "peak_checked_out": self.peakCheckedOut,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_time": self.waitTime.Snapshot(),
+                "hold_time": self.holdTime.Snapshot(),
+            })
+        return state
+
+
+poolMetrics = PoolMetrics()
+asyncPoolMetrics = PoolMetrics()
+
+
+def InstrumentedPoolClass(poolClass, metrics: PoolMetrics):
+    """
+    Pool class that also times how long callers wait for a connection.
+    The pool events only fire once a connection is handed out, so the wait is measured here.
+    """
+
+    class InstrumentedPool(poolClass):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except Exception:
+                metrics.RecordWait(time.perf_counter() - start, timedOut=True)
+                raise
+            metrics.RecordWait(time.perf_counter() - start)
+            return connection
+
+    InstrumentedPool.__name__ = InstrumentedPool.__qualname__ = "Instrumented" + poolClass.__name__
+    return InstrumentedPool
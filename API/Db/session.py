@@ -1,8 +1,51 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from Core.config import DATABASE_URL
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from Core.config import DATABASE_URL, ASYNC_DATABASE_URL, DATABASE_POOL_CONFIG, DATABASE_PRE_PING_STRATEGY
+from Db.pool_metrics import InstrumentedPoolClass, poolMetrics, asyncPoolMetrics
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+
+def EngineOptions(url, poolClass) -> dict:
+    options = {"pool_pre_ping": DATABASE_PRE_PING_STRATEGY == "pessimistic"}
+    if url.get_backend_name() != "sqlite":
+        options.update(DATABASE_POOL_CONFIG, poolclass=poolClass)
+    return options
+
+
+engine = create_engine(DATABASE_URL, **EngineOptions(DATABASE_URL, InstrumentedPoolClass(QueuePool, poolMetrics)))
+poolMetrics.Attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
+
+
+def PrewarmPool(count: int):
+    """Opens up to `count` connections and hands them back to the pool idle."""
+    if hasattr(engine.pool, "size"):
+        # Connections above pool_size are overflow and would be closed again on checkin
+        count = min(count, engine.pool.size())
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+# The async engine is created on first use so the async driver is only needed
+# when an async endpoint is actually hit.
+asyncEngine = None
+AsyncSessionLocal = None
+
+def GetAsyncSessionLocal():
+    global asyncEngine, AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        asyncEngine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            **EngineOptions(ASYNC_DATABASE_URL, InstrumentedPoolClass(AsyncAdaptedQueuePool, asyncPoolMetrics))
+        )
+        asyncPoolMetrics.Attach(asyncEngine.sync_engine)
+        AsyncSessionLocal = async_sessionmaker(asyncEngine, autoflush=False, expire_on_commit=False)
+    return AsyncSessionLocal
@@ -1,21 +1,35 @@
-from passlib.context import CryptContext
+import hashlib
+import hmac
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+from cachetools import TLRUCache, TTLCache
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status, Security
 from fastapi.security.api_key import APIKeyHeader
 
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select, event
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.ext.asyncio import AsyncSession
 from Models.User import User
-from Dependencies.db import GetDb
-
-PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from Dependencies.db import GetDb, GetAsyncDb
+from Core.password_pool import passwordPool, HashInWorker, VerifyInWorker
+from Core.config import TOKEN_CACHE_SIZE, USER_CACHE_SIZE, USER_CACHE_TTL, INTERNAL_API_TOKEN
 
 def HashPassword(password: str) -> str:
-    return PWD_CONTEXT.hash(password)
+    return passwordPool.Run(HashInWorker, password)
 
 def VerifyPassword(plainPassword: str, hashedPassword: str) -> bool:
-    return PWD_CONTEXT.verify(plainPassword, hashedPassword)
+    return passwordPool.Run(VerifyInWorker, plainPassword, hashedPassword)
+
+async def HashPasswordAsync(password: str) -> str:
+    return await passwordPool.RunAsync(HashInWorker, password)
+
+async def VerifyPasswordAsync(plainPassword: str, hashedPassword: str) -> bool:
+    return await passwordPool.RunAsync(VerifyInWorker, plainPassword, hashedPassword)
 
 # JWT Configuration
 SECRET_KEY = "MY_SECRET_KEY"
@@ -29,20 +43,58 @@ def CreateAccessToken(data: dict, expiresDelta: timedelta = None):
     return jwt.encode(toEncode, SECRET_KEY, algorithm=ALGORITHM)
 
 api_key_header = APIKeyHeader(name="Authorization", auto_error=False)
+internal_token_header = APIKeyHeader(name="X-Internal-Token", auto_error=False)
+
+def RequireInternalToken(token: Optional[str] = Security(internal_token_header)):
+    """Guards the /internal/* operational endpoints, which are off unless INTERNAL_API_TOKEN is set."""
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not token or not hmac.compare_digest(token.encode(), INTERNAL_API_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal token.")
 
-def GetCurrentUser(token: str = Security(api_key_header), db: Session = Depends(GetDb)) -> User:
-    credentialsException = HTTPException(
+def CredentialsException() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials.",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+# sha256(token) -> (userId, exp). An entry expires together with the token it came from.
+tokenCache = TLRUCache(maxsize=TOKEN_CACHE_SIZE, ttu=lambda key, value, now: value[1], timer=time.time)
+# userId -> Principal snapshot
+userCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+authCacheLock = Lock()
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Snapshot of the authenticated user for endpoints that do not need the ORM object."""
+    Id: str
+    Email: str
+    FirstName: str
+    LastName: str
+    Role: Optional[str]
+
+    @classmethod
+    def FromUser(cls, user: User) -> "Principal":
+        return cls(Id=user.Id, Email=user.Email, FirstName=user.FirstName, LastName=user.LastName, Role=user.Role)
+
+
+def GetTokenUserId(token: str) -> str:
+    credentialsException = CredentialsException()
+
     if not token:
         raise credentialsException  
 
     if token.startswith("Bearer "):
         token = token.split(" ", 1)[1]
 
+    tokenHash = hashlib.sha256(token.encode()).hexdigest()
+    with authCacheLock:
+        cached = tokenCache.get(tokenHash)
+    if cached is not None:
+        return cached[0]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         userId: str = payload.get("sub")
@@ -51,8 +103,72 @@ def GetCurrentUser(token: str = Security(api_key_header), db: Session = Depends(
     except JWTError:
         raise credentialsException
 
+    if payload.get("exp") is not None:
+        with authCacheLock:
+            tokenCache[tokenHash] = (userId, payload["exp"])
+
+    return userId
+
+def GetCachedPrincipal(userId: str) -> Optional[Principal]:
+    with authCacheLock:
+        return userCache.get(userId)
+
+def CachePrincipal(user: User) -> Principal:
+    principal = Principal.FromUser(user)
+    with authCacheLock:
+        userCache[user.Id] = principal
+    return principal
+
+def InvalidateUser(userId: str):
+    with authCacheLock:
+        userCache.pop(str(userId), None)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def EvictUserAfterWrite(mapper, connection, target: User):
+    # Evict now and again after commit, so a concurrent request cannot re-cache the old row.
+    InvalidateUser(target.Id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("evictedUsers", set()).add(target.Id)
+
+@event.listens_for(Session, "after_commit")
+def EvictUsersAfterCommit(session):
+    for userId in session.info.pop("evictedUsers", ()):
+        InvalidateUser(userId)
+
+def GetCurrentUser(token: str = Security(api_key_header), db: Session = Depends(GetDb, scope="function")) -> User:
+    userId = GetTokenUserId(token)
+
     user = db.query(User).filter(User.Id == userId).first()
     if user is None:
-        raise credentialsException
+        raise CredentialsException()
+
+    CachePrincipal(user)
+    return user
+
+def GetCurrentPrincipal(token: str = Security(api_key_header), db: Session = Depends(GetDb, scope="function")) -> Principal:
+    userId = GetTokenUserId(token)
+
+    principal = GetCachedPrincipal(userId)
+    if principal is not None:
+        return principal
+
+    user = db.query(User).filter(User.Id == userId).first()
+    if user is None:
+        raise CredentialsException()
+
+    return CachePrincipal(user)
+
+async def GetCurrentPrincipalAsync(token: str = Security(api_key_header), db: AsyncSession = Depends(GetAsyncDb, scope="function")) -> Principal:
+    userId = GetTokenUserId(token)
+
+    principal = GetCachedPrincipal(userId)
+    if principal is not None:
+        return principal
+
+    user = await db.scalar(select(User).where(User.Id == userId))
+    if user is None:
+        raise CredentialsException()
 
-    return user
\ No newline at end of file
+    return CachePrincipal(user)
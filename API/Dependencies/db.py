@@ -1,8 +1,28 @@
-from Db.session import SessionLocal
+from Db.session import SessionLocal, GetAsyncSessionLocal
 
 def GetDb():
+    """
+    One session and one transaction per request. Repositories and services only flush;
+    the request commits here once on success and rolls back on any error.
+    Declare it as Depends(GetDb, scope="function") so the commit runs before the response
+    is sent: a failed commit then reaches the client as an error, not as a 2xx.
+    """
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+async def GetAsyncDb():
+    """Async counterpart of GetDb for `async def` endpoints, with the same commit/rollback rules."""
+    async with GetAsyncSessionLocal()() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
@@ -0,0 +1,56 @@
+import importlib
+import pkgutil
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from Core.config import DATABASE_URL
+from Db.session import Base
+import Models
+
+# Register every model module on Base.metadata, not only the ones Models/__init__ re-exports
+for module in pkgutil.iter_modules(Models.__path__):
+    importlib.import_module(f"Models.{module.name}")
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+targetMetadata = Base.metadata
+
+
+def GetUrl():
+    return config.attributes.get("url") or DATABASE_URL
+
+
+def RunMigrationsOffline():
+    context.configure(
+        url=GetUrl(),
+        target_metadata=targetMetadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def RunMigrationsOnline():
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=targetMetadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    engine = create_engine(GetUrl(), poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=targetMetadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    RunMigrationsOffline()
+else:
+    RunMigrationsOnline()
@@ -0,0 +1,387 @@
+"""baseline schema
+
+The tables as main.init_db created them before migrations existed. Databases that
+were created that way should be stamped instead of upgraded: `alembic stamp 0001`.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 20:23:38.727484
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # User and Attachment reference each other. SQLite cannot add a foreign key to an
+    # existing table, so there the key is declared inline; elsewhere it is added below.
+    isSqlite = op.get_bind().dialect.name == "sqlite"
+    profilePictureKey = [sa.ForeignKeyConstraint(['ProfilePictureId'], ['Attachment.Id'], name='FK_User_ProfilePictureId')] if isSqlite else []
+
+    op.create_table('User',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('FirstName', sa.String(length=50), nullable=False),
+    sa.Column('LastName', sa.String(length=50), nullable=False),
+    sa.Column('Email', sa.String(length=100), nullable=False),
+    sa.Column('Password', sa.String(length=255), nullable=False),
+    sa.Column('Role', sa.String(length=50), nullable=True),
+    sa.Column('JobTitle', sa.String(length=100), nullable=True),
+    sa.Column('ProfilePictureId', sa.String(length=36), nullable=True),
+    sa.Column('LastLogin', sa.DateTime(), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('UpdatedAt', sa.DateTime(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('Id'),
+    sa.UniqueConstraint('Email'),
+    *profilePictureKey
+    )
+    op.create_table('Project',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('Name', sa.String(length=100), nullable=False),
+    sa.Column('Description', sa.Text(), nullable=True),
+    sa.Column('Deadline', sa.DateTime(), nullable=True),
+    sa.Column('Progress', sa.Integer(), nullable=True),
+    sa.Column('TotalBudget', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('RemainingBudget', sa.Numeric(precision=12, scale=2), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('UpdatedAt', sa.DateTime(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.Column('OwnerId', sa.String(length=36), nullable=False),
+    sa.ForeignKeyConstraint(['OwnerId'], ['User.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('Attachment',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=True),
+    sa.Column('EntityType', sa.Enum('SCOPE', 'RISK', 'RESOURCE', 'SCHEDULE', 'COST', 'USER', name='attachmententitytype'), nullable=False),
+    sa.Column('EntityId', sa.String(length=36), nullable=True),
+    sa.Column('FileName', sa.String(length=255), nullable=False),
+    sa.Column('FileType', sa.String(length=50), nullable=True),
+    sa.Column('FileSize', sa.Integer(), nullable=True),
+    sa.Column('FilePath', sa.String(length=500), nullable=False),
+    sa.Column('OwnerId', sa.String(length=36), nullable=False),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.Column('UploadedAt', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['OwnerId'], ['User.Id'], ),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    if not isSqlite:
+        op.create_foreign_key("FK_User_ProfilePictureId", "User", "Attachment", ["ProfilePictureId"], ["Id"])
+    op.create_table('ProjectScopeStatement',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ScopeDescription', sa.Text(), nullable=True),
+    sa.Column('Deliverables', sa.Text(), nullable=True),
+    sa.Column('AcceptanceCriteria', sa.Text(), nullable=True),
+    sa.Column('Exclusions', sa.Text(), nullable=True),
+    sa.Column('Assumptions', sa.Text(), nullable=True),
+    sa.Column('Constraints', sa.Text(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.Column('IncludesSOW', sa.Boolean(), nullable=True),
+    sa.Column('StatementOfWork', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('RequirementDocument',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('StakeholderNeeds', sa.Text(), nullable=True),
+    sa.Column('RequirementTraceability', sa.Text(), nullable=True),
+    sa.Column('RequirementAcceptanceCriteria', sa.Text(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('ScopeManagementPlan',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ScopePreparation', sa.Text(), nullable=True),
+    sa.Column('WBSDevelopmentApproach', sa.Text(), nullable=True),
+    sa.Column('ScopeBaselineApproval', sa.Text(), nullable=True),
+    sa.Column('DeliverableImpact', sa.Text(), nullable=True),
+    sa.Column('ReqPlanningApproach', sa.Text(), nullable=True),
+    sa.Column('ReqChangeControl', sa.Text(), nullable=True),
+    sa.Column('ReqPrioritization', sa.Text(), nullable=True),
+    sa.Column('ReqMetrics', sa.Text(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('WorkBreakdownStructure',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('WorkPackageName', sa.String(length=255), nullable=True),
+    sa.Column('WorkDescription', sa.Text(), nullable=True),
+    sa.Column('EstimatedDuration', sa.Integer(), nullable=True),
+    sa.Column('EstimatedCost', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('AdminSetting',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('SettingKey', sa.String(length=100), nullable=False),
+    sa.Column('SettingValue', sa.Text(), nullable=True),
+    sa.Column('Category', sa.String(length=50), nullable=False),
+    sa.Column('Description', sa.Text(), nullable=True),
+    sa.Column('IsEncrypted', sa.Boolean(), nullable=True),
+    sa.Column('DataType', sa.Enum('string', 'number', 'boolean', 'json', 'date', name='datatypeenum'), nullable=True),
+    sa.Column('ValidationRegex', sa.String(length=255), nullable=True),
+    sa.Column('DefaultValue', sa.Text(), nullable=True),
+    sa.Column('LastUpdated', sa.DateTime(), nullable=True),
+    sa.Column('UpdatedBy', sa.String(length=36), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['UpdatedBy'], ['User.Id'], ),
+    sa.PrimaryKeyConstraint('Id'),
+    sa.UniqueConstraint('SettingKey')
+    )
+    op.create_table('AuditLog',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('UserId', sa.String(length=36), nullable=True),
+    sa.Column('ActionType', sa.String(length=50), nullable=False),
+    sa.Column('EntityType', sa.String(length=50), nullable=False),
+    sa.Column('EntityId', sa.String(length=36), nullable=True),
+    sa.Column('ActionTime', sa.DateTime(), nullable=True),
+    sa.Column('IpAddress', sa.String(length=45), nullable=True),
+    sa.Column('UserAgent', sa.Text(), nullable=True),
+    sa.Column('RequestMethod', sa.String(length=10), nullable=True),
+    sa.Column('RequestPath', sa.String(length=255), nullable=True),
+    sa.Column('ChangesMade', sa.Text(), nullable=True),
+    sa.Column('StatusCode', sa.Integer(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['UserId'], ['User.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('Notification',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('UserId', sa.String(length=36), nullable=False),
+    sa.Column('Type', sa.String(length=50), nullable=False),
+    sa.Column('Message', sa.Text(), nullable=False),
+    sa.Column('RelatedEntityId', sa.String(length=36), nullable=True),
+    sa.Column('RelatedEntityType', sa.String(length=50), nullable=True),
+    sa.Column('IsRead', sa.Boolean(), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['UserId'], ['User.Id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('ProjectMember',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('UserId', sa.String(length=36), nullable=False),
+    sa.Column('Role', sa.String(length=50), nullable=True),
+    sa.Column('JoinedAt', sa.DateTime(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['UserId'], ['User.Id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('ProjectScope',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('ScopeManagementPlanId', sa.String(length=36), nullable=True),
+    sa.Column('RequirementDocumentId', sa.String(length=36), nullable=True),
+    sa.Column('ScopeStatementId', sa.String(length=36), nullable=True),
+    sa.Column('WBSId', sa.String(length=36), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('UpdatedAt', sa.DateTime(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ),
+    sa.ForeignKeyConstraint(['RequirementDocumentId'], ['RequirementDocument.Id'], ),
+    sa.ForeignKeyConstraint(['ScopeManagementPlanId'], ['ScopeManagementPlan.Id'], ),
+    sa.ForeignKeyConstraint(['ScopeStatementId'], ['ProjectScopeStatement.Id'], ),
+    sa.ForeignKeyConstraint(['WBSId'], ['WorkBreakdownStructure.Id'], ),
+    sa.PrimaryKeyConstraint('Id'),
+    sa.UniqueConstraint('RequirementDocumentId'),
+    sa.UniqueConstraint('ScopeManagementPlanId'),
+    sa.UniqueConstraint('ScopeStatementId'),
+    sa.UniqueConstraint('WBSId')
+    )
+    op.create_table('ProjectStakeholder',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('UserId', sa.String(length=36), nullable=False),
+    sa.Column('Percentage', sa.Float(), nullable=False),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('UpdatedAt', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['UserId'], ['User.Id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('Resource',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('Name', sa.String(length=50), nullable=False),
+    sa.Column('Type', sa.String(length=50), nullable=False),
+    sa.Column('Total', sa.Float(), nullable=True),
+    sa.Column('Available', sa.Float(), nullable=True),
+    sa.Column('Description', sa.Text(), nullable=True),
+    sa.Column('Unit', sa.String(length=36), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('ResourcePlan',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('OwnerId', sa.String(length=36), nullable=False),
+    sa.Column('Notes', sa.Text(), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['OwnerId'], ['User.Id'], ),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('Risks',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('Name', sa.String(length=256), nullable=False),
+    sa.Column('Description', sa.Text(), nullable=True),
+    sa.Column('Category', sa.String(length=50), nullable=False),
+    sa.Column('Probability', sa.Float(), nullable=False),
+    sa.Column('Impact', sa.Integer(), nullable=True),
+    sa.Column('Severity', sa.Float(), nullable=False),
+    sa.Column('OwnerId', sa.String(length=36), nullable=False),
+    sa.Column('IdentifiedDate', sa.DateTime(), nullable=True),
+    sa.Column('Status', sa.String(length=50), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.CheckConstraint('Impact >= 1 AND Impact <= 10', name='check_impact_range'),
+    sa.CheckConstraint('Probability >= 0.0 AND Probability <= 1.0', name='check_probability_range'),
+    sa.ForeignKeyConstraint(['OwnerId'], ['User.Id'], ),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('Team',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('Name', sa.String(length=100), nullable=False),
+    sa.Column('Description', sa.Text(), nullable=True),
+    sa.Column('ColorIndex', sa.Integer(), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('UpdatedAt', sa.DateTime(), nullable=True),
+    sa.Column('CreatedBy', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['CreatedBy'], ['User.Id'], ),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('WorkPackage',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('Name', sa.String(length=255), nullable=False),
+    sa.Column('Description', sa.String(length=500), nullable=True),
+    sa.Column('EstimatedDuration', sa.Integer(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.Column('WBSId', sa.String(length=36), nullable=False),
+    sa.ForeignKeyConstraint(['WBSId'], ['WorkBreakdownStructure.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('RiskAnalyses',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('RiskId', sa.String(length=36), nullable=False),
+    sa.Column('AnalysisType', sa.String(length=50), nullable=False),
+    sa.Column('MatrixScore', sa.String(length=50), nullable=False),
+    sa.Column('ExpectedValue', sa.Float(), nullable=False),
+    sa.Column('AnalysisDate', sa.DateTime(), nullable=True),
+    sa.Column('OwnerId', sa.String(length=36), nullable=False),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['OwnerId'], ['User.Id'], ),
+    sa.ForeignKeyConstraint(['RiskId'], ['Risks.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('RiskResponsePlans',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('RiskId', sa.String(length=36), nullable=False),
+    sa.Column('Strategy', sa.String(length=256), nullable=True),
+    sa.Column('Description', sa.Text(), nullable=True),
+    sa.Column('OwnerId', sa.String(length=36), nullable=False),
+    sa.Column('PlannedActions', sa.Text(), nullable=False),
+    sa.Column('Status', sa.String(length=50), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['OwnerId'], ['User.Id'], ),
+    sa.ForeignKeyConstraint(['RiskId'], ['Risks.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('Task',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('TeamId', sa.String(length=36), nullable=True),
+    sa.Column('UserId', sa.String(length=36), nullable=True),
+    sa.Column('CreatedBy', sa.String(length=36), nullable=False),
+    sa.Column('Title', sa.String(length=100), nullable=False),
+    sa.Column('Description', sa.Text(), nullable=True),
+    sa.Column('Cost', sa.Float(), nullable=True),
+    sa.Column('Status', sa.String(length=50), nullable=False),
+    sa.Column('StatusColorHex', sa.String(length=7), nullable=True),
+    sa.Column('Priority', sa.String(length=50), nullable=False),
+    sa.Column('PriorityColorHex', sa.String(length=7), nullable=True),
+    sa.Column('ParentTaskId', sa.String(length=36), nullable=True),
+    sa.Column('Deadline', sa.DateTime(), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=True),
+    sa.Column('UpdatedAt', sa.DateTime(), nullable=True),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.Column('Completed', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['CreatedBy'], ['User.Id'], ),
+    sa.ForeignKeyConstraint(['ParentTaskId'], ['Task.Id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['TeamId'], ['Team.Id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['UserId'], ['User.Id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_table('TeamMember',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('TeamId', sa.String(length=36), nullable=False),
+    sa.Column('UserId', sa.String(length=36), nullable=False),
+    sa.Column('Role', sa.String(length=50), nullable=True),
+    sa.Column('IsLeader', sa.Boolean(), nullable=True),
+    sa.Column('JoinedDate', sa.DateTime(), nullable=True),
+    sa.Column('IsActive', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['TeamId'], ['Team.Id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['UserId'], ['User.Id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('Id'),
+    sqlite_autoincrement=True
+    )
+    op.create_table('ActivityResource',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('TaskId', sa.String(length=36), nullable=False),
+    sa.Column('ResourceId', sa.String(length=36), nullable=False),
+    sa.Column('Quantity', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('EstimatedCost', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('IsDeleted', sa.Boolean(), nullable=True),
+    sa.Column('AssignedAt', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['ResourceId'], ['Resource.Id'], ),
+    sa.ForeignKeyConstraint(['TaskId'], ['Task.Id'], ),
+    sa.PrimaryKeyConstraint('Id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint("FK_User_ProfilePictureId", "User", type_="foreignkey")
+    op.drop_table('ActivityResource')
+    op.drop_table('TeamMember')
+    op.drop_table('Task')
+    op.drop_table('RiskResponsePlans')
+    op.drop_table('RiskAnalyses')
+    op.drop_table('WorkPackage')
+    op.drop_table('Team')
+    op.drop_table('Risks')
+    op.drop_table('ResourcePlan')
+    op.drop_table('Resource')
+    op.drop_table('ProjectStakeholder')
+    op.drop_table('ProjectScope')
+    op.drop_table('ProjectMember')
+    op.drop_table('Notification')
+    op.drop_table('AuditLog')
+    op.drop_table('AdminSetting')
+    op.drop_table('WorkBreakdownStructure')
+    op.drop_table('ScopeManagementPlan')
+    op.drop_table('RequirementDocument')
+    op.drop_table('ProjectScopeStatement')
+    op.drop_table('Attachment')
+    op.drop_table('Project')
+    op.drop_table('User')
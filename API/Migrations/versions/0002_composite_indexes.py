@@ -0,0 +1,67 @@
+"""composite indexes
+
+Secondary indexes for the soft-delete filtered lookups and the (CreatedAt, Id) keyset
+pagination used by the list endpoints.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 20:24:17.905949
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('IX_ActivityResource_ResourceId_IsDeleted', 'ActivityResource', ['ResourceId', 'IsDeleted'], unique=False)
+    op.create_index('IX_ActivityResource_TaskId_IsDeleted', 'ActivityResource', ['TaskId', 'IsDeleted'], unique=False)
+    op.create_index('IX_Attachment_ProjectId_Entity_IsDeleted_UploadedAt', 'Attachment', ['ProjectId', 'EntityType', 'EntityId', 'IsDeleted', 'UploadedAt'], unique=False)
+    op.create_index('IX_ProjectMember_ProjectId_UserId_IsDeleted', 'ProjectMember', ['ProjectId', 'UserId', 'IsDeleted'], unique=False)
+    op.create_index('IX_ProjectMember_UserId_IsDeleted', 'ProjectMember', ['UserId', 'IsDeleted'], unique=False)
+    op.create_index('IX_Resource_ProjectId_IsDeleted_CreatedAt_Id', 'Resource', ['ProjectId', 'IsDeleted', 'CreatedAt', 'Id'], unique=False)
+    op.create_index('IX_ResourcePlan_ProjectId_IsDeleted', 'ResourcePlan', ['ProjectId', 'IsDeleted'], unique=False)
+    op.create_index('IX_RiskAnalyses_RiskId_IsDeleted', 'RiskAnalyses', ['RiskId', 'IsDeleted'], unique=False)
+    op.create_index('IX_RiskResponsePlans_RiskId_IsDeleted', 'RiskResponsePlans', ['RiskId', 'IsDeleted'], unique=False)
+    op.create_index('IX_Risks_ProjectId_IsDeleted_IdentifiedDate_Id', 'Risks', ['ProjectId', 'IsDeleted', 'IdentifiedDate', 'Id'], unique=False)
+    op.create_index('IX_Task_CreatedBy_IsDeleted_CreatedAt_Id', 'Task', ['CreatedBy', 'IsDeleted', 'CreatedAt', 'Id'], unique=False)
+    op.create_index('IX_Task_IsDeleted_CreatedAt_Id', 'Task', ['IsDeleted', 'CreatedAt', 'Id'], unique=False)
+    op.create_index('IX_Task_ParentTaskId_IsDeleted', 'Task', ['ParentTaskId', 'IsDeleted'], unique=False)
+    op.create_index('IX_Task_ProjectId_IsDeleted_CreatedAt_Id', 'Task', ['ProjectId', 'IsDeleted', 'CreatedAt', 'Id'], unique=False)
+    op.create_index('IX_Task_TeamId_IsDeleted', 'Task', ['TeamId', 'IsDeleted'], unique=False)
+    op.create_index('IX_Task_UserId_IsDeleted_CreatedAt_Id', 'Task', ['UserId', 'IsDeleted', 'CreatedAt', 'Id'], unique=False)
+    op.create_index('IX_Team_ProjectId_IsDeleted_CreatedAt_Id', 'Team', ['ProjectId', 'IsDeleted', 'CreatedAt', 'Id'], unique=False)
+    op.create_index('IX_TeamMember_TeamId_UserId_IsActive', 'TeamMember', ['TeamId', 'UserId', 'IsActive'], unique=False)
+    op.create_index('IX_TeamMember_UserId_IsActive', 'TeamMember', ['UserId', 'IsActive'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('IX_TeamMember_UserId_IsActive', table_name='TeamMember')
+    op.drop_index('IX_TeamMember_TeamId_UserId_IsActive', table_name='TeamMember')
+    op.drop_index('IX_Team_ProjectId_IsDeleted_CreatedAt_Id', table_name='Team')
+    op.drop_index('IX_Task_UserId_IsDeleted_CreatedAt_Id', table_name='Task')
+    op.drop_index('IX_Task_TeamId_IsDeleted', table_name='Task')
+    op.drop_index('IX_Task_ProjectId_IsDeleted_CreatedAt_Id', table_name='Task')
+    op.drop_index('IX_Task_ParentTaskId_IsDeleted', table_name='Task')
+    op.drop_index('IX_Task_IsDeleted_CreatedAt_Id', table_name='Task')
+    op.drop_index('IX_Task_CreatedBy_IsDeleted_CreatedAt_Id', table_name='Task')
+    op.drop_index('IX_Risks_ProjectId_IsDeleted_IdentifiedDate_Id', table_name='Risks')
+    op.drop_index('IX_RiskResponsePlans_RiskId_IsDeleted', table_name='RiskResponsePlans')
+    op.drop_index('IX_RiskAnalyses_RiskId_IsDeleted', table_name='RiskAnalyses')
+    op.drop_index('IX_ResourcePlan_ProjectId_IsDeleted', table_name='ResourcePlan')
+    op.drop_index('IX_Resource_ProjectId_IsDeleted_CreatedAt_Id', table_name='Resource')
+    op.drop_index('IX_ProjectMember_UserId_IsDeleted', table_name='ProjectMember')
+    op.drop_index('IX_ProjectMember_ProjectId_UserId_IsDeleted', table_name='ProjectMember')
+    op.drop_index('IX_Attachment_ProjectId_Entity_IsDeleted_UploadedAt', table_name='Attachment')
+    op.drop_index('IX_ActivityResource_TaskId_IsDeleted', table_name='ActivityResource')
+    op.drop_index('IX_ActivityResource_ResourceId_IsDeleted', table_name='ActivityResource')
@@ -0,0 +1,80 @@
+"""progress counters
+
+Completed/total task counters behind Project.Progress and the per-task subtree counters.
+Existing rows are backfilled from their live tasks, the same way RecomputeProgressCounters counts them.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 20:38:19.540226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('Project', sa.Column('TaskTotal', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('Project', sa.Column('TaskCompleted', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('Task', sa.Column('SubtaskTotal', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('Task', sa.Column('SubtaskCompleted', sa.Integer(), server_default='0', nullable=False))
+
+    project = sa.table('Project', sa.column('Id'), sa.column('Progress'), sa.column('TaskTotal'), sa.column('TaskCompleted'))
+    task = sa.table('Task', sa.column('Id'), sa.column('ProjectId'), sa.column('ParentTaskId'),
+                    sa.column('Completed'), sa.column('IsDeleted'), sa.column('SubtaskTotal'), sa.column('SubtaskCompleted'))
+    bind = op.get_bind()
+
+    liveTasks = sa.select(sa.func.count()).select_from(task).where(task.c.ProjectId == project.c.Id, task.c.IsDeleted == sa.false())
+    bind.execute(project.update().values(
+        TaskTotal=liveTasks.scalar_subquery(),
+        TaskCompleted=liveTasks.where(task.c.Completed == sa.true()).scalar_subquery()
+    ))
+    # A separate statement, because MySQL and SQLite disagree on whether SET sees the new counters
+    bind.execute(project.update().values(
+        Progress=sa.case((project.c.TaskTotal > 0, (project.c.TaskCompleted * 100) // project.c.TaskTotal), else_=0)
+    ))
+
+    # Every (ancestor, live task) pair; deleted ancestors are walked through but not counted
+    chain = sa.select(task.c.ParentTaskId.label('AncestorId'), task.c.Id.label('TaskId'), task.c.Completed).where(
+        task.c.ParentTaskId.is_not(None), task.c.IsDeleted == sa.false()
+    ).cte('TaskChain', recursive=True)
+    parent = task.alias('Parent')
+    chain = chain.union(
+        sa.select(parent.c.ParentTaskId, chain.c.TaskId, chain.c.Completed).where(
+            parent.c.Id == chain.c.AncestorId, parent.c.ParentTaskId.is_not(None)
+        )
+    )
+    ancestor = task.alias('Ancestor')
+    subtrees = [
+        {"TaskId": ancestorId, "Total": total, "Done": done}
+        for ancestorId, total, done in bind.execute(
+            sa.select(chain.c.AncestorId, sa.func.count(), sa.func.sum(sa.case((chain.c.Completed == sa.true(), 1), else_=0)))
+            .join(ancestor, ancestor.c.Id == chain.c.AncestorId)
+            .where(ancestor.c.IsDeleted == sa.false())
+            .group_by(chain.c.AncestorId)
+        )
+    ]
+    if subtrees:
+        bind.execute(
+            task.update().where(task.c.Id == sa.bindparam('TaskId')).values(
+                SubtaskTotal=sa.bindparam('Total'), SubtaskCompleted=sa.bindparam('Done')
+            ),
+            subtrees
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('Task', 'SubtaskCompleted')
+    op.drop_column('Task', 'SubtaskTotal')
+    op.drop_column('Project', 'TaskCompleted')
+    op.drop_column('Project', 'TaskTotal')
@@ -0,0 +1,57 @@
+"""budget ledger
+
+Append-only BudgetLedger behind Project.RemainingBudget. Every existing project gets an
+Opening entry equal to its current remaining budget, so balances and ledgers agree from the start.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 20:41:27.875669
+
+"""
+from typing import Sequence, Union
+
+import uuid
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ledger = op.create_table('BudgetLedger',
+    sa.Column('Id', sa.String(length=36), nullable=False),
+    sa.Column('ProjectId', sa.String(length=36), nullable=False),
+    sa.Column('Amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('Reason', sa.String(length=50), nullable=False),
+    sa.Column('ReferenceId', sa.String(length=36), nullable=True),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['ProjectId'], ['Project.Id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('Id')
+    )
+    op.create_index('IX_BudgetLedger_ProjectId_CreatedAt', 'BudgetLedger', ['ProjectId', 'CreatedAt'], unique=False)
+
+    project = sa.table('Project', sa.column('Id'), sa.column('TotalBudget'), sa.column('RemainingBudget'))
+    now = datetime.now()
+    openings = [
+        {"Id": str(uuid.uuid4()), "ProjectId": projectId, "Amount": remaining if remaining is not None else total,
+         "Reason": "Opening", "ReferenceId": None, "CreatedAt": now}
+        for projectId, total, remaining in op.get_bind().execute(
+            sa.select(project.c.Id, project.c.TotalBudget, project.c.RemainingBudget)
+        )
+    ]
+    if openings:
+        op.bulk_insert(ledger, openings)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('IX_BudgetLedger_ProjectId_CreatedAt', table_name='BudgetLedger')
+    op.drop_table('BudgetLedger')
@@ -0,0 +1,31 @@
+"""attachment content hash
+
+SHA-256 of every uploaded file, computed while the upload streams to storage.
+Attachments stored before this revision keep a NULL hash.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 21:02:11.415093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('Attachment', sa.Column('ContentHash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('Attachment', 'ContentHash')
@@ -0,0 +1,36 @@
+"""attachment upload status
+
+Uploads are transferred to storage by background workers: Status tracks each one from
+Pending to Ready or Failed, with the number of attempts and the last error.
+Attachments stored before this revision are Ready.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 21:34:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('Attachment', sa.Column('Status', sa.Enum('PENDING', 'READY', 'FAILED', name='attachmentstatus'), server_default='READY', nullable=False))
+    op.add_column('Attachment', sa.Column('Attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('Attachment', sa.Column('Error', sa.String(length=500), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('Attachment', 'Error')
+    op.drop_column('Attachment', 'Attempts')
+    op.drop_column('Attachment', 'Status')
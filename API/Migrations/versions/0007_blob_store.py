@@ -0,0 +1,42 @@
+"""blob store
+
+Content-addressed, reference-counted copies of uploaded files. Attachments uploaded before
+this revision keep their own file and are not counted.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 22:05:37.642810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('Blob',
+    sa.Column('ContentHash', sa.String(length=64), nullable=False),
+    sa.Column('FilePath', sa.String(length=500), nullable=False),
+    sa.Column('Size', sa.Integer(), nullable=False),
+    sa.Column('RefCount', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('CreatedAt', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('ContentHash')
+    )
+    op.create_index('IX_Blob_RefCount', 'Blob', ['RefCount'], unique=False)
+    op.create_index('IX_Attachment_ContentHash', 'Attachment', ['ContentHash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('IX_Attachment_ContentHash', table_name='Attachment')
+    op.drop_index('IX_Blob_RefCount', table_name='Blob')
+    op.drop_table('Blob')
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Numeric, ForeignKey, Boolean, DateTime
+from sqlalchemy import Column, String, Numeric, ForeignKey, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -15,6 +15,11 @@ class ActivityResource(Base):
     IsDeleted = Column(Boolean, default=False)
     AssignedAt = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("IX_ActivityResource_TaskId_IsDeleted", "TaskId", "IsDeleted"),
+        Index("IX_ActivityResource_ResourceId_IsDeleted", "ResourceId", "IsDeleted"),
+    )
+
     # Relationships
     Task = relationship("Task", back_populates="AssignedResources")
     Resource = relationship("Resource", back_populates="ActivityAssignments")
@@ -24,7 +24,7 @@ class AdminSetting(Base):
     DataType = Column(Enum(DataTypeEnum), default=DataTypeEnum.string)
     ValidationRegex = Column(String(255))
     DefaultValue = Column(Text)
-    LastUpdated = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    LastUpdated = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     UpdatedBy = Column(String(36), ForeignKey("User.Id"), nullable=True)
 
     IsDeleted = Column(Boolean, default=False)
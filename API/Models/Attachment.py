@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Boolean, Enum as SqlEnum
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Boolean, Enum as SqlEnum, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 import enum
@@ -14,6 +14,11 @@ class AttachmentEntityType(str, enum.Enum):
     COST = "Cost"
     USER = "User"
 
+class AttachmentStatus(str, enum.Enum):
+    PENDING = "Pending"
+    READY = "Ready"
+    FAILED = "Failed"
+
 class Attachment(Base):
     __tablename__ = "Attachment"
 
@@ -24,11 +29,22 @@ class Attachment(Base):
     FileName = Column(String(255), nullable=False)
     FileType = Column(String(50))
     FileSize = Column(Integer)
+    # Empty until a Pending upload has been transferred to storage
     FilePath = Column(String(500), nullable=False)
+    # Hex SHA-256 of the stored bytes, computed while the upload streams through
+    ContentHash = Column(String(64))
+    Status = Column(SqlEnum(AttachmentStatus), nullable=False, default=AttachmentStatus.READY, server_default=AttachmentStatus.READY.name)
+    Attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    Error = Column(String(500))
     OwnerId = Column(String(36), ForeignKey("User.Id"), nullable=False)
     IsDeleted = Column(Boolean, default=False)
     UploadedAt = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("IX_Attachment_ProjectId_Entity_IsDeleted_UploadedAt", "ProjectId", "EntityType", "EntityId", "IsDeleted", "UploadedAt"),
+        Index("IX_Attachment_ContentHash", "ContentHash"),
+    )
+
     Project = relationship("Project", back_populates="Attachments")
     Owner = relationship(
         "User",
@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from Db.session import Base
+
+
+class Blob(Base):
+    """
+    One stored copy of some file content, keyed by its SHA-256. RefCount is the number of live,
+    Ready attachments whose FilePath points at it; collect_blobs.py removes blobs nobody references.
+    """
+    __tablename__ = "Blob"
+
+    ContentHash = Column(String(64), primary_key=True)
+    FilePath = Column(String(500), nullable=False)
+    Size = Column(Integer, nullable=False)
+    RefCount = Column(Integer, nullable=False, default=0, server_default="0")
+    CreatedAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("IX_Blob_RefCount", "RefCount"),
+    )
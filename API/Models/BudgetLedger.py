@@ -0,0 +1,28 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, Index
+from Db.session import Base
+
+
+class BudgetLedger(Base):
+    """Append-only record of every change to Project.RemainingBudget; the entries of a project sum to it."""
+    __tablename__ = "BudgetLedger"
+
+    Id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    ProjectId = Column(String(36), ForeignKey("Project.Id", ondelete="CASCADE"), nullable=False)
+    Amount = Column(Numeric(12, 2), nullable=False)
+    Reason = Column(String(50), nullable=False)
+    ReferenceId = Column(String(36))
+    CreatedAt = Column(DateTime, default=datetime.now, nullable=False)
+
+    __table_args__ = (
+        Index("IX_BudgetLedger_ProjectId_CreatedAt", "ProjectId", "CreatedAt"),
+    )
+
+    # Predefined reasons
+    REASON_OPENING = "Opening"
+    REASON_BUDGET_CHANGED = "BudgetChanged"
+    REASON_RESOURCE_ASSIGNED = "ResourceAssigned"
+    REASON_ASSIGNMENT_UPDATED = "AssignmentUpdated"
+    REASON_ASSIGNMENT_REMOVED = "AssignmentRemoved"
+    REASON_TASK_DELETED = "TaskDeleted"
@@ -16,7 +16,7 @@ class Notification(Base):
     RelatedEntityId = Column(String(36))
     RelatedEntityType = Column(String(50))
     IsRead = Column(Boolean, default=False)
-    CreatedAt = Column(DateTime, default=datetime.now())
+    CreatedAt = Column(DateTime, default=datetime.now)
 
     # Relationships
     User = relationship("User", back_populates="Notifications")
@@ -15,11 +15,14 @@ class Project(Base):
     Deadline = Column(DateTime)
 
     Progress = Column(Integer, default=0)
+    # Live task counters behind Progress, maintained by TaskRepository
+    TaskTotal = Column(Integer, default=0, server_default="0", nullable=False)
+    TaskCompleted = Column(Integer, default=0, server_default="0", nullable=False)
     TotalBudget = Column(Numeric(12, 2), default=0, nullable = False)
     RemainingBudget = Column(Numeric(12, 2), default=TotalBudget)
 
-    CreatedAt = Column(DateTime, default=datetime.now())
-    UpdatedAt = Column(DateTime, onupdate=datetime.now())
+    CreatedAt = Column(DateTime, default=datetime.now)
+    UpdatedAt = Column(DateTime, onupdate=datetime.now)
     IsDeleted = Column(Boolean, default=False)
     OwnerId = Column(String(36), ForeignKey("User.Id"), nullable=False)
 
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -11,9 +11,14 @@ class ProjectMember(Base):
     ProjectId = Column(String(36), ForeignKey("Project.Id", ondelete="CASCADE"), nullable=False)
     UserId = Column(String(36), ForeignKey("User.Id", ondelete="CASCADE"), nullable=False)
     Role = Column(String(50))
-    JoinedAt = Column(DateTime, default=datetime.now())
+    JoinedAt = Column(DateTime, default=datetime.now)
     IsDeleted = Column(Boolean, default=False)
 
+    __table_args__ = (
+        Index("IX_ProjectMember_ProjectId_UserId_IsDeleted", "ProjectId", "UserId", "IsDeleted"),
+        Index("IX_ProjectMember_UserId_IsDeleted", "UserId", "IsDeleted"),
+    )
+
     # Relationships
     Project = relationship("Project", back_populates="Members")
     User = relationship("User", back_populates="ProjectMemberships")
\ No newline at end of file
@@ -12,8 +12,8 @@ class ProjectStakeholder(Base):
     ProjectId = Column(String(36), ForeignKey("Project.Id", ondelete="CASCADE"), nullable=False)
     UserId = Column(String(36), ForeignKey("User.Id", ondelete="CASCADE"), nullable=False)
     Percentage = Column(Float, nullable=False, default=0)
-    CreatedAt = Column(DateTime, default=datetime.now())
-    UpdatedAt = Column(DateTime, onupdate=datetime.now())
+    CreatedAt = Column(DateTime, default=datetime.now)
+    UpdatedAt = Column(DateTime, onupdate=datetime.now)
 
     
     User = relationship("User", back_populates="ProjectStakes")
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Float, Text
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Float, Text, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -18,6 +18,10 @@ class Resource(Base):
     IsDeleted = Column(Boolean, default=False)
     CreatedAt = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("IX_Resource_ProjectId_IsDeleted_CreatedAt_Id", "ProjectId", "IsDeleted", "CreatedAt", "Id"),
+    )
+
     # Relationships
     ActivityAssignments = relationship("ActivityResource", back_populates="Resource", cascade="all, delete-orphan")
     Project = relationship("Project", back_populates="Resources")
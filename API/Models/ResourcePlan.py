@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -14,6 +14,10 @@ class ResourcePlan(Base):
     CreatedAt = Column(DateTime, default=datetime.utcnow)
     IsDeleted = Column(Boolean, default=False)
 
+    __table_args__ = (
+        Index("IX_ResourcePlan_ProjectId_IsDeleted", "ProjectId", "IsDeleted"),
+    )
+
     # Relationships
     Project = relationship("Project", back_populates="ResourcePlans")
     Owner = relationship("User")
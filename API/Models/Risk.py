@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Integer, Float, DateTime, Boolean, ForeignKey, CheckConstraint
+from sqlalchemy import Column, String, Text, Integer, Float, DateTime, Boolean, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -26,6 +26,7 @@ class Risk(Base):
     ResponsePlans = relationship("RiskResponsePlan", back_populates="Risk", cascade="all, delete-orphan")
 
     __table_args__ = (
+        Index("IX_Risks_ProjectId_IsDeleted_IdentifiedDate_Id", "ProjectId", "IsDeleted", "IdentifiedDate", "Id"),
         CheckConstraint("Probability >= 0.0 AND Probability <= 1.0", name="check_probability_range"),
         CheckConstraint("Impact >= 1 AND Impact <= 10", name="check_impact_range"),
     )
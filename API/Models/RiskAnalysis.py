@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -16,5 +16,9 @@ class RiskAnalysis(Base):
     OwnerId = Column(String(36), ForeignKey("User.Id"), nullable=False)
     IsDeleted = Column(Boolean, default=False)
 
+    __table_args__ = (
+        Index("IX_RiskAnalyses_RiskId_IsDeleted", "RiskId", "IsDeleted"),
+    )
+
 
     Risk = relationship("Risk", back_populates="Analyses")
\ No newline at end of file
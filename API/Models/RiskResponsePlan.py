@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -17,4 +17,8 @@ class RiskResponsePlan(Base):
     CreatedAt = Column(DateTime, default=datetime.utcnow)
     IsDeleted = Column(Boolean, default=False)
 
+    __table_args__ = (
+        Index("IX_RiskResponsePlans_RiskId_IsDeleted", "RiskId", "IsDeleted"),
+    )
+
     Risk = relationship("Risk", back_populates="ResponsePlans")
\ No newline at end of file
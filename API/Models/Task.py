@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Float
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Float, Index, Integer
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -24,10 +24,22 @@ class Task(Base):
     PriorityColorHex = Column(String(7))
     ParentTaskId = Column(String(36), ForeignKey("Task.Id", ondelete="CASCADE"), nullable=True)
     Deadline = Column(DateTime)
-    CreatedAt = Column(DateTime, default=datetime.now())
-    UpdatedAt = Column(DateTime, onupdate=datetime.now())
+    CreatedAt = Column(DateTime, default=datetime.now)
+    UpdatedAt = Column(DateTime, onupdate=datetime.now)
     IsDeleted = Column(Boolean, default=False)
     Completed = Column(Boolean, default=False)
+    # Live descendants (not counting the task itself), maintained by TaskRepository
+    SubtaskTotal = Column(Integer, default=0, server_default="0", nullable=False)
+    SubtaskCompleted = Column(Integer, default=0, server_default="0", nullable=False)
+
+    __table_args__ = (
+        Index("IX_Task_ProjectId_IsDeleted_CreatedAt_Id", "ProjectId", "IsDeleted", "CreatedAt", "Id"),
+        Index("IX_Task_ParentTaskId_IsDeleted", "ParentTaskId", "IsDeleted"),
+        Index("IX_Task_TeamId_IsDeleted", "TeamId", "IsDeleted"),
+        Index("IX_Task_UserId_IsDeleted_CreatedAt_Id", "UserId", "IsDeleted", "CreatedAt", "Id"),
+        Index("IX_Task_CreatedBy_IsDeleted_CreatedAt_Id", "CreatedBy", "IsDeleted", "CreatedAt", "Id"),
+        Index("IX_Task_IsDeleted_CreatedAt_Id", "IsDeleted", "CreatedAt", "Id"),
+    )
 
     # Relationships
     Project = relationship("Project", back_populates="Tasks")
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -12,12 +12,16 @@ class Team(Base):
     Name = Column(String(100), nullable=False)
     Description = Column(Text)
     ColorIndex = Column(Integer, default=0)
-    CreatedAt = Column(DateTime, default=datetime.now())
-    UpdatedAt = Column(DateTime, onupdate=datetime.now())
+    CreatedAt = Column(DateTime, default=datetime.now)
+    UpdatedAt = Column(DateTime, onupdate=datetime.now)
     CreatedBy = Column(String(36), ForeignKey("User.Id"), nullable=False)
     ProjectId = Column(String(36), ForeignKey("Project.Id"), nullable=False)
     IsDeleted = Column(Boolean, default=False)
 
+    __table_args__ = (
+        Index("IX_Team_ProjectId_IsDeleted_CreatedAt_Id", "ProjectId", "IsDeleted", "CreatedAt", "Id"),
+    )
+
     # Relationships
     Tasks = relationship("Task", back_populates="Team", overlaps="Team,TasksAssigned")
     Members = relationship(
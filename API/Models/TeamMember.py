@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from Db.session import Base
 
@@ -14,7 +14,7 @@ class TeamMember(Base):
     UserId = Column(String(36), ForeignKey("User.Id", ondelete="CASCADE"), nullable=False)
     Role = Column(String(50))
     IsLeader = Column(Boolean, default=False)
-    JoinedDate = Column(DateTime, default=datetime.now())
+    JoinedDate = Column(DateTime, default=datetime.now)
     IsActive = Column(Boolean, default=True)
 
     Team = relationship(
@@ -29,5 +29,7 @@ class TeamMember(Base):
     )
 
     __table_args__ = (
+        Index("IX_TeamMember_TeamId_UserId_IsActive", "TeamId", "UserId", "IsActive"),
+        Index("IX_TeamMember_UserId_IsActive", "UserId", "IsActive"),
         {"sqlite_autoincrement": True},
     )
@@ -14,7 +14,7 @@ class User(Base):
     Password = Column(String(255), nullable=False)
     Role = Column(String(50), default="User")
     JobTitle = Column(String(100))
-    ProfilePictureId = Column(String(36), ForeignKey("Attachment.Id"), nullable=True)
+    ProfilePictureId = Column(String(36), ForeignKey("Attachment.Id", name="FK_User_ProfilePictureId", use_alter=True), nullable=True)
     LastLogin = Column(DateTime, nullable=True)
     CreatedAt = Column(DateTime, default=datetime.now)
     UpdatedAt = Column(DateTime, onupdate=datetime.now)
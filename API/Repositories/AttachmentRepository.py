@@ -1,11 +1,18 @@
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
 
-from Models.Attachment import Attachment, AttachmentEntityType
-from Schemas.AttachmentSchema import AttachmentCreateSchema
-from typing import List, Optional
-import paramiko
+from Models.Attachment import Attachment, AttachmentEntityType, AttachmentStatus
+from Schemas.AttachmentSchema import AttachmentCreateSchema, AttachmentResponseSchema
+from typing import List, Optional, Tuple
+from Core.pagination import PageParams, Page, FetchPage
+from Core.config import UPLOAD_STAGING_DIR
+from Core.signed_urls import SignDownloadUrl
+from Db.loading import LoadProfile
+from Repositories.BlobRepository import BlobName, AcquireBlob, RegisterBlob, ReleaseBlob
+from Storage import GetStorage, CopyInChunks
 import os
+import uuid
 
 
 def AddAttachment(db: Session, attachmentData: AttachmentCreateSchema) -> Attachment:
@@ -20,8 +27,7 @@ def AddAttachment(db: Session, attachmentData: AttachmentCreateSchema) -> Attach
         ProjectId=attachmentData.ProjectId
     )
     db.add(newAttachment)
-    db.commit()
-    db.refresh(newAttachment)
+    db.flush()
     return newAttachment
 
 
@@ -30,8 +36,10 @@ def SoftDeleteAttachment(db: Session, attachmentId: str) -> bool:
     if not attachment:
         return False
 
+    if not attachment.IsDeleted:
+        ReleaseBlob(db, attachment)
     attachment.IsDeleted = True
-    db.commit()
+    db.flush()
     return True
 
 
@@ -42,41 +50,42 @@ def GetAttachmentById(db: Session, attachmentId: str) -> Optional[Attachment]:
     ).first()
 
 
-def GetAttachmentsByEntity(db: Session, projectId: str, entityType: AttachmentEntityType, entityId: str) -> List[Attachment]:
-    return db.query(Attachment).filter(
+def AttachmentsQuery(projectId: str, entityType: AttachmentEntityType, entityId: Optional[str] = None):
+    statement = select(Attachment).where(
         Attachment.ProjectId == projectId,
         Attachment.EntityType == entityType,
-        Attachment.EntityId == entityId,
         Attachment.IsDeleted == False
-    ).all()
+    )
+    if entityId is not None:
+        statement = statement.where(Attachment.EntityId == entityId)
+    return statement.options(*LoadProfile(Attachment, AttachmentResponseSchema))
 
 
-def GetAttachmentsByEntityType(db: Session, projectId: str, entityType: AttachmentEntityType) -> List[Attachment]:
-    return db.query(Attachment).filter(
-        Attachment.ProjectId == projectId,
-        Attachment.EntityType == entityType,
-        Attachment.IsDeleted == False
-    ).all()
+def GetAttachmentsByEntity(db: Session, projectId: str, entityType: AttachmentEntityType, entityId: str, page: PageParams) -> Page:
+    return FetchPage(db, AttachmentsQuery(projectId, entityType, entityId), page, Attachment.UploadedAt, Attachment.Id)
 
-def UploadToUniServer(localFilePath: str, remoteFileName: str):
-    hostname = "clabsql.clamv.constructor.university"
-    username = "mabaszada"
-    remoteDir = "/home/mabaszada/public_html"
 
-    password = "YU3TIV" 
+def GetAttachmentsByEntityType(db: Session, projectId: str, entityType: AttachmentEntityType, page: PageParams) -> Page:
+    return FetchPage(db, AttachmentsQuery(projectId, entityType), page, Attachment.UploadedAt, Attachment.Id)
 
-    transport = paramiko.Transport((hostname, 22))
-    transport.connect(username=username, password=password)
+def StagedUploadPath(attachmentId: str) -> str:
+    return os.path.join(UPLOAD_STAGING_DIR, attachmentId)
 
-    sftp = paramiko.SFTPClient.from_transport(transport)
-    remotePath = os.path.join(remoteDir, remoteFileName)
-    
-    sftp.put(localFilePath, remotePath)
-    
-    sftp.close()
-    transport.close()
+def DiscardStagedUpload(attachmentId: str):
+    try:
+        os.remove(StagedUploadPath(attachmentId))
+    except FileNotFoundError:
+        pass
 
-    return remotePath  
+def StageUpload(file: UploadFile, attachmentId: str) -> Tuple[int, str]:
+    """Copies the request body to local staging so the transfer can outlive the request. Returns (size, sha256 hex)."""
+    os.makedirs(UPLOAD_STAGING_DIR, exist_ok=True)
+    try:
+        with open(StagedUploadPath(attachmentId), "wb") as target:
+            return CopyInChunks(file.file, target.write)
+    except BaseException:
+        DiscardStagedUpload(attachmentId)
+        raise
 
 def FileUpload(
     db: Session,
@@ -85,39 +94,74 @@ def FileUpload(
     entityId: str,
     projectId: str,
     currentUser: str
-):
-    tempLocalPath = os.path.join("temp_uploads", file.filename)
-    os.makedirs("temp_uploads", exist_ok=True)
-
-    with open(tempLocalPath, "wb") as buffer:
-        buffer.write(file.file.read())
-
-    remotePath = UploadToUniServer(tempLocalPath, file.filename)
-
-    fileSize = os.path.getsize(tempLocalPath)
-    os.remove(tempLocalPath)
-
+) -> Attachment:
     attachmentData = Attachment(
-        FileName=file.filename,
+        Id=str(uuid.uuid4()),
+        FileName=os.path.basename(file.filename),
         FileType=file.content_type,
-        FileSize=fileSize,
-        FilePath=remotePath.replace("/home/mabaszada/", "/"),
+        FilePath="",
+        Status=AttachmentStatus.PENDING,
         EntityType=entityType,
         EntityId=entityId,
         OwnerId=currentUser,
         ProjectId=projectId
     )
-
-    db.add(attachmentData)
-    db.commit()
-    db.refresh(attachmentData)
+    attachmentData.FileSize, attachmentData.ContentHash = StageUpload(file, attachmentData.Id)
+
+    try:
+        db.add(attachmentData)
+        db.flush()
+    except BaseException:
+        DiscardStagedUpload(attachmentData.Id)
+        raise
     return attachmentData
 
-def DownloadAttachment(attachment: Attachment) -> dict:
-    if attachment.FilePath.startswith("http://") or attachment.FilePath.startswith("https://"):
-        baseUrl = attachment.FilePath
-        return f"{baseUrl}"
-    else:
-        baseUrl = f"http://clabsql.clamv.constructor.university/~mabaszada/"
-        fileName = os.path.basename(attachment.FilePath)
-        return f"{baseUrl}/{fileName}"
+def UseStoredBlob(db: Session, attachment: Attachment) -> bool:
+    """Points a staged attachment at the stored copy of its content, if there is one. The transfer is then skipped."""
+    filePath = AcquireBlob(db, attachment.ContentHash)
+    if filePath is None:
+        return False
+    attachment.FilePath = filePath
+    attachment.Status = AttachmentStatus.READY
+    db.flush()
+    DiscardStagedUpload(attachment.Id)
+    return True
+
+def StoreStagedUpload(db: Session, attachment: Attachment):
+    """Makes a staged attachment Ready in the calling thread, transferring it only if storage has no copy yet."""
+    if UseStoredBlob(db, attachment):
+        return
+    try:
+        with open(StagedUploadPath(attachment.Id), "rb") as source:
+            stored = GetStorage().Save(source, BlobName(attachment.ContentHash, attachment.FileName))
+    finally:
+        DiscardStagedUpload(attachment.Id)
+    attachment.FilePath = RegisterBlob(db, stored.ContentHash, stored.Size, stored.Path)
+    attachment.Status = AttachmentStatus.READY
+    db.flush()
+
+def StartUploadAttempt(db: Session, attachmentId: str, attempt: int) -> Optional[Tuple[str, str]]:
+    """Records the attempt and returns (FileName, ContentHash), or None when the upload is no longer Pending or was deleted."""
+    attachment = db.get(Attachment, attachmentId)
+    if not attachment or attachment.IsDeleted or attachment.Status != AttachmentStatus.PENDING:
+        return None
+    attachment.Attempts = attempt
+    db.flush()
+    return attachment.FileName, attachment.ContentHash
+
+def CompleteUpload(db: Session, attachmentId: str, filePath: str) -> bool:
+    return db.execute(
+        update(Attachment)
+        .where(Attachment.Id == attachmentId, Attachment.Status == AttachmentStatus.PENDING, Attachment.IsDeleted == False)
+        .values(Status=AttachmentStatus.READY, FilePath=filePath, Error=None)
+    ).rowcount == 1
+
+def FailUpload(db: Session, attachmentId: str, error: str):
+    db.execute(
+        update(Attachment)
+        .where(Attachment.Id == attachmentId, Attachment.Status == AttachmentStatus.PENDING)
+        .values(Status=AttachmentStatus.FAILED, Error=error[:500])
+    )
+
+def DownloadAttachment(attachment: Attachment) -> str:
+    return SignDownloadUrl(attachment.FilePath, attachment.FileName, attachment.FileType, attachment.FileSize, attachment.ContentHash)
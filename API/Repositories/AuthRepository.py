@@ -19,6 +19,5 @@ class AuthRepository:
             Password=hashed_password,
         )
         self.db.add(newUser)
-        self.db.commit()
-        self.db.refresh(newUser)
+        self.db.flush()
         return newUser
\ No newline at end of file
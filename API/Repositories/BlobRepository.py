@@ -0,0 +1,87 @@
+import os
+from typing import Optional
+
+from sqlalchemy import select, update, func, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from Models.Attachment import Attachment, AttachmentStatus
+from Models.Blob import Blob
+
+
+def BlobName(contentHash: str, fileName: str) -> str:
+    # The extension stays so the web host serves the file with the right content type
+    return contentHash + os.path.splitext(fileName)[1][:16].lower()
+
+
+def AcquireBlob(db: Session, contentHash: str) -> Optional[str]:
+    """Takes a reference on the stored copy of contentHash and returns its path, or None if there is none yet."""
+    acquired = db.execute(
+        update(Blob).where(Blob.ContentHash == contentHash).values(RefCount=Blob.RefCount + 1)
+    ).rowcount
+    if not acquired:
+        return None
+    return db.scalar(select(Blob.FilePath).where(Blob.ContentHash == contentHash))
+
+
+def RegisterBlob(db: Session, contentHash: str, size: int, filePath: str) -> str:
+    """Records a freshly stored copy with one reference. If another upload registered it first, references that one."""
+    try:
+        with db.begin_nested():
+            db.add(Blob(ContentHash=contentHash, FilePath=filePath, Size=size, RefCount=1))
+        return filePath
+    except IntegrityError:
+        return AcquireBlob(db, contentHash)
+
+
+def ReleaseBlob(db: Session, attachment: Attachment):
+    # Attachments stored before the blob store have their own FilePath and hold no reference
+    if not attachment.ContentHash or attachment.Status != AttachmentStatus.READY:
+        return
+    db.execute(
+        update(Blob)
+        .where(Blob.ContentHash == attachment.ContentHash, Blob.FilePath == attachment.FilePath, Blob.RefCount > 0)
+        .values(RefCount=Blob.RefCount - 1)
+    )
+
+
+def ReleaseBlobs(db: Session, *criteria) -> int:
+    """
+    ReleaseBlob for every live attachment matching criteria, in one UPDATE: each blob loses as many
+    references as there are matching attachments pointing at it. Call it before flagging them deleted.
+    Returns the number of blobs touched.
+    """
+    released = (
+        select(Attachment.ContentHash, Attachment.FilePath, func.count(Attachment.Id).label("References"))
+        .where(
+            *criteria,
+            Attachment.ContentHash != None,
+            Attachment.Status == AttachmentStatus.READY,
+            Attachment.IsDeleted == False
+        )
+        .group_by(Attachment.ContentHash, Attachment.FilePath)
+        .subquery()
+    )
+    matches = (released.c.ContentHash == Blob.ContentHash, released.c.FilePath == Blob.FilePath)
+    references = select(released.c.References).where(*matches).scalar_subquery()
+    return db.execute(
+        update(Blob)
+        .where(select(released.c.ContentHash).where(*matches).exists())
+        .values(RefCount=case((Blob.RefCount > references, Blob.RefCount - references), else_=0))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def RecountBlobReferences(db: Session) -> int:
+    """Resets every RefCount from the attachments that point at the blob. Returns the number of blobs corrected."""
+    references = (
+        select(func.count(Attachment.Id))
+        .where(
+            Attachment.ContentHash == Blob.ContentHash,
+            Attachment.FilePath == Blob.FilePath,
+            Attachment.Status == AttachmentStatus.READY,
+            Attachment.IsDeleted == False
+        )
+        .scalar_subquery()
+    )
+    return db.execute(update(Blob).where(Blob.RefCount != references).values(RefCount=references)).rowcount
@@ -1,19 +1,38 @@
 from datetime import datetime
-from typing import Optional
+from threading import Lock
+from cachetools import TTLCache
+import uuid
+from typing import Iterable, List, Optional, Tuple
 from decimal import Decimal
+from sqlalchemy import select, insert, or_, exists, event, func, case
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from Schemas.ProjectSchema import ProjectCreate, ProjectUpdate
-from Models import Project, User, Team, TeamMember, Attachment, ProjectStakeholder
+from Schemas.ProjectSchema import ProjectCreate, ProjectUpdate, ProjectMemberResponse, ProjectSummary
+from Schemas.TeamSchema import TeamResponse
+from Models import Project, User, Team, TeamMember, Attachment, ProjectStakeholder, ProjectScope
+from Models.Attachment import AttachmentEntityType
 from Models.ProjectMember import ProjectMember
+from Models.BudgetLedger import BudgetLedger
 from uuid import UUID
 from Models.Resource import Resource
+from Models.ResourcePlan import ResourcePlan
+from Models.ActivityResource import ActivityResource
 from Models.Task import Task
 from Models.Risk import Risk
-from Repositories import RiskRepository
+from Models.RiskAnalysis import RiskAnalysis
+from Models.RiskResponsePlan import RiskResponsePlan
+from Models.ScopeManagementPlan import ScopeManagementPlan
+from Models.RequirementDocument import RequirementDocument
+from Models.ProjectScopeStatement import ProjectScopeStatement
+from Models.WorkBreakdownStructure import WorkBreakdownStructure
+from Schemas.TaskSchema import TaskFilter, TaskResponse
+from Repositories.TaskRepository import FilterTasks
 from Repositories import ResourceRepository
-from Repositories.ProjectScopeRepository import ProjectScopeRepository
-from Repositories.StakeholderRepository import StakeholderRepository
+from Repositories.BlobRepository import ReleaseBlobs
+from Core.pagination import PageParams, Page, FetchPageAsync
+from Db.loading import LoadProfile
+from Core.config import PROJECT_ACCESS_CACHE_SIZE, PROJECT_ACCESS_CACHE_TTL
 
 
 def CreateProject(db: Session, projectData: ProjectCreate, ownerId: UUID):
@@ -22,34 +41,34 @@ def CreateProject(db: Session, projectData: ProjectCreate, ownerId: UUID):
         Description=projectData.Description,
         Deadline=projectData.Deadline,
         TotalBudget=projectData.TotalBudget,
+        RemainingBudget=projectData.TotalBudget,
         OwnerId=ownerId
     )
     db.add(newProject)
-    db.commit()
-    db.refresh(newProject)
+    db.flush()
+    db.add(BudgetLedger(ProjectId=newProject.Id, Amount=newProject.TotalBudget or 0, Reason=BudgetLedger.REASON_OPENING))
     return newProject
 
 def UpdateProject(db: Session, project: Project, updateData: ProjectUpdate):
-    oldTotal = Decimal(str(project.TotalBudget or 0))
-    oldRemaining = Decimal(str(project.RemainingBudget or 0))
-    usedAmount = abs(oldTotal- abs(oldRemaining))
+    changes = updateData.dict(exclude_unset=True)
+    if "TotalBudget" in changes:
+        ChangeTotalBudget(db, project, changes.pop("TotalBudget"))
 
-    for field, value in updateData.dict(exclude_unset=True).items():
+    for field, value in changes.items():
         setattr(project, field, value)
 
-    if "TotalBudget" in updateData.dict(exclude_unset=True):
-        newTotal = Decimal(str(project.TotalBudget))
-        newRemaining = newTotal - usedAmount
-
-        if newRemaining < 0:
-            raise HTTPException(status_code=400, detail="New budget is lower than amount already used.")
-        
-        project.RemainingBudget = newRemaining
-
-    db.commit()
-    db.refresh(project)
+    db.flush()
     return project
 
+def ChangeTotalBudget(db: Session, project: Project, newTotal):
+    """Whatever is already spent stays spent: the remaining budget moves by the same delta as the total."""
+    budgetDelta = Decimal(str(newTotal or 0)) - Decimal(str(project.TotalBudget or 0))
+    try:
+        ResourceRepository.AdjustRemainingBudget(db, project.Id, budgetDelta, BudgetLedger.REASON_BUDGET_CHANGED)
+    except HTTPException:
+        raise HTTPException(status_code=400, detail="New budget is lower than amount already used.")
+    project.TotalBudget = newTotal
+
 def GetProjectById(db: Session, projectId: UUID) -> Optional[Project]:
     project = db.query(Project).filter(Project.Id == str(projectId), Project.IsDeleted == False).first()
     return project
@@ -74,103 +93,159 @@ def GetProjectsByUser(db: Session, userId: UUID):
 
 def AddMemberToProject(db: Session, projectId: UUID, memberId: UUID):
     member = ProjectMember(
-        ProjectId=projectId,
-        UserId=memberId,
+        ProjectId=str(projectId),
+        UserId=str(memberId),
     )
 
     db.add(member)
-    db.commit()
-    db.refresh(member)
+    db.flush()
+    InvalidateProjectAccess(db, projectId, memberId)
     return member
 
 def SoftDeleteProject(db: Session, userId: UUID, project: Project):
-    project.IsDeleted = True
-
-    members = db.query(ProjectMember).filter(
-        ProjectMember.ProjectId == str(project.Id),
+    deleted = CascadeSoftDeleteProject(db, project.Id)
+    InvalidateProjectAccess(db, project.Id)
+    return {"message": "Project and all related data soft-deleted successfully", "deleted": deleted}
+
+def CascadeSoftDeleteProject(db: Session, projectId: str) -> dict:
+    """
+    Flags a project and everything hanging off it with one set-based statement per entity.
+    Nothing is committed here, so the whole cascade lands in the request's transaction.
+    Returns the number of rows touched per entity.
+    """
+    projectId = str(projectId)
+
+    teamIds = select(Team.Id).where(Team.ProjectId == projectId)
+    taskIds = select(Task.Id).where(Task.ProjectId == projectId)
+    resourceIds = select(Resource.Id).where(Resource.ProjectId == projectId)
+    riskIds = select(Risk.Id).where(Risk.ProjectId == projectId)
+    scopes = select(ProjectScope).where(ProjectScope.ProjectId == projectId).subquery()
+
+    def flag(model, *criteria, values=None):
+        return db.query(model).filter(*criteria).update(
+            values or {"IsDeleted": True}, synchronize_session=False
+        )
+
+    projectAttachments = (Attachment.ProjectId == projectId, Attachment.EntityType != AttachmentEntityType.USER)
+    # The attachments give up their blob references while they still count as live
+    ReleaseBlobs(db, *projectAttachments)
+
+    deleted = {
+        "Project": flag(Project, Project.Id == projectId, Project.IsDeleted == False),
+        "ProjectMembers": flag(ProjectMember, ProjectMember.ProjectId == projectId, ProjectMember.IsDeleted == False),
+        "TeamMemberships": flag(
+            TeamMember, TeamMember.TeamId.in_(teamIds), TeamMember.IsActive == True,
+            values={"IsActive": False}
+        ),
+        "Teams": flag(Team, Team.ProjectId == projectId, Team.IsDeleted == False),
+        "ActivityResources": flag(
+            ActivityResource,
+            or_(ActivityResource.TaskId.in_(taskIds), ActivityResource.ResourceId.in_(resourceIds)),
+            ActivityResource.IsDeleted == False
+        ),
+        "Tasks": flag(Task, Task.ProjectId == projectId, Task.IsDeleted == False),
+        "Resources": flag(Resource, Resource.ProjectId == projectId, Resource.IsDeleted == False),
+        "ResourcePlans": flag(ResourcePlan, ResourcePlan.ProjectId == projectId, ResourcePlan.IsDeleted == False),
+        "RiskAnalyses": flag(RiskAnalysis, RiskAnalysis.RiskId.in_(riskIds), RiskAnalysis.IsDeleted == False),
+        "RiskResponsePlans": flag(RiskResponsePlan, RiskResponsePlan.RiskId.in_(riskIds), RiskResponsePlan.IsDeleted == False),
+        "Risks": flag(Risk, Risk.ProjectId == projectId, Risk.IsDeleted == False),
+        "ScopeManagementPlans": flag(
+            ScopeManagementPlan, ScopeManagementPlan.Id.in_(select(scopes.c.ScopeManagementPlanId)),
+            ScopeManagementPlan.IsDeleted == False
+        ),
+        "RequirementDocuments": flag(
+            RequirementDocument, RequirementDocument.Id.in_(select(scopes.c.RequirementDocumentId)),
+            RequirementDocument.IsDeleted == False
+        ),
+        "ScopeStatements": flag(
+            ProjectScopeStatement, ProjectScopeStatement.Id.in_(select(scopes.c.ScopeStatementId)),
+            ProjectScopeStatement.IsDeleted == False
+        ),
+        "WorkBreakdownStructures": flag(
+            WorkBreakdownStructure, WorkBreakdownStructure.Id.in_(select(scopes.c.WBSId)),
+            WorkBreakdownStructure.IsDeleted == False
+        ),
+        "ProjectScopes": flag(
+            ProjectScope, ProjectScope.ProjectId == projectId, ProjectScope.IsDeleted == False,
+            values={"IsDeleted": True, "UpdatedAt": datetime.now()}
+        ),
+        "Attachments": flag(Attachment, *projectAttachments, Attachment.IsDeleted == False),
+        # Stakeholder rows carry no IsDeleted flag, so they are removed outright as before
+        "Stakeholders": db.query(ProjectStakeholder).filter(
+            ProjectStakeholder.ProjectId == projectId
+        ).delete(synchronize_session=False),
+    }
+
+    return deleted
+
+def AddMembersToProject(db: Session, projectId: UUID, userIds: Iterable[UUID], role: Optional[str] = None) -> Tuple[List[str], List[str]]:
+    """
+    Adds many users to a project with one multi-row INSERT. A single query both checks that the
+    users exist and finds the ones that are already members, which are skipped.
+    Returns (added, alreadyMembers); unknown users raise a 404 that lists them.
+    """
+    projectId, userIds = str(projectId), list(dict.fromkeys(str(userId) for userId in userIds))
+    isMember = exists().where(
+        ProjectMember.ProjectId == projectId,
+        ProjectMember.UserId == User.Id,
         ProjectMember.IsDeleted == False
-    ).all()
-    for member in members:
-        SoftDeleteProjectMember(db, project.Id, member.UserId)
-
-    try:
-        scopeRepo = ProjectScopeRepository(db)
-        scopeRepo.SoftDeleteScope(project.Id)
-    except HTTPException:
-        pass
-
-    resource_ids = db.query(Resource.Id).filter(
-        Resource.ProjectId == str(project.Id),
-        Resource.IsDeleted == False
-    ).all()
-
-    for rid in resource_ids:
-        try:
-            ResourceRepository.SoftDeleteResource(db, rid[0])
-        except HTTPException:
-            pass
-
-    risk_ids = db.query(Risk.Id).filter(
-        Risk.ProjectId == str(project.Id),
-        Risk.IsDeleted == False
-    ).all()
-
-    for rid in risk_ids:
-        try:
-            RiskRepository.SoftDeleteRisk(db, rid[0])
-        except HTTPException:
-            pass
-
-    stakeholderRepo = StakeholderRepository(db)
-    stakeholders = db.query(ProjectStakeholder).filter(
-        ProjectStakeholder.ProjectId == str(project.Id)
-    ).all()
-    for stakeholder in stakeholders:
-        stakeholderRepo.Delete(stakeholder.Id)
-
-    db.query(Attachment).filter(
-        Attachment.ProjectId == str(project.Id),
-        Attachment.EntityType != "User"
-    ).update({"IsDeleted": True}, synchronize_session=False)
-
-    db.commit()
-
-    return {"message": "Project and all related data soft-deleted successfully"}
+    )
+    found = dict(db.execute(select(User.Id, isMember).where(User.Id.in_(userIds))).all())
+
+    missing = [userId for userId in userIds if userId not in found]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Users not found: {', '.join(missing)}")
+
+    added = [userId for userId in userIds if not found[userId]]
+    alreadyMembers = [userId for userId in userIds if found[userId]]
+    if added:
+        joinedAt = datetime.now()
+        db.execute(insert(ProjectMember).values([
+            {"Id": str(uuid.uuid4()), "ProjectId": projectId, "UserId": userId, "Role": role, "JoinedAt": joinedAt, "IsDeleted": False}
+            for userId in added
+        ]))
+        InvalidateProjectAccess(db, projectId)
+    return added, alreadyMembers
 
 def SoftDeleteProjectMember(db: Session, projectId: UUID, memberId: UUID):
-    project_member = db.query(ProjectMember).filter(
-        ProjectMember.ProjectId == str(projectId),
-        ProjectMember.UserId == str(memberId),
-        ProjectMember.IsDeleted == False
-    ).first()
-
-    if not project_member:
+    if not SoftDeleteProjectMembers(db, projectId, [memberId]):
         raise HTTPException(status_code=404, detail="Project member not found")
 
-    project_member.IsDeleted = True
+    return {"message": "Project member and any team memberships removed, their tasks are now unassigned"}
+
+def SoftDeleteProjectMembers(db: Session, projectId: UUID, userIds: Iterable[UUID]) -> List[str]:
+    """
+    Removes many members with one set-based statement per table: their memberships, their seats
+    in the project's teams, and their assignment on the project's tasks, which go back to
+    unassigned. Returns the users that actually were members.
+    """
+    projectId, userIds = str(projectId), {str(userId) for userId in userIds}
+    memberships = (
+        ProjectMember.ProjectId == projectId,
+        ProjectMember.UserId.in_(userIds),
+        ProjectMember.IsDeleted == False
+    )
+    removed = list(db.scalars(select(ProjectMember.UserId).where(*memberships).distinct()))
+    if not removed:
+        return []
 
-    team_ids = db.query(Team.Id).filter(
-        Team.ProjectId == str(projectId),
-        Team.IsDeleted == False
-    ).all()
-    team_ids = [tid[0] for tid in team_ids]
+    db.query(ProjectMember).filter(*memberships).update({"IsDeleted": True}, synchronize_session=False)
 
-    if team_ids:
-        db.query(TeamMember).filter(
-            TeamMember.TeamId.in_(team_ids),
-            TeamMember.UserId == str(memberId),
-            TeamMember.IsActive == True
-        ).update({"IsActive": False}, synchronize_session=False)
+    db.query(TeamMember).filter(
+        TeamMember.TeamId.in_(select(Team.Id).where(Team.ProjectId == projectId, Team.IsDeleted == False)),
+        TeamMember.UserId.in_(removed),
+        TeamMember.IsActive == True
+    ).update({"IsActive": False}, synchronize_session=False)
 
     db.query(Task).filter(
-        Task.ProjectId == str(projectId),
-        Task.AssignedTo == str(memberId),
+        Task.ProjectId == projectId,
+        Task.UserId.in_(removed),
         Task.IsDeleted == False
-    ).update({"IsDeleted": True}, synchronize_session=False)
-
-    db.commit()
+    ).update({"UserId": None}, synchronize_session=False)
 
-    return {"message": "Project member, their tasks, and any team memberships soft-deleted successfully"}
+    InvalidateProjectAccess(db, projectId)
+    db.flush()
+    return removed
 
 def GetProjectOwner(db: Session, projectId: UUID):
     project = db.query(Project).filter(Project.Id == str(projectId), Project.IsDeleted == False).first()
@@ -202,32 +277,173 @@ def IsProjectMember(db: Session, userId: str, projectId: str) -> bool:
     ).first()
     return member is not None
 
-def HasProjectAccess(db: Session, projectId: str, userId: str) -> bool:
-    return (
-        IsProjectMember(db, userId, projectId) or
-        IsProjectOwner(db, userId, projectId)
+def ProjectAccessQuery(projectId: str, userId: str):
+    isMember = exists().where(
+        ProjectMember.ProjectId == str(projectId),
+        ProjectMember.UserId == str(userId),
+        ProjectMember.IsDeleted == False
     )
+    return select(Project.OwnerId, isMember).where(Project.Id == str(projectId), Project.IsDeleted == False)
+
+def ResolveProjectAccess(row, userId: str) -> bool:
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    ownerId, isMember = row
+    return bool(isMember) or str(ownerId) == str(userId)
+
+projectAccessCache = TTLCache(maxsize=PROJECT_ACCESS_CACHE_SIZE, ttl=PROJECT_ACCESS_CACHE_TTL)
+projectAccessLock = Lock()
+
+def CachedProjectAccess(db, key):
+    """Request memo first (kept in session.info), then the shared cache. Returns None on a miss."""
+    memo = db.info.setdefault("projectAccess", {})
+    if key in memo:
+        return memo[key]
+    with projectAccessLock:
+        hasAccess = projectAccessCache.get(key)
+    if hasAccess is not None:
+        memo[key] = hasAccess
+    return hasAccess
+
+def StoreProjectAccess(db, key, hasAccess: bool):
+    db.info.setdefault("projectAccess", {})[key] = hasAccess
+    with projectAccessLock:
+        projectAccessCache[key] = hasAccess
 
+def HasProjectAccess(db: Session, projectId: str, userId: str) -> bool:
+    key = (str(userId), str(projectId))
+    hasAccess = CachedProjectAccess(db, key)
+    if hasAccess is None:
+        hasAccess = ResolveProjectAccess(db.execute(ProjectAccessQuery(projectId, userId)).first(), userId)
+        StoreProjectAccess(db, key, hasAccess)
+    return hasAccess
+
+async def HasProjectAccessAsync(db: AsyncSession, projectId: str, userId: str) -> bool:
+    key = (str(userId), str(projectId))
+    hasAccess = CachedProjectAccess(db, key)
+    if hasAccess is None:
+        hasAccess = ResolveProjectAccess((await db.execute(ProjectAccessQuery(projectId, userId))).first(), userId)
+        StoreProjectAccess(db, key, hasAccess)
+    return hasAccess
+
+def EvictProjectAccess(projectId: str, userId: Optional[str] = None):
+    with projectAccessLock:
+        if userId is not None:
+            projectAccessCache.pop((userId, projectId), None)
+            return
+        for key in [key for key in projectAccessCache if key[1] == projectId]:
+            projectAccessCache.pop(key, None)
+
+def InvalidateProjectAccess(db: Session, projectId, userId=None):
+    """
+    Drops cached access for one member, or for everyone when userId is None.
+    The eviction is repeated after commit so a concurrent request cannot re-cache
+    the pre-commit answer for the whole TTL.
+    """
+    projectId, userId = str(projectId), (str(userId) if userId is not None else None)
+    memo = db.info.get("projectAccess", {})
+    for key in [key for key in memo if key[1] == projectId and userId in (None, key[0])]:
+        del memo[key]
+    EvictProjectAccess(projectId, userId)
+    db.info.setdefault("projectAccessEvictions", []).append((projectId, userId))
+
+@event.listens_for(Session, "after_commit")
+def EvictProjectAccessAfterCommit(session):
+    for projectId, userId in session.info.pop("projectAccessEvictions", []):
+        EvictProjectAccess(projectId, userId)
+
+@event.listens_for(Session, "after_rollback")
+def ForgetProjectAccessAfterRollback(session):
+    session.info.pop("projectAccess", None)
+    for projectId, userId in session.info.pop("projectAccessEvictions", []):
+        EvictProjectAccess(projectId, userId)
 
-def GetProjectMembers(db: Session, projectId: UUID):
-    project = db.query(Project).filter(
-        Project.Id == str(projectId),
-        Project.IsDeleted == False
-    ).first()
 
-    return [member for member in project.Members if not member.IsDeleted]
+def GetProjectMembers(db: Session, projectId: UUID):
+    return db.scalars(
+        select(ProjectMember)
+        .where(ProjectMember.ProjectId == str(projectId), ProjectMember.IsDeleted == False)
+        .options(*LoadProfile(ProjectMember, ProjectMemberResponse))
+    ).all()
 
 def GetProjectTeams(db: Session, projectId: UUID):
-    project = db.query(Project).filter(
-        Project.Id == str(projectId),
-        Project.IsDeleted == False
+    return db.scalars(
+        select(Team)
+        .where(Team.ProjectId == str(projectId), Team.IsDeleted == False)
+        .options(*LoadProfile(Team, TeamResponse))
+    ).all()
+
+# Same bands the frontend uses to colour Probability x Impact (1-25)
+RISK_SEVERITY_BANDS = (("Critical", 15), ("High", 8), ("Medium", 4), ("Low", None))
+CLOSED_RISK_STATUSES = ("Closed",)
+
+def GetProjectSummary(db: Session, projectId: UUID) -> Optional[Project]:
+    return db.scalar(
+        select(Project)
+        .where(Project.Id == str(projectId), Project.IsDeleted == False)
+        .options(*LoadProfile(Project, ProjectSummary))
+    )
+
+def GetTaskCounts(db: Session, projectId: UUID) -> dict:
+    rows = db.execute(
+        select(Task.Status, Task.Priority, Task.Completed, func.count(Task.Id))
+        .where(Task.ProjectId == str(projectId), Task.IsDeleted == False)
+        .group_by(Task.Status, Task.Priority, Task.Completed)
+    ).all()
+
+    counts = {"Total": 0, "Completed": 0, "ByStatus": {}, "ByPriority": {}}
+    for status, priority, completed, count in rows:
+        counts["Total"] += count
+        counts["Completed"] += count if completed else 0
+        counts["ByStatus"][status] = counts["ByStatus"].get(status, 0) + count
+        counts["ByPriority"][priority] = counts["ByPriority"].get(priority, 0) + count
+    return counts
+
+def GetOpenRiskCounts(db: Session, projectId: UUID) -> dict:
+    band = case(
+        *[(Risk.Severity >= threshold, name) for name, threshold in RISK_SEVERITY_BANDS if threshold is not None],
+        else_=RISK_SEVERITY_BANDS[-1][0]
+    )
+    rows = db.execute(
+        select(band, func.count(Risk.Id))
+        .where(
+            Risk.ProjectId == str(projectId),
+            Risk.IsDeleted == False,
+            or_(Risk.Status.is_(None), Risk.Status.not_in(CLOSED_RISK_STATUSES))
+        )
+        .group_by(band)
+    ).all()
+
+    bySeverity = {name: 0 for name, _ in RISK_SEVERITY_BANDS}
+    bySeverity.update(dict(rows))
+    return {"Open": sum(bySeverity.values()), "BySeverity": bySeverity}
+
+def GetScopeArtifacts(db: Session, projectId: UUID) -> dict:
+    scope = db.execute(
+        select(
+            ProjectScope.ScopeManagementPlanId, ProjectScope.RequirementDocumentId,
+            ProjectScope.ScopeStatementId, ProjectScope.WBSId
+        ).where(ProjectScope.ProjectId == str(projectId))
     ).first()
 
-    return [team for team in project.Teams if not team.IsDeleted]
+    # The requirement management plan is stored on the scope management plan row
+    return {
+        "ScopeManagementPlan": bool(scope and scope.ScopeManagementPlanId),
+        "RequirementManagementPlan": bool(scope and scope.ScopeManagementPlanId),
+        "RequirementDocument": bool(scope and scope.RequirementDocumentId),
+        "ScopeStatement": bool(scope and scope.ScopeStatementId),
+        "WBS": bool(scope and scope.WBSId),
+    }
+
+def ProjectTasksQuery(projectId: UUID, filters: Optional[TaskFilter] = None):
+    return FilterTasks(select(Task).where(Task.ProjectId == str(projectId), Task.IsDeleted == False), filters)
 
 def GetTasks(db: Session, projectId: UUID):
-    project = GetProjectById(db, projectId)
-    return [task for task in project.Tasks if not task.IsDeleted]
+    return db.scalars(ProjectTasksQuery(projectId)).all()
+
+async def GetTasksAsync(db: AsyncSession, projectId: UUID, filters: TaskFilter, page: PageParams) -> Page:
+    statement = ProjectTasksQuery(projectId, filters).options(*LoadProfile(Task, TaskResponse))
+    return await FetchPageAsync(db, statement, page, Task.CreatedAt, Task.Id)
 
 
 def UpdateProject(db: Session, projectId: UUID, projectData: dict):
@@ -237,14 +453,13 @@ def UpdateProject(db: Session, projectId: UUID, projectData: dict):
         return None
 
     if "Budget" in projectData:
-        project.TotalBudget = projectData.pop("Budget")
+        ChangeTotalBudget(db, project, projectData.pop("Budget"))
 
     for key, value in projectData.items():
         if hasattr(project, key):
             setattr(project, key, value)
     
     project.UpdatedAt = datetime.now()
-    db.commit()
-    db.refresh(project)
+    db.flush()
     return project
 
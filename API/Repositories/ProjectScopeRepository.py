@@ -37,10 +37,9 @@ class ProjectScopeRepository:
             DeliverableImpact=data.DeliverablesImpactHandling
         )
         self.db.add(scopePlan)
-        self.db.commit()
-        self.db.refresh(scopePlan)
+        self.db.flush()
         scope.ScopeManagementPlanId = scopePlan.Id
-        self.db.commit()
+        self.db.flush()
         return scopePlan
 
     def CreateRequirementManagementPlan(self, projectId: str, data: RequirementManagementPlanSchema):
@@ -54,7 +53,7 @@ class ProjectScopeRepository:
         plan.ReqPrioritization = data.ReqPrioritization
         plan.ReqMetrics = data.ReqMetrics
 
-        self.db.commit()
+        self.db.flush()
         return plan
 
     def CreateRequirementDocument(self, projectId: str, data: RequirementDocumentSchema):
@@ -65,10 +64,9 @@ class ProjectScopeRepository:
             RequirementAcceptanceCriteria="\n".join(data.QuantifiedExpectations)
         )
         self.db.add(doc)
-        self.db.commit()
-        self.db.refresh(doc)
+        self.db.flush()
         scope.RequirementDocumentId = doc.Id
-        self.db.commit()
+        self.db.flush()
         return doc
 
     def CreateScopeStatement(self, projectId: str, data: ProjectScopeStatementSchema):
@@ -82,10 +80,9 @@ class ProjectScopeRepository:
             IncludesSOW=bool(data.OptionalSOW)
         )
         self.db.add(stmt)
-        self.db.commit()
-        self.db.refresh(stmt)
+        self.db.flush()
         scope.ScopeStatementId = stmt.Id
-        self.db.commit()
+        self.db.flush()
         return stmt
 
     def CreateWorkBreakdownStructure(self, projectId: str, data: WorkBreakdownStructureSchema):
@@ -97,8 +94,7 @@ class ProjectScopeRepository:
             EstimatedDuration=0,
         )
         self.db.add(wbs)
-        self.db.commit()
-        self.db.refresh(wbs)
+        self.db.flush()
 
         totalDuration = 0
 
@@ -114,11 +110,10 @@ class ProjectScopeRepository:
 
         wbs.EstimatedDuration = totalDuration
 
-        self.db.commit()
-        self.db.refresh(wbs)
+        self.db.flush()
 
         scope.WBSId = wbs.Id
-        self.db.commit()
+        self.db.flush()
         return wbs
 
     def UpdateScopeManagementPlan(self, projectId: str, data: ScopeManagementPlanUpdateSchema):
@@ -134,8 +129,7 @@ class ProjectScopeRepository:
             if hasattr(plan, field):
                 setattr(plan, field, value)
 
-        self.db.commit()
-        self.db.refresh(plan)
+        self.db.flush()
         return plan
 
 
@@ -152,7 +146,7 @@ class ProjectScopeRepository:
         doc.RequirementTraceability = data.Traceability
         doc.RequirementAcceptanceCriteria = "\n".join(data.QuantifiedExpectations)
 
-        self.db.commit()
+        self.db.flush()
         return doc
 
     def UpdateScopeStatement(self, projectId: str, data: ProjectScopeStatementUpdateSchema):
@@ -164,7 +158,7 @@ class ProjectScopeRepository:
         for field, value in data.dict(exclude_unset=True).items():
             setattr(stmt, field, value)
 
-        self.db.commit()
+        self.db.flush()
         return stmt
 
     def UpdateWorkBreakdownStructure(self, projectId: str, data: WorkBreakdownStructureUpdateSchema):
@@ -178,7 +172,7 @@ class ProjectScopeRepository:
         wbs.WorkDescription = wp.Description
         wbs.EstimatedDuration = wp.EstimatedDuration
 
-        self.db.commit()
+        self.db.flush()
         return wbs
 
     def SoftDeleteScope(self, projectId: str):
@@ -209,7 +203,7 @@ class ProjectScopeRepository:
             if wbs:
                 self.db.delete(wbs)
 
-        self.db.commit()
+        self.db.flush()
         return {"message": "Project scope and its related components deleted successfully"}
 
     def GetOrCreateScope(self, projectId: str) -> ProjectScope:
@@ -217,8 +211,7 @@ class ProjectScopeRepository:
         if not scope:
             scope = ProjectScope(ProjectId=projectId)
             self.db.add(scope)
-            self.db.commit()
-            self.db.refresh(scope)
+            self.db.flush()
         return scope
     
     def GetProjectScope (self, projectId: str) -> ProjectScope:
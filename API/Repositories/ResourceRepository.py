@@ -1,4 +1,9 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+from sqlalchemy import select, update, insert, func, case
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from decimal import Decimal
 from Models.Resource import Resource
@@ -7,11 +12,15 @@ from Models.ResourcePlan import ResourcePlan
 from Schemas.ResourceSchema import (
     ResourceBase, ResourceUpdate,
     ActivityResourceBase, ActivityResourceUpdate,
-    ResourcePlanBase, ResourcePlanUpdate
+    ResourcePlanBase, ResourcePlanUpdate, ResourceFilter,
+    ResourceRead, ActivityResourceResponse, ResourcePlanRead
 )
+from Core.pagination import PageParams, Page, FetchPage, FetchPageAsync
+from Db.loading import LoadProfile
 import uuid
 from datetime import datetime
 from Models.Project import Project
+from Models.BudgetLedger import BudgetLedger
 from Models.Task import Task
 
 def CreateResource(db: Session, resourceData: ResourceBase):
@@ -29,8 +38,7 @@ def CreateResource(db: Session, resourceData: ResourceBase):
         CreatedAt=datetime.utcnow()
     )
     db.add(newResource)
-    db.commit()
-    db.refresh(newResource)
+    db.flush()
     return newResource
 
 def UpdateResource(db: Session, resourceId: str, updateData: ResourceUpdate):
@@ -41,8 +49,7 @@ def UpdateResource(db: Session, resourceId: str, updateData: ResourceUpdate):
     for field, value in updateData.dict(exclude_unset=True).items():
         setattr(resource, field, value)
 
-    db.commit()
-    db.refresh(resource)
+    db.flush()
     return resource
 
 def SoftDeleteResource(db: Session, resourceId: str):
@@ -51,27 +58,37 @@ def SoftDeleteResource(db: Session, resourceId: str):
         return None
 
     resource.IsDeleted = True
-    db.commit()
+    db.flush()
 
     activities = db.query(ActivityResource).filter(ActivityResource.ResourceId == resourceId, ActivityResource.IsDeleted == False).all()
     for activity in activities:
         activity.IsDeleted = True
-    db.commit()
+    db.flush()
 
     return resource
 
 def GetResourceById(db: Session, resourceId: str):
     return db.query(Resource).filter(Resource.Id == resourceId, Resource.IsDeleted == False).first()
 
-def GetAllResourcesByProjectId(db: Session, projectId: str):
-    return db.query(Resource).filter(
-        Resource.ProjectId == projectId,
-        Resource.IsDeleted == False
-    ).all()
+def ProjectResourcesQuery(projectId: str, filters: ResourceFilter):
+    statement = select(Resource).where(Resource.ProjectId == str(projectId), Resource.IsDeleted == False)
+    if filters.Type:
+        statement = statement.where(Resource.Type == filters.Type)
+    if filters.Name:
+        statement = statement.where(Resource.Name.startswith(filters.Name, autoescape=True))
+    return statement
+
+def GetAllResourcesByProjectId(db: Session, projectId: str, filters: ResourceFilter, page: PageParams) -> Page:
+    statement = ProjectResourcesQuery(projectId, filters).options(*LoadProfile(Resource, ResourceRead))
+    return FetchPage(db, statement, page, Resource.CreatedAt, Resource.Id)
+
+async def GetAllResourcesByProjectIdAsync(db: AsyncSession, projectId: str, filters: ResourceFilter, page: PageParams) -> Page:
+    statement = ProjectResourcesQuery(projectId, filters).options(*LoadProfile(Resource, ResourceRead))
+    return await FetchPageAsync(db, statement, page, Resource.CreatedAt, Resource.Id)
 
 
 def CreateActivityResource(db: Session, assignmentData: ActivityResourceBase, task: Task, resource: Resource):
-    resource.Available -= assignmentData.Quantity
+    AdjustAvailableQuantity(db, resource.Id, -assignmentData.Quantity)
     newAssignment = ActivityResource(
         Id=str(uuid.uuid4()),
         TaskId=assignmentData.TaskId,
@@ -82,48 +99,81 @@ def CreateActivityResource(db: Session, assignmentData: ActivityResourceBase, ta
     )
     db.add(newAssignment)
 
-    AdjustRemainingBudget(db, task.ProjectId, -assignmentData.EstimatedCost)
+    AdjustRemainingBudget(db, task.ProjectId, -assignmentData.EstimatedCost, BudgetLedger.REASON_RESOURCE_ASSIGNED, newAssignment.Id)
 
-    db.commit()
-    db.refresh(newAssignment)
+    db.flush()
 
     return newAssignment
 
+def CreateActivityResources(db: Session, assignments: List[ActivityResourceBase], taskProjects: Dict[str, str]) -> List[dict]:
+    """
+    Inserts a batch of assignments as one unit: a single UPDATE reserves the summed quantity of
+    every resource, one UPDATE per project takes its net cost from the budget, and the assignment
+    and ledger rows go in with executemany. A shortfall raises before the request commits.
+    """
+    quantities, costs = defaultdict(float), defaultdict(Decimal)
+    for assignment in assignments:
+        quantities[assignment.ResourceId] += float(assignment.Quantity)
+        costs[taskProjects[assignment.TaskId]] += Decimal(str(assignment.EstimatedCost))
+
+    ReserveAvailableQuantities(db, quantities)
+    for projectId, cost in costs.items():
+        if cost > 0 and not ApplyBudgetDelta(db, projectId, -cost):
+            raise HTTPException(status_code=400, detail=f"Insufficient remaining budget in project {projectId} to complete this operation.")
+
+    assignedAt = datetime.utcnow()
+    rows = [
+        {
+            "Id": str(uuid.uuid4()),
+            "TaskId": assignment.TaskId,
+            "ResourceId": assignment.ResourceId,
+            "Quantity": assignment.Quantity,
+            "EstimatedCost": assignment.EstimatedCost,
+            "IsDeleted": False,
+            "AssignedAt": assignedAt,
+        }
+        for assignment in assignments
+    ]
+    db.execute(insert(ActivityResource), rows)
+
+    entries = [
+        {
+            "ProjectId": taskProjects[row["TaskId"]],
+            "Amount": -Decimal(str(row["EstimatedCost"])),
+            "Reason": BudgetLedger.REASON_RESOURCE_ASSIGNED,
+            "ReferenceId": row["Id"],
+        }
+        for row in rows if row["EstimatedCost"]
+    ]
+    if entries:
+        db.execute(insert(BudgetLedger), entries)
+
+    return rows
+
 def UpdateActivityResource(db: Session, assignment: ActivityResource, updateData: ActivityResourceUpdate, task: Task, resource: Resource):
     oldQuantity = assignment.Quantity
     newQuantity = updateData.Quantity if updateData.Quantity is not None else oldQuantity
 
-    quantityDelta = newQuantity - oldQuantity
-    if quantityDelta > 0:
-        if resource.Available is None or resource.Available < quantityDelta:
-            raise HTTPException(status_code=400, detail="Not enough available resource quantity.")
-        resource.Available -= quantityDelta
-    elif quantityDelta < 0:
-        resource.Available += abs(quantityDelta)
-    
+    AdjustAvailableQuantity(db, resource.Id, float(oldQuantity) - float(newQuantity))
+
     oldCost = assignment.EstimatedCost
     for field, value in updateData.dict(exclude_unset=True).items():
         setattr(assignment, field, value)
 
-    db.commit()
-    db.refresh(assignment)
+    db.flush()
 
-    delta = assignment.EstimatedCost - oldCost
-    print (oldCost)
-    print (assignment.EstimatedCost)
-    print (delta)
-    AdjustRemainingBudget(db, task.ProjectId, delta)
+    delta = Decimal(str(oldCost)) - Decimal(str(assignment.EstimatedCost))
+    AdjustRemainingBudget(db, task.ProjectId, delta, BudgetLedger.REASON_ASSIGNMENT_UPDATED, assignment.Id)
 
     return assignment
 
 def SoftDeleteActivityResource(db: Session, assignment: ActivityResource, task: Task, resource: Resource):
-    if resource.Available is not None:
-        resource.Available += assignment.Quantity
+    AdjustAvailableQuantity(db, resource.Id, float(assignment.Quantity))
 
     assignment.IsDeleted = True
-    db.commit()
+    db.flush()
 
-    AdjustRemainingBudget(db, task.ProjectId, assignment.EstimatedCost)
+    AdjustRemainingBudget(db, task.ProjectId, assignment.EstimatedCost, BudgetLedger.REASON_ASSIGNMENT_REMOVED, assignment.Id)
 
     return assignment
 
@@ -131,21 +181,115 @@ def GetActivityResourceById(db: Session, assignmentId: str):
     return db.query(ActivityResource).filter(ActivityResource.Id == assignmentId, ActivityResource.IsDeleted == False).first()
 
 def GetAllActivityResourcesByTaskId(db: Session, activityId: str):
-    return db.query(ActivityResource).filter(ActivityResource.TaskId == activityId, ActivityResource.IsDeleted == False).all()
+    return db.query(ActivityResource).options(*LoadProfile(ActivityResource, ActivityResourceResponse)).filter(
+        ActivityResource.TaskId == activityId, ActivityResource.IsDeleted == False
+    ).all()
 
-def AdjustRemainingBudget(db: Session, projectId: str, amountDelta: int):
-    project: Project = db.query(Project).filter(Project.Id == projectId, Project.IsDeleted == False).first()
-    if not project:
+def ExpireCached(db: Session, model, key: str, *attributes: str):
+    """Drops attributes just changed by a bulk UPDATE from an instance the session already holds."""
+    instance = db.identity_map.get(identity_key(model, str(key)))
+    if instance is not None:
+        db.expire(instance, attributes)
+
+def AdjustAvailableQuantity(db: Session, resourceId: str, quantityDelta: float):
+    """
+    Moves Resource.Available by a delta with one conditional UPDATE, so concurrent assignments
+    can't oversubscribe a resource between a read and a write. Resources without a tracked
+    quantity (Available is NULL) can be released to but not reserved from.
+    """
+    if not quantityDelta:
         return
+
+    result = db.execute(
+        update(Resource)
+        .where(Resource.Id == str(resourceId), Resource.Available != None, Resource.Available + quantityDelta >= 0)
+        .values(Available=Resource.Available + quantityDelta)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0 and quantityDelta < 0:
+        raise HTTPException(status_code=400, detail="Not enough available resource quantity.")
+    ExpireCached(db, Resource, resourceId, "Available")
+
+def ReserveAvailableQuantities(db: Session, quantities: Dict[str, float]):
+    """
+    AdjustAvailableQuantity for many resources at once: one UPDATE takes each resource's requested
+    total and only matches the rows that can cover it, so any unmatched row is a shortfall.
+    """
+    requested = case(quantities, value=Resource.Id)
+    result = db.execute(
+        update(Resource)
+        .where(Resource.Id.in_(list(quantities)), Resource.Available != None, Resource.Available - requested >= 0)
+        .values(Available=Resource.Available - requested)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(quantities):
+        available = dict(db.execute(select(Resource.Id, Resource.Available).where(Resource.Id.in_(list(quantities)))).all())
+        short = [resourceId for resourceId, quantity in quantities.items() if available.get(resourceId) is None or available[resourceId] < quantity]
+        raise HTTPException(status_code=400, detail=f"Not enough available resource quantity: {', '.join(short)}.")
+    for resourceId in quantities:
+        ExpireCached(db, Resource, resourceId, "Available")
+
+def ApplyBudgetDelta(db: Session, projectId: str, amountDelta: Decimal) -> bool:
+    """
+    Moves RemainingBudget with a single conditional UPDATE. The row lock it takes serializes
+    concurrent writers on the same project, and the WHERE clause keeps the balance from going
+    negative. Returns False when the project had nothing to apply the change to.
+    """
+    remaining = func.coalesce(Project.RemainingBudget, 0)
+    result = db.execute(
+        update(Project)
+        .where(Project.Id == str(projectId), Project.IsDeleted == False, remaining + amountDelta >= 0)
+        .values(RemainingBudget=remaining + amountDelta, UpdatedAt=Project.UpdatedAt)
+        .execution_options(synchronize_session=False)
+    )
+    ExpireCached(db, Project, projectId, "RemainingBudget")
+    return result.rowcount > 0
+
+def AdjustRemainingBudget(db: Session, projectId: str, amountDelta, reason: str, referenceId: Optional[str] = None):
+    """Applies a budget change and appends it to the BudgetLedger, both inside the caller's transaction."""
     amountDelta = Decimal(str(amountDelta))
+    if amountDelta == 0:
+        return
 
-    new_budget = project.RemainingBudget + amountDelta
-    if new_budget < 0:
-        raise HTTPException(status_code=400, detail="Insufficient remaining budget to complete this operation.")
+    if not ApplyBudgetDelta(db, projectId, amountDelta):
+        if amountDelta < 0:
+            raise HTTPException(status_code=400, detail="Insufficient remaining budget to complete this operation.")
+        return
 
-    project.RemainingBudget = new_budget
+    db.add(BudgetLedger(ProjectId=str(projectId), Amount=amountDelta, Reason=reason, ReferenceId=referenceId))
 
-    db.commit()
+def LedgerBalanceQuery():
+    return (
+        select(BudgetLedger.ProjectId, func.coalesce(func.sum(BudgetLedger.Amount), 0).label("Balance"))
+        .group_by(BudgetLedger.ProjectId)
+        .subquery()
+    )
+
+def FindBudgetDrift(db: Session, projectIds: Optional[List[str]] = None):
+    """(ProjectId, RemainingBudget, ledger balance) for every live project whose balance disagrees with its ledger."""
+    ledger = LedgerBalanceQuery()
+    balance = func.coalesce(ledger.c.Balance, 0)
+    statement = (
+        select(Project.Id, Project.RemainingBudget, balance)
+        .outerjoin(ledger, ledger.c.ProjectId == Project.Id)
+        .where(Project.IsDeleted == False, func.coalesce(Project.RemainingBudget, 0) != balance)
+    )
+    if projectIds:
+        statement = statement.where(Project.Id.in_([str(projectId) for projectId in projectIds]))
+    return db.execute(statement).all()
+
+def ReconcileRemainingBudget(db: Session, projectId: str) -> None:
+    """Resets RemainingBudget to the sum of the project's ledger entries."""
+    balance = select(func.coalesce(func.sum(BudgetLedger.Amount), 0)).where(
+        BudgetLedger.ProjectId == Project.Id
+    ).scalar_subquery()
+    db.execute(
+        update(Project)
+        .where(Project.Id == str(projectId))
+        .values(RemainingBudget=balance, UpdatedAt=Project.UpdatedAt)
+        .execution_options(synchronize_session=False)
+    )
+    ExpireCached(db, Project, projectId, "RemainingBudget")
 
 def CreateResourcePlan(db: Session, planData: ResourcePlanBase):
     newPlan = ResourcePlan(
@@ -156,8 +300,7 @@ def CreateResourcePlan(db: Session, planData: ResourcePlanBase):
         CreatedAt=datetime.utcnow()
     )
     db.add(newPlan)
-    db.commit()
-    db.refresh(newPlan)
+    db.flush()
     return newPlan
 
 def UpdateResourcePlan(db: Session, planId: str, updateData: ResourcePlanUpdate):
@@ -168,8 +311,7 @@ def UpdateResourcePlan(db: Session, planId: str, updateData: ResourcePlanUpdate)
     for field, value in updateData.dict(exclude_unset=True).items():
         setattr(plan, field, value)
 
-    db.commit()
-    db.refresh(plan)
+    db.flush()
     return plan
 
 def SoftDeleteResourcePlan(db: Session, planId: str):
@@ -178,11 +320,13 @@ def SoftDeleteResourcePlan(db: Session, planId: str):
         return None
 
     plan.IsDeleted = True
-    db.commit()
+    db.flush()
     return plan
 
 def GetResourcePlanById(db: Session, planId: str):
     return db.query(ResourcePlan).filter(ResourcePlan.Id == planId, ResourcePlan.IsDeleted == False).first()
 
 def GetAllResourcePlansByProjectId(db: Session, projectId: str):
-    return db.query(ResourcePlan).filter(ResourcePlan.ProjectId == projectId, ResourcePlan.IsDeleted == False).all()
+    return db.query(ResourcePlan).options(*LoadProfile(ResourcePlan, ResourcePlanRead)).filter(
+        ResourcePlan.ProjectId == projectId, ResourcePlan.IsDeleted == False
+    ).all()
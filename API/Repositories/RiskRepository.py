@@ -1,12 +1,17 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from Models.Risk import Risk
 from Models.RiskAnalysis import RiskAnalysis
 from Models.RiskResponsePlan import RiskResponsePlan
 from Schemas.RiskSchema import (
     RiskBase, RiskUpdate,
     RiskAnalysisBase, RiskAnalysisUpdate,
-    RiskResponsePlanBase, RiskResponsePlanUpdate
+    RiskResponsePlanBase, RiskResponsePlanUpdate, RiskFilter,
+    RiskRead, RiskAnalysisRead, RiskResponsePlanRead
 )
+from Core.pagination import PageParams, Page, FetchPage, FetchPageAsync
+from Db.loading import LoadProfile
 from Models.ProjectMember import ProjectMember
 import uuid
 from datetime import datetime
@@ -26,8 +31,7 @@ def CreateRisk(db: Session, riskData: RiskBase, ownerId: str):
         Status=riskData.Status
     )
     db.add(newRisk)
-    db.commit()
-    db.refresh(newRisk)
+    db.flush()
     return newRisk
 
 def UpdateRisk(db: Session, riskId: str, updateData: RiskUpdate):
@@ -36,8 +40,7 @@ def UpdateRisk(db: Session, riskId: str, updateData: RiskUpdate):
         return None
     for field, value in updateData.dict(exclude_unset=True).items():
         setattr(risk, field, value)
-    db.commit()
-    db.refresh(risk)
+    db.flush()
     return risk
 
 def SoftDeleteRisk(db: Session, riskId: str):
@@ -45,14 +48,27 @@ def SoftDeleteRisk(db: Session, riskId: str):
     if not risk:
         return None
     risk.IsDeleted = True
-    db.commit()
+    db.flush()
     return risk
 
 def GetRiskById(db: Session, riskId: str):
     return db.query(Risk).filter(Risk.Id == riskId, Risk.IsDeleted == False).first()
 
-def GetAllRisks(db: Session, projectId: str):
-    return db.query(Risk).filter(Risk.ProjectId == projectId, Risk.IsDeleted == False).all()
+def ProjectRisksQuery(projectId: str, filters: RiskFilter):
+    statement = select(Risk).where(Risk.ProjectId == str(projectId), Risk.IsDeleted == False)
+    if filters.Status:
+        statement = statement.where(Risk.Status == filters.Status)
+    if filters.Category:
+        statement = statement.where(Risk.Category == filters.Category)
+    return statement
+
+def GetAllRisks(db: Session, projectId: str, filters: RiskFilter, page: PageParams) -> Page:
+    statement = ProjectRisksQuery(projectId, filters).options(*LoadProfile(Risk, RiskRead))
+    return FetchPage(db, statement, page, Risk.IdentifiedDate, Risk.Id)
+
+async def GetAllRisksAsync(db: AsyncSession, projectId: str, filters: RiskFilter, page: PageParams) -> Page:
+    statement = ProjectRisksQuery(projectId, filters).options(*LoadProfile(Risk, RiskRead))
+    return await FetchPageAsync(db, statement, page, Risk.IdentifiedDate, Risk.Id)
 
 def CreateRiskAnalysis(db: Session, analysisData: RiskAnalysisBase):
     newAnalysis = RiskAnalysis(
@@ -65,8 +81,7 @@ def CreateRiskAnalysis(db: Session, analysisData: RiskAnalysisBase):
         AnalysisDate=datetime.utcnow()
     )
     db.add(newAnalysis)
-    db.commit()
-    db.refresh(newAnalysis)
+    db.flush()
     return newAnalysis
 
 def UpdateRiskAnalysis(db: Session, analysisId: str, updateData: RiskAnalysisUpdate):
@@ -75,8 +90,7 @@ def UpdateRiskAnalysis(db: Session, analysisId: str, updateData: RiskAnalysisUpd
         return None
     for field, value in updateData.dict(exclude_unset=True).items():
         setattr(analysis, field, value)
-    db.commit()
-    db.refresh(analysis)
+    db.flush()
     return analysis
 
 def SoftDeleteRiskAnalysis(db: Session, analysisId: str):
@@ -84,14 +98,16 @@ def SoftDeleteRiskAnalysis(db: Session, analysisId: str):
     if not analysis:
         return None
     analysis.IsDeleted = True
-    db.commit()
+    db.flush()
     return analysis
 
 def GetRiskAnalysisById(db: Session, analysisId: str):
     return db.query(RiskAnalysis).filter(RiskAnalysis.Id == analysisId, RiskAnalysis.IsDeleted == False).first()
 
 def GetAllRiskAnalysesByRiskId(db: Session, riskId: str):
-    return db.query(RiskAnalysis).filter(RiskAnalysis.RiskId == riskId, RiskAnalysis.IsDeleted == False).all()
+    return db.query(RiskAnalysis).options(*LoadProfile(RiskAnalysis, RiskAnalysisRead)).filter(
+        RiskAnalysis.RiskId == riskId, RiskAnalysis.IsDeleted == False
+    ).all()
 
 def CreateRiskResponsePlan(db: Session, responseData: RiskResponsePlanBase):
     newPlan = RiskResponsePlan(
@@ -105,8 +121,7 @@ def CreateRiskResponsePlan(db: Session, responseData: RiskResponsePlanBase):
         CreatedAt=datetime.utcnow()
     )
     db.add(newPlan)
-    db.commit()
-    db.refresh(newPlan)
+    db.flush()
     return newPlan
 
 def UpdateRiskResponsePlan(db: Session, responseId: str, updateData: RiskResponsePlanUpdate):
@@ -115,8 +130,7 @@ def UpdateRiskResponsePlan(db: Session, responseId: str, updateData: RiskRespons
         return None
     for field, value in updateData.dict(exclude_unset=True).items():
         setattr(plan, field, value)
-    db.commit()
-    db.refresh(plan)
+    db.flush()
     return plan
 
 def SoftDeleteRiskResponsePlan(db: Session, responseId: str):
@@ -124,13 +138,15 @@ def SoftDeleteRiskResponsePlan(db: Session, responseId: str):
     if not plan:
         return None
     plan.IsDeleted = True
-    db.commit()
+    db.flush()
     return plan
 
 def GetRiskResponsePlanById(db: Session, responseId: str):
     return db.query(RiskResponsePlan).filter(RiskResponsePlan.Id == responseId, RiskResponsePlan.IsDeleted == False).first()
 
 def GetAllRiskResponsePlansByRiskId(db: Session, riskId: str):
-    return db.query(RiskResponsePlan).filter(RiskResponsePlan.RiskId == riskId, RiskResponsePlan.IsDeleted == False).all()
+    return db.query(RiskResponsePlan).options(*LoadProfile(RiskResponsePlan, RiskResponsePlanRead)).filter(
+        RiskResponsePlan.RiskId == riskId, RiskResponsePlan.IsDeleted == False
+    ).all()
 
 
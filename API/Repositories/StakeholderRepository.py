@@ -23,8 +23,7 @@ class StakeholderRepository:
             Percentage=data.Percentage
         )
         self.db.add(stakeholder)
-        self.db.commit()
-        self.db.refresh(stakeholder)
+        self.db.flush()
         return stakeholder
 
     def Update(self, stakeholderId: UUID, data: StakeholderUpdate):
@@ -32,13 +31,12 @@ class StakeholderRepository:
         for key, value in data.dict(exclude_unset=True).items():
             setattr(stakeholder, key, value)
         stakeholder.UpdatedAt = datetime.now()
-        self.db.commit()
-        self.db.refresh(stakeholder)
+        self.db.flush()
         return stakeholder
 
     def Delete(self, stakeholderId: UUID):
         stakeholder = self.GetById(stakeholderId)
         self.db.delete(stakeholder)
-        self.db.commit()
+        self.db.flush()
         return {"message": "Stakeholder deleted successfully"}
 
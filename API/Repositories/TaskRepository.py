@@ -1,92 +1,501 @@
-from sqlalchemy.orm import Session
-from Db.session import SessionLocal
+from collections import defaultdict
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select, update, insert, literal, func, case, bindparam
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from fastapi import Depends
+from Dependencies.db import GetDb
 from Models.Task import Task
-from Schemas.TaskSchema import TaskCreate, TaskUpdate
+from Models.Project import Project
+from Models.BudgetLedger import BudgetLedger
+from Models.Resource import Resource
+from Models.ActivityResource import ActivityResource
+from Repositories import ResourceRepository
+from Schemas.TaskSchema import TaskCreate, TaskUpdate, TaskFilter, TaskResponse
+from Core.pagination import PageParams, Page, FetchPage, FetchPageAsync
+from Db.loading import LoadProfile
 from uuid import UUID
 
+def FilterTasks(statement, filters: Optional[TaskFilter]):
+    if filters is None:
+        return statement
+    if filters.ProjectId:
+        statement = statement.where(Task.ProjectId == str(filters.ProjectId))
+    if filters.Status:
+        statement = statement.where(Task.Status == filters.Status)
+    if filters.Priority:
+        statement = statement.where(Task.Priority == filters.Priority)
+    if filters.AssigneeId:
+        statement = statement.where(Task.UserId == str(filters.AssigneeId))
+    if filters.TeamId:
+        statement = statement.where(Task.TeamId == str(filters.TeamId))
+    if filters.Completed is not None:
+        statement = statement.where(Task.Completed == filters.Completed)
+    if filters.DeadlineFrom:
+        statement = statement.where(Task.Deadline >= filters.DeadlineFrom)
+    if filters.DeadlineTo:
+        statement = statement.where(Task.Deadline <= filters.DeadlineTo)
+    return statement
+
+def AncestorIds(db: Session, taskId: str) -> List[str]:
+    """The task itself and every task above it, nearest first."""
+    chain = select(Task.Id, Task.ParentTaskId, literal(0).label("Depth")).where(
+        Task.Id == str(taskId)
+    ).cte("TaskAncestors", recursive=True)
+
+    parent = aliased(Task)
+    chain = chain.union_all(
+        select(parent.Id, parent.ParentTaskId, (chain.c.Depth + 1).label("Depth")).where(parent.Id == chain.c.ParentTaskId)
+    )
+    return list(db.scalars(select(chain.c.Id).order_by(chain.c.Depth)))
+
+def GetAncestry(db: Session, taskIds: Iterable[str]) -> Dict[str, list]:
+    """
+    Id -> [ParentTaskId, SubtaskTotal, SubtaskCompleted] for the given tasks and every task above
+    them, read with one recursive query so a batch can walk its ancestor chains in memory.
+    """
+    taskIds = {str(taskId) for taskId in taskIds if taskId}
+    if not taskIds:
+        return {}
+
+    chain = select(Task.Id, Task.ParentTaskId, Task.SubtaskTotal, Task.SubtaskCompleted).where(
+        Task.Id.in_(taskIds)
+    ).cte("TaskAncestry", recursive=True)
+
+    parent = aliased(Task)
+    chain = chain.union(
+        select(parent.Id, parent.ParentTaskId, parent.SubtaskTotal, parent.SubtaskCompleted).where(parent.Id == chain.c.ParentTaskId)
+    )
+    return {row.Id: [row.ParentTaskId, row.SubtaskTotal, row.SubtaskCompleted] for row in db.execute(select(chain))}
+
+def AncestorChain(ancestry: Dict[str, list], taskId: Optional[str]) -> List[str]:
+    """In-memory AncestorIds over a GetAncestry map: the task itself and every task above it, nearest first."""
+    chain = []
+    while taskId is not None and taskId not in chain:
+        chain.append(taskId)
+        taskId = ancestry[taskId][0] if taskId in ancestry else None
+    return chain
+
+def ApplySubtreeDeltas(db: Session, deltas: Dict[str, List[int]]):
+    """Adds per-task (total, completed) deltas to the subtree counters with one executemany UPDATE."""
+    rows = [
+        {"TaskId": taskId, "TotalDelta": total, "CompletedDelta": completed}
+        for taskId, (total, completed) in deltas.items() if total or completed
+    ]
+    if not rows:
+        return
+
+    table = Task.__table__
+    db.execute(
+        table.update()
+        .where(table.c.Id == bindparam("TaskId"))
+        .values(
+            SubtaskTotal=table.c.SubtaskTotal + bindparam("TotalDelta"),
+            SubtaskCompleted=table.c.SubtaskCompleted + bindparam("CompletedDelta"),
+            UpdatedAt=table.c.UpdatedAt
+        ),
+        rows
+    )
+    for row in rows:
+        ResourceRepository.ExpireCached(db, Task, row["TaskId"], "SubtaskTotal", "SubtaskCompleted")
+
+def ProgressPercent(completed, total):
+    return case((total > 0, (completed * 100) // total), else_=0)
+
+def AdjustProgressCounters(db: Session, projectId: Optional[str], parentTaskId: Optional[str], totalDelta: int, completedDelta: int):
+    """
+    Shifts the live task counters by a delta: the subtree counters of `parentTaskId` and every task
+    above it, then the project's counters and Progress (skipped when projectId is None).
+    The counters are incremented in SQL inside the caller's transaction, so concurrent writers don't
+    overwrite each other, and UpdatedAt is left alone because nobody edited those rows.
+    """
+    if not totalDelta and not completedDelta:
+        return
+
+    if parentTaskId is not None:
+        db.execute(
+            update(Task)
+            .where(Task.Id.in_(AncestorIds(db, parentTaskId)))
+            .values(
+                SubtaskTotal=Task.SubtaskTotal + totalDelta,
+                SubtaskCompleted=Task.SubtaskCompleted + completedDelta,
+                UpdatedAt=Task.UpdatedAt
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    if projectId is not None:
+        total = Project.TaskTotal + totalDelta
+        completed = Project.TaskCompleted + completedDelta
+        # MySQL applies SET clauses left to right, so Progress goes first and sees the old counters
+        db.execute(
+            update(Project)
+            .where(Project.Id == str(projectId))
+            .ordered_values(
+                (Project.Progress, ProgressPercent(completed, total)),
+                (Project.TaskTotal, total),
+                (Project.TaskCompleted, completed),
+                (Project.UpdatedAt, Project.UpdatedAt)
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+def RecomputeProgressCounters(db: Session, projectId: str) -> int:
+    """
+    Rebuilds a project's task counters from its live tasks and writes back only what drifted.
+    Used for backfills and after bulk soft deletes that don't go through TaskRepository.
+    Returns the number of rows corrected.
+    """
+    projectId = str(projectId)
+    # Deleted tasks are read too, only to walk through them to the live tasks above
+    allRows = db.execute(
+        select(Task.Id, Task.ParentTaskId, Task.IsDeleted, Task.Completed, Task.SubtaskTotal, Task.SubtaskCompleted, Task.UpdatedAt)
+        .where(Task.ProjectId == projectId)
+    ).all()
+    rows = [row for row in allRows if not row.IsDeleted]
+
+    parentOf = {row.Id: row.ParentTaskId for row in allRows}
+    totals = {row.Id: 0 for row in rows}
+    completed = {row.Id: 0 for row in rows}
+    for row in rows:
+        # A task under a deleted parent counts from its nearest live ancestor up, as AdjustProgressCounters does
+        ancestorId, seen = parentOf[row.Id], {row.Id}
+        while ancestorId in parentOf and ancestorId not in seen:
+            seen.add(ancestorId)
+            if ancestorId in totals:
+                totals[ancestorId] += 1
+                completed[ancestorId] += 1 if row.Completed else 0
+            ancestorId = parentOf[ancestorId]
+
+    drifted = [
+        {"Id": row.Id, "SubtaskTotal": totals[row.Id], "SubtaskCompleted": completed[row.Id], "UpdatedAt": row.UpdatedAt}
+        for row in rows
+        if (row.SubtaskTotal, row.SubtaskCompleted) != (totals[row.Id], completed[row.Id])
+    ]
+    if drifted:
+        db.execute(update(Task), drifted)
+
+    taskTotal = len(rows)
+    taskCompleted = sum(1 for row in rows if row.Completed)
+    projectDrifted = db.execute(
+        update(Project)
+        .where(
+            Project.Id == projectId,
+            (Project.TaskTotal != taskTotal) | (Project.TaskCompleted != taskCompleted)
+        )
+        .ordered_values(
+            (Project.Progress, ProgressPercent(literal(taskCompleted), literal(taskTotal))),
+            (Project.TaskTotal, taskTotal),
+            (Project.TaskCompleted, taskCompleted),
+            (Project.UpdatedAt, Project.UpdatedAt)
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    return len(drifted) + projectDrifted
+
 class TaskRepository:
-    def __init__(self):
-        self.db: Session = SessionLocal()
+    def __init__(self, db: Session = Depends(GetDb, scope="function")):
+        self.db = db
 
     def Create(self, userId: UUID, taskData: TaskCreate):
         task = Task(**taskData.dict(), CreatedBy=str(userId))
         self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
+        self.db.flush()
+        AdjustProgressCounters(
+            self.db, str(task.ProjectId), str(task.ParentTaskId) if task.ParentTaskId else None,
+            1, 1 if task.Completed else 0
+        )
         return task
 
+    def CreateMany(self, userId: UUID, tasks: List[TaskCreate]) -> List[dict]:
+        """
+        Inserts a batch of already validated tasks with one executemany INSERT, then moves the
+        progress counters once per touched task and once per project.
+        """
+        createdAt = datetime.now()
+        rows = [
+            {
+                **{key: str(value) if isinstance(value, UUID) else value for key, value in taskData.dict().items()},
+                "Id": str(uuid.uuid4()),
+                "CreatedBy": str(userId),
+                "CreatedAt": createdAt,
+                "UpdatedAt": None,
+                "Completed": False,
+                "IsDeleted": False,
+                "SubtaskTotal": 0,
+                "SubtaskCompleted": 0,
+            }
+            for taskData in tasks
+        ]
+        # render_nulls keeps rows with and without e.g. a parent in the same executemany batch
+        self.db.execute(insert(Task).execution_options(render_nulls=True), rows)
+
+        ancestry = GetAncestry(self.db, {row["ParentTaskId"] for row in rows})
+        deltas, projectTotals = defaultdict(lambda: [0, 0]), defaultdict(int)
+        for row in rows:
+            for ancestorId in AncestorChain(ancestry, row["ParentTaskId"]):
+                deltas[ancestorId][0] += 1
+            projectTotals[row["ProjectId"]] += 1
+
+        ApplySubtreeDeltas(self.db, deltas)
+        for projectId, total in projectTotals.items():
+            AdjustProgressCounters(self.db, projectId, None, total, 0)
+        return rows
+
     def GetById(self, taskId: UUID):
         return self.db.query(Task).filter(Task.Id == str(taskId), Task.IsDeleted == False).first()
 
-    def GetAll(self):
-        return self.db.query(Task).filter(Task.IsDeleted == False).all()
+    def GetByIds(self, taskIds: Iterable[UUID]) -> Dict[str, Task]:
+        taskIds = {str(taskId) for taskId in taskIds}
+        if not taskIds:
+            return {}
+        return {task.Id: task for task in self.db.query(Task).filter(Task.Id.in_(taskIds), Task.IsDeleted == False)}
+
+    def GetAll(self, filters: TaskFilter, page: PageParams) -> Page:
+        statement = self.ActiveTasksQuery(filters).options(*LoadProfile(Task, TaskResponse))
+        return FetchPage(self.db, statement, page, Task.CreatedAt, Task.Id)
+
+    @staticmethod
+    def ActiveTasksQuery(filters: Optional[TaskFilter] = None):
+        return FilterTasks(select(Task).where(Task.IsDeleted == False), filters)
+
+    @staticmethod
+    async def GetAllAsync(db: AsyncSession, filters: TaskFilter, page: PageParams) -> Page:
+        statement = TaskRepository.ActiveTasksQuery(filters).options(*LoadProfile(Task, TaskResponse))
+        return await FetchPageAsync(db, statement, page, Task.CreatedAt, Task.Id)
 
     def Update(self, taskId: UUID, updateData: TaskUpdate):
         task = self.GetById(taskId)
         if not task:
             return None
+        oldParentId, wasCompleted = task.ParentTaskId, bool(task.Completed)
         for key, value in updateData.dict(exclude_unset=True).items():
             setattr(task, key, value)
-        self.db.commit()
-        self.db.refresh(task)
+        self.db.flush()
+        self.ApplyProgressChange(task, oldParentId, wasCompleted)
         return task
 
+    def UpdateMany(self, changes: List[Tuple[Task, dict]], ancestry: Optional[Dict[str, list]] = None):
+        """
+        Applies a batch of validated (task, values) changes in order. The field changes go out in
+        the flush, which batches UPDATEs that set the same columns, and the counter changes the
+        single-task path would make one by one are summed in memory over a GetAncestry map
+        (pass one already loaded for these tasks and new parents, it gets modified), then written
+        with one executemany plus one UPDATE per project.
+        """
+        if ancestry is None:
+            ancestry = GetAncestry(
+                self.db,
+                {task.Id for task, _ in changes} | {values["ParentTaskId"] for _, values in changes if values.get("ParentTaskId")}
+            )
+        deltas, projectCompleted = defaultdict(lambda: [0, 0]), defaultdict(int)
+
+        def Shift(taskId: Optional[str], totalDelta: int, completedDelta: int):
+            for ancestorId in AncestorChain(ancestry, taskId):
+                deltas[ancestorId][0] += totalDelta
+                deltas[ancestorId][1] += completedDelta
+                ancestry[ancestorId][1] += totalDelta
+                ancestry[ancestorId][2] += completedDelta
+
+        for task, values in changes:
+            oldParentId, wasCompleted = task.ParentTaskId, bool(task.Completed)
+            for key, value in values.items():
+                setattr(task, key, value)
+            newParentId, isCompleted = task.ParentTaskId, bool(task.Completed)
+            completedDelta = int(isCompleted) - int(wasCompleted)
+
+            if oldParentId == newParentId:
+                Shift(newParentId, 0, completedDelta)
+            else:
+                _, subtreeTotal, subtreeCompleted = ancestry[task.Id]
+                Shift(oldParentId, -(1 + subtreeTotal), -(int(wasCompleted) + subtreeCompleted))
+                ancestry[task.Id][0] = newParentId
+                Shift(newParentId, 1 + subtreeTotal, int(isCompleted) + subtreeCompleted)
+            projectCompleted[task.ProjectId] += completedDelta
+
+        self.db.flush()
+        ApplySubtreeDeltas(self.db, deltas)
+        for projectId, completedDelta in projectCompleted.items():
+            AdjustProgressCounters(self.db, projectId, None, 0, completedDelta)
+        return [task for task, _ in changes]
+
+    def ApplyProgressChange(self, task: Task, oldParentId: Optional[str], wasCompleted: bool):
+        oldParentId = str(oldParentId) if oldParentId else None
+        newParentId = str(task.ParentTaskId) if task.ParentTaskId else None
+        isCompleted = bool(task.Completed)
+        completedDelta = int(isCompleted) - int(wasCompleted)
+
+        if oldParentId == newParentId:
+            AdjustProgressCounters(self.db, task.ProjectId, newParentId, 0, completedDelta)
+            return
+
+        # Re-parenting moves the whole subtree: the task plus everything under it
+        subtreeTotal = 1 + task.SubtaskTotal
+        AdjustProgressCounters(self.db, None, oldParentId, -subtreeTotal, -(int(wasCompleted) + task.SubtaskCompleted))
+        AdjustProgressCounters(self.db, None, newParentId, subtreeTotal, int(isCompleted) + task.SubtaskCompleted)
+        AdjustProgressCounters(self.db, task.ProjectId, None, 0, completedDelta)
+
     def SoftDelete(self, taskId: UUID):
-        task = self.GetById(taskId)
-        if not task:
+        """Soft-deletes a task with its whole subtree and releases the resources assigned to it."""
+        taskIds = self.GetSubtreeIds(taskId)
+        if not taskIds:
             return
 
-        def mark_deleted(t: Task):
-            t.IsDeleted = True
-            for sub in t.Subtasks:
-                if not sub.IsDeleted:
-                    mark_deleted(sub)
+        projectId, parentTaskId = self.db.query(Task.ProjectId, Task.ParentTaskId).filter(Task.Id == str(taskId)).one()
+        completedCount = self.db.query(func.count(Task.Id)).filter(
+            Task.Id.in_(taskIds),
+            Task.Completed == True
+        ).scalar()
+
+        liveAssignments = select(ActivityResource).where(
+            ActivityResource.TaskId.in_(taskIds),
+            ActivityResource.IsDeleted == False
+        ).subquery()
+
+        releasedQuantity = select(func.sum(liveAssignments.c.Quantity)).where(
+            liveAssignments.c.ResourceId == Resource.Id
+        ).scalar_subquery()
+
+        self.db.query(Resource).filter(
+            Resource.Id.in_(select(liveAssignments.c.ResourceId)),
+            Resource.Available != None
+        ).update({Resource.Available: Resource.Available + releasedQuantity}, synchronize_session=False)
 
-        mark_deleted(task)
-        self.db.commit()
+        releasedCost = self.db.query(func.sum(ActivityResource.EstimatedCost)).filter(
+            ActivityResource.TaskId.in_(taskIds),
+            ActivityResource.IsDeleted == False
+        ).scalar()
+
+        self.db.query(ActivityResource).filter(
+            ActivityResource.TaskId.in_(taskIds),
+            ActivityResource.IsDeleted == False
+        ).update({"IsDeleted": True}, synchronize_session=False)
+
+        self.db.query(Task).filter(Task.Id.in_(taskIds)).update(
+            {"IsDeleted": True, "UpdatedAt": datetime.now()}, synchronize_session=False
+        )
+
+        AdjustProgressCounters(self.db, projectId, parentTaskId, -len(taskIds), -completedCount)
+
+        if releasedCost:
+            ResourceRepository.AdjustRemainingBudget(self.db, projectId, releasedCost, BudgetLedger.REASON_TASK_DELETED, str(taskId))
+
+        self.db.flush()
 
     def GetSubtasks(self, parentTaskId: UUID):
-        return self.db.query(Task).filter(
+        return self.db.query(Task).options(*LoadProfile(Task, TaskResponse)).filter(
             Task.ParentTaskId == str(parentTaskId),
             Task.IsDeleted == False
         ).all()
 
-    def GetTaskTree(self, rootTaskId: UUID):
-        root = self.GetById(rootTaskId)
-        if not root:
+    def GetTaskTree(self, rootTaskId: UUID, maxDepth: Optional[int] = None, flat: bool = False):
+        rows = self.GetSubtreeRows(rootTaskId, maxDepth)
+        if not rows:
             return None
 
-        def build_tree(task: Task):
-            children = [sub for sub in task.Subtasks if not sub.IsDeleted]
-            subtree = [build_tree(sub) for sub in children]
-
-            completed = sum(1 for s in children if s.Completed)
-            total = len(children)
-            progress = round((completed / total) * 100, 2) if total > 0 else 0
-
-            return {
-                "Id": task.Id,
-                "Title": task.Title,
-                "Description": task.Description,
-                "Status": task.Status,
-                "StatusColorHex": task.StatusColorHex,
-                "Priority": task.Priority,
-                "PriorityColorHex": task.PriorityColorHex,
-                "Cost": task.Cost,
-                "Deadline": task.Deadline,
-                "CreatedAt": task.CreatedAt,
-                "UpdatedAt": task.UpdatedAt,
-                "Completed": task.Completed,
-                "IsDeleted": task.IsDeleted,
-                "ParentTaskId": task.ParentTaskId,
-                "UserId": task.UserId,
-                "TeamId": task.TeamId,
-                "ProjectId": task.ProjectId,
-                "CreatedBy": task.CreatedBy,
-                "Progress": progress,
-                "SubtaskCount": total,
-                "SubtaskCompleted": completed,
-                "Subtasks": subtree
-            }
+        nodes = {}
+        childrenOf = defaultdict(list)
+        for task, depth in rows:
+            nodes[task.Id] = (task, depth)
+            if depth > 0:
+                childrenOf[task.ParentTaskId].append(task.Id)
+
+        # Nodes sitting on the depth limit still report their real subtask counts
+        frontierCounts = {}
+        if maxDepth is not None:
+            frontierIds = [taskId for taskId, (_, depth) in nodes.items() if depth == maxDepth]
+            frontierCounts = self.CountDirectSubtasks(frontierIds)
+
+        # Deepest nodes first, so every child is built before its parent (post-order)
+        built = {}
+        for taskId, (task, depth) in sorted(nodes.items(), key=lambda item: item[1][1], reverse=True):
+            if taskId in frontierCounts:
+                total, completed = frontierCounts[taskId]
+            else:
+                children = [nodes[childId][0] for childId in childrenOf[taskId]]
+                total = len(children)
+                completed = sum(1 for child in children if child.Completed)
+
+            node = self.ToTreeNode(task, depth, total, completed)
+            if not flat:
+                node["Subtasks"] = [built.pop(childId) for childId in childrenOf[taskId]]
+            built[taskId] = node
+
+        if flat:
+            return sorted(built.values(), key=lambda node: node["Depth"])
+
+        return built[str(rootTaskId)]
+
+    def GetSubtreeRows(self, rootTaskId: UUID, maxDepth: Optional[int] = None):
+        """Loads a task and all its live descendants with one recursive query, as (Task, Depth) rows."""
+        tree = self.SubtreeCte(rootTaskId, maxDepth)
+        return self.db.query(Task, tree.c.Depth).join(tree, Task.Id == tree.c.Id).all()
+
+    def GetSubtreeIds(self, rootTaskId: UUID) -> List[str]:
+        tree = self.SubtreeCte(rootTaskId)
+        return [row[0] for row in self.db.query(tree.c.Id).all()]
+
+    @staticmethod
+    def SubtreeCte(rootTaskId: UUID, maxDepth: Optional[int] = None):
+        tree = select(Task.Id, literal(0).label("Depth")).where(
+            Task.Id == str(rootTaskId),
+            Task.IsDeleted == False
+        ).cte("TaskTree", recursive=True)
+
+        child = aliased(Task)
+        step = select(child.Id, (tree.c.Depth + 1).label("Depth")).where(
+            child.ParentTaskId == tree.c.Id,
+            child.IsDeleted == False
+        )
+        if maxDepth is not None:
+            step = step.where(tree.c.Depth < maxDepth)
+
+        return tree.union_all(step)
+
+    def CountDirectSubtasks(self, parentTaskIds: List[str]):
+        if not parentTaskIds:
+            return {}
+
+        rows = self.db.query(
+            Task.ParentTaskId,
+            func.count(Task.Id),
+            func.sum(case((Task.Completed == True, 1), else_=0))
+        ).filter(
+            Task.ParentTaskId.in_(parentTaskIds),
+            Task.IsDeleted == False
+        ).group_by(Task.ParentTaskId).all()
+
+        return {parentId: (total, int(completed or 0)) for parentId, total, completed in rows}
+
+    @staticmethod
+    def ToTreeNode(task: Task, depth: int, total: int, completed: int):
+        progress = round((completed / total) * 100, 2) if total > 0 else 0
+
+        return {
+            "Id": task.Id,
+            "Title": task.Title,
+            "Description": task.Description,
+            "Status": task.Status,
+            "StatusColorHex": task.StatusColorHex,
+            "Priority": task.Priority,
+            "PriorityColorHex": task.PriorityColorHex,
+            "Cost": task.Cost,
+            "Deadline": task.Deadline,
+            "CreatedAt": task.CreatedAt,
+            "UpdatedAt": task.UpdatedAt,
+            "Completed": task.Completed,
+            "IsDeleted": task.IsDeleted,
+            "ParentTaskId": task.ParentTaskId,
+            "UserId": task.UserId,
+            "TeamId": task.TeamId,
+            "ProjectId": task.ProjectId,
+            "CreatedBy": task.CreatedBy,
+            "Depth": depth,
+            "Progress": progress,
+            "SubtaskCount": total,
+            "SubtaskCompleted": completed,
+        }
 
-        return build_tree(root)
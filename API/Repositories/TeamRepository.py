@@ -1,17 +1,23 @@
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
+from sqlalchemy import select, insert, exists
 from sqlalchemy.orm import Session
 
-from Models import TeamMember, Task
+from Models import TeamMember, Task, User
 from Models.Team import Team
-from Schemas.TeamSchema import TeamCreate, TeamUpdate, AddTeamMember
-from Db.session import SessionLocal
+from Schemas.TeamSchema import TeamCreate, TeamUpdate, AddTeamMember, TeamFilter, TeamResponse, TeamMemberEntry
+from Schemas.TaskSchema import TaskResponse
+from Core.pagination import PageParams, Page, FetchPage
+from Repositories.TaskRepository import RecomputeProgressCounters
+from Db.loading import LoadProfile
+from fastapi import Depends, HTTPException
+from Dependencies.db import GetDb
 from uuid import UUID, uuid4
 from datetime import datetime
 
 class TeamRepository:
-    def __init__(self):
-        self.db: Session = SessionLocal()
+    def __init__(self, db: Session = Depends(GetDb, scope="function")):
+        self.db = db
 
     def Create(self, userId: UUID, teamData: TeamCreate):
         team = Team(
@@ -24,25 +30,29 @@ class TeamRepository:
             ProjectId = str(teamData.ProjectId),
         )
         self.db.add(team)
-        self.db.commit()
-        self.db.refresh(team)
+        self.db.flush()
         return team
 
-    def GetAll(self):
-        return self.db.query(Team).filter(Team.IsDeleted == False).all()
+    def GetAll(self, filters: TeamFilter, page: PageParams) -> Page:
+        statement = self.ActiveTeamsQuery(filters).options(*LoadProfile(Team, TeamResponse))
+        return FetchPage(self.db, statement, page, Team.CreatedAt, Team.Id)
+
+    @staticmethod
+    def ActiveTeamsQuery(filters: TeamFilter):
+        statement = select(Team).where(Team.IsDeleted == False)
+        if filters.ProjectId:
+            statement = statement.where(Team.ProjectId == str(filters.ProjectId))
+        return statement
 
     def GetById(self, teamId: UUID) -> Optional[Team]:
         return self.db.query(Team).filter(Team.Id == str(teamId), Team.IsDeleted == False).first()
 
     def Update(self, teamId: UUID, teamUpdateSchema: TeamUpdate):
         team = self.GetById(teamId)
-        print("Myauuuuuuu")
-        print(team)
         for key, value in teamUpdateSchema.dict(exclude_unset=True).items():
             setattr(team, key, value)
         team.UpdatedAt = datetime.now()
-        self.db.commit()
-        self.db.refresh(team)
+        self.db.flush()
         return team
 
     def SoftDelete(self, teamId: UUID):
@@ -62,8 +72,9 @@ class TeamRepository:
             Task.TeamId == str(teamId),
             Task.IsDeleted == False
         ).update({"IsDeleted": True}, synchronize_session=False)
+        RecomputeProgressCounters(self.db, team.ProjectId)
 
-        self.db.commit()
+        self.db.flush()
         return True
 
     def AddMember(self, addTeamMemberSchema: AddTeamMember):
@@ -74,29 +85,76 @@ class TeamRepository:
             IsLeader=addTeamMemberSchema.IsLeader
         )
         self.db.add(member)
-        self.db.commit()
-        self.db.refresh(member)
+        self.db.flush()
         return member
 
+    def AddMembers(self, teamId: UUID, members: List[TeamMemberEntry]) -> Tuple[List[str], List[str]]:
+        """
+        Adds many users to a team with one multi-row INSERT. One query checks that the users exist
+        and finds the active members, which are skipped. Returns (added, alreadyMembers).
+        """
+        teamId = str(teamId)
+        entries = {}
+        for member in members:
+            entries.setdefault(str(member.UserId), member)
+
+        isMember = exists().where(
+            TeamMember.TeamId == teamId,
+            TeamMember.UserId == User.Id,
+            TeamMember.IsActive == True
+        )
+        found = dict(self.db.execute(select(User.Id, isMember).where(User.Id.in_(list(entries)))).all())
+
+        missing = [userId for userId in entries if userId not in found]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Users not found: {', '.join(missing)}")
+
+        added = [userId for userId in entries if not found[userId]]
+        alreadyMembers = [userId for userId in entries if found[userId]]
+        if added:
+            joinedDate = datetime.now()
+            self.db.execute(insert(TeamMember).values([
+                {
+                    "Id": str(uuid4()), "TeamId": teamId, "UserId": userId, "Role": entries[userId].Role,
+                    "IsLeader": entries[userId].IsLeader, "JoinedDate": joinedDate, "IsActive": True
+                }
+                for userId in added
+            ]))
+        return added, alreadyMembers
+
     def SoftDeleteMember(self, teamId: UUID, userId: UUID):
-        self.db.query(TeamMember).filter(
-            TeamMember.TeamId == str(teamId),
-            TeamMember.UserId == str(userId),
+        self.SoftDeleteMembers(teamId, [userId])
+        return True
+
+    def SoftDeleteMembers(self, teamId: UUID, userIds: Iterable[UUID]) -> List[str]:
+        """
+        Deactivates many memberships with one UPDATE, and hands the team's tasks assigned to those
+        users back to the team as a whole with another. Returns the users that were active members.
+        """
+        teamId, userIds = str(teamId), {str(userId) for userId in userIds}
+        memberships = (
+            TeamMember.TeamId == teamId,
+            TeamMember.UserId.in_(userIds),
             TeamMember.IsActive == True
-        ).update({"IsActive": False}, synchronize_session=False)
+        )
+        removed = list(self.db.scalars(select(TeamMember.UserId).where(*memberships).distinct()))
+        if not removed:
+            return []
+
+        self.db.query(TeamMember).filter(*memberships).update({"IsActive": False}, synchronize_session=False)
 
         self.db.query(Task).filter(
-            Task.TeamId == str(teamId),
-            Task.AssignedTo == str(userId),
+            Task.TeamId == teamId,
+            Task.UserId.in_(removed),
             Task.IsDeleted == False
-        ).update({"IsDeleted": True}, synchronize_session=False)
+        ).update({"UserId": None}, synchronize_session=False)
 
-        self.db.commit()
-        return True
+        self.db.flush()
+        return removed
 
     def GetTasks(self, teamId: UUID):
-        team = self.GetById(teamId)
-        return [task for task in team.Tasks if not task.IsDeleted]
-
-    def __del__(self):
-        self.db.close()
+        return self.db.scalars(
+            select(Task)
+            .where(Task.TeamId == str(teamId), Task.IsDeleted == False)
+            .options(*LoadProfile(Task, TaskResponse))
+        ).all()
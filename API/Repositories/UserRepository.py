@@ -1,19 +1,26 @@
+from typing import Optional
 from pydantic import EmailStr
-from sqlalchemy.orm import Session
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from Models import Project, ProjectMember, TeamMember, Team
+from Models import Project, ProjectMember, TeamMember, Team, Task
 from Models.User import User
 from uuid import UUID
 from fastapi import HTTPException, UploadFile
 
 from Schemas.UserSchema import AddUserSchema
 from Schemas.UserSchema import UserResponseSchema
+from Schemas.TaskSchema import TaskFilter, TaskResponse
+from Schemas.ProjectSchema import ProjectSummary
+from Schemas.TeamSchema import TeamResponse
+from Repositories.TaskRepository import FilterTasks
+from Core.pagination import PageParams, Page, FetchPage
+from Db.loading import LoadProfile
 
 from Models.Attachment import Attachment, AttachmentEntityType
-from Repositories.AttachmentRepository import UploadToUniServer
+from Repositories.AttachmentRepository import FileUpload, StoreStagedUpload
 
-import paramiko
-import os
 
 
 
@@ -31,8 +38,21 @@ class UserRepository:
             Password=hashedPassword
         )
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
+        return user
+
+    @staticmethod
+    async def CreateAsync(db: AsyncSession, userData: AddUserSchema, hashedPassword: str):
+        user = User(
+            FirstName=userData.FirstName,
+            LastName=userData.LastName,
+            Email=userData.Email,
+            Password=hashedPassword
+        )
+        db.add(user)
+        await db.flush()
+        # Loaded here because the response schema reads it and async sessions cannot lazy load
+        await db.refresh(user, ["ProfilePicture"])
         return user
 
     def GetById(self, userId: UUID) -> User:
@@ -47,6 +67,13 @@ class UserRepository:
             raise HTTPException(status_code=404, detail="User not found")
         return user
     
+    @staticmethod
+    async def GetByEmailAsync(db: AsyncSession, email: EmailStr) -> User:
+        user = await db.scalar(select(User).where(User.Email == email))
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        return user
+
     def CheckEmail(self, email: EmailStr) -> User:
         user = self.db.query(User).filter(User.Email == email).first()
         return user
@@ -55,62 +82,68 @@ class UserRepository:
         return self.db.query(User).filter(User.Id == str(userId)).first() is not None
 
     def GetUserProjects(self, userId: UUID):
-        owned_projects = self.db.query(Project).filter(
-            Project.OwnerId == str(userId),
-            Project.IsDeleted == False
-        )
-
-        member_projects = self.db.query(Project).join(ProjectMember).filter(
+        memberProjectIds = select(ProjectMember.ProjectId).where(
             ProjectMember.UserId == str(userId),
-            ProjectMember.IsDeleted == False,
-            Project.IsDeleted == False
+            ProjectMember.IsDeleted == False
         )
 
-        return owned_projects.union(member_projects).all()
+        return self.db.scalars(
+            select(Project)
+            .where(Project.IsDeleted == False, or_(Project.OwnerId == str(userId), Project.Id.in_(memberProjectIds)))
+            .options(*LoadProfile(Project, ProjectSummary))
+        ).all()
 
     def GetUserTeams(self, userId: UUID):
-        members = self.db.query(TeamMember).join(TeamMember.Team).filter(
-            TeamMember.UserId == str(userId),
-            TeamMember.IsActive == True,
-            TeamMember.Team.has(Team.IsDeleted == False)
+        return self.db.scalars(
+            select(Team)
+            .join(TeamMember, TeamMember.TeamId == Team.Id)
+            .where(TeamMember.UserId == str(userId), TeamMember.IsActive == True, Team.IsDeleted == False)
+            .options(*LoadProfile(Team, TeamResponse))
         ).all()
 
-        return [member.Team for member in members]
+    def GetUserAssignedTasks(self, userId: UUID, filters: TaskFilter, page: PageParams) -> Page:
+        statement = self.AssignedTasksQuery(userId, filters).options(*LoadProfile(Task, TaskResponse))
+        return FetchPage(self.db, statement, page, Task.CreatedAt, Task.Id)
+
+    def GetUserCreatedTasks(self, userId: UUID, filters: TaskFilter, page: PageParams) -> Page:
+        statement = self.CreatedTasksQuery(userId, filters).options(*LoadProfile(Task, TaskResponse))
+        return FetchPage(self.db, statement, page, Task.CreatedAt, Task.Id)
 
-    def GetUserAssignedTasks(self, userId: UUID):
-        user = self.GetById(userId)
-        return [task for task in user.TasksAssigned if not task.IsDeleted]
+    @staticmethod
+    def AssignedTasksQuery(userId: UUID, filters: Optional[TaskFilter] = None):
+        return FilterTasks(select(Task).where(Task.UserId == str(userId), Task.IsDeleted == False), filters)
 
-    def GetUserCreatedTasks(self, userId: UUID):
-        user = self.GetById(userId)
-        return [task for task in user.TasksCreated if not task.IsDeleted]
+    @staticmethod
+    def CreatedTasksQuery(userId: UUID, filters: Optional[TaskFilter] = None):
+        return FilterTasks(select(Task).where(Task.CreatedBy == str(userId), Task.IsDeleted == False), filters)
 
     def UpdatePassword(self, user: User, newPassword: str):
 
         user.Password = newPassword
 
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
+        return user
+
+    @staticmethod
+    async def UpdatePasswordAsync(db: AsyncSession, user: User, newPassword: str):
+        user.Password = newPassword
+        await db.flush()
+        await db.refresh(user, ["ProfilePicture"])
         return user
     
     def GetCurrentUserData(db: Session, currentUser: User) -> UserResponseSchema:
-        user: User = db.query(User).filter(User.Id == currentUser.Id, User.IsDeleted == False).first()
+        user: User = db.scalars(
+            select(User).options(joinedload(User.ProfilePicture)).where(User.Id == currentUser.Id, User.IsDeleted == False)
+        ).first()
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         userSchema: UserResponseSchema = UserResponseSchema.from_orm(user)
 
-        if user.ProfilePictureId:
-            profilePic = db.query(Attachment).filter(
-                Attachment.Id == user.ProfilePictureId,
-                Attachment.IsDeleted == False
-            ).first()
-
-        if profilePic:
-            baseUrl = "http://clabsql.clamv.constructor.university/~mabaszada/"
-            fileName = os.path.basename(profilePic.FilePath)
-            userSchema.ProfilePicture = profilePic
-            userSchema.ProfilePictureUrl = f"{baseUrl}{fileName}"
+        if user.ProfilePicture is None or user.ProfilePicture.IsDeleted:
+            userSchema.ProfilePicture = None
+        else:
+            userSchema.ProfilePictureUrl = userSchema.ProfilePicture.DownloadUrl
 
         return userSchema
     
@@ -119,33 +152,10 @@ class UserRepository:
         file: UploadFile,
         currentUser: User
     ):
-        tempLocalPath = os.path.join("temp_uploads", file.filename)
-        os.makedirs("temp_uploads", exist_ok=True)
-
-        with open(tempLocalPath, "wb") as buffer:
-            buffer.write(file.file.read())
-
-        remotePath = UploadToUniServer(tempLocalPath, file.filename)
-        fileSize = os.path.getsize(tempLocalPath)
-        os.remove(tempLocalPath)
-
-        attachment = Attachment(
-            FileName=file.filename,
-            FileType=file.content_type,
-            FileSize=fileSize,
-            FilePath=remotePath.replace("/home/mabaszada/", "/"),
-            EntityType=AttachmentEntityType.USER,
-            EntityId=currentUser.Id,
-            OwnerId=currentUser.Id,
-            ProjectId=None 
-        )
-
-        db.add(attachment)
-        db.commit()
-        db.refresh(attachment)
+        attachment = FileUpload(db, file, AttachmentEntityType.USER, currentUser.Id, None, currentUser.Id)
+        StoreStagedUpload(db, attachment)
 
         currentUser.ProfilePictureId = attachment.Id
 
-        db.commit()
-        db.refresh(currentUser)
+        db.flush()
         return attachment
\ No newline at end of file
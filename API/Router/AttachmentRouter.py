@@ -1,24 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, UploadFile, File, Form
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from Dependencies.db import GetDb
-from Schemas.AttachmentSchema import AttachmentCreateSchema, AttachmentResponseSchema
+from Schemas.AttachmentSchema import AttachmentCreateSchema, AttachmentResponseSchema, AttachmentStatusResponse
 from Models.Attachment import AttachmentEntityType
 from Services import AttachmentService
-from Dependencies.auth import GetCurrentUser
+from Core.pagination import PageParams, PageResponse
+from Dependencies.auth import GetCurrentPrincipal, Principal
 
 router = APIRouter(prefix="/attachments", tags=["Attachments"])
-UPLOAD_DIR = "/home/mabaszada/public_html"
 
-@router.post("/upload", response_model=AttachmentResponseSchema, status_code=status.HTTP_201_CREATED)
+@router.post("/upload", response_model=AttachmentResponseSchema, status_code=status.HTTP_202_ACCEPTED, summary="Stage a file; it is transferred to storage in the background")
 def UploadAttachment(
     file: UploadFile = File(...),
     entityType: AttachmentEntityType = Form(...),
     entityId: str = Form(...),
     projectId: str = Form(...),
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
     return AttachmentService.FileUpload(
         db=db,
@@ -32,17 +32,17 @@ def UploadAttachment(
 @router.post("/", response_model=AttachmentResponseSchema, status_code=status.HTTP_201_CREATED)
 def AddAttachment(
     attachment: AttachmentCreateSchema,
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
-    return AttachmentService.AddAttachment(db, attachment, currentUser)
+    return AttachmentService.AddAttachment(db, attachment, currentUser.Id)
 
 
 @router.delete("/{attachmentId}", status_code=status.HTTP_204_NO_CONTENT)
 def DeleteAttachment(
     attachmentId: str,
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
     success = AttachmentService.DeleteAttachment(db, attachmentId, currentUser.Id)
     if not success:
@@ -52,10 +52,19 @@ def DeleteAttachment(
 @router.get("/{attachmentId}", response_model=AttachmentResponseSchema)
 def GetAttachmentById(
     attachmentId: str,
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
-    return AttachmentService.GetAttachmentById(db, attachmentId)
+    return AttachmentService.GetAttachmentById(db, attachmentId, currentUser.Id)
+
+
+@router.get("/{attachmentId}/status", response_model=AttachmentStatusResponse, summary="Upload status: Pending, Ready or Failed")
+def GetUploadStatus(
+    attachmentId: str,
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
+):
+    return AttachmentService.GetUploadStatus(db, attachmentId, currentUser.Id)
 
 
 @router.get("/entity/{projectId}/{entityType}/{entityId}", response_model=List[AttachmentResponseSchema])
@@ -63,25 +72,38 @@ def GetAttachmentsByEntity(
     projectId: str,
     entityType: AttachmentEntityType,
     entityId: str,
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
-    return AttachmentService.GetAttachmentsByEntity(db, projectId, entityType, entityId)
+    return PageResponse(response, AttachmentService.GetAttachmentsByEntity(db, projectId, entityType, entityId, page, currentUser.Id))
 
 
 @router.get("/type/{projectId}/{entityType}", response_model=List[AttachmentResponseSchema])
 def GetAttachmentsByEntityType(
     projectId: str,
     entityType: AttachmentEntityType,
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
-    return AttachmentService.GetAttachmentsByEntityType(db, projectId, entityType)
+    return PageResponse(response, AttachmentService.GetAttachmentsByEntityType(db, projectId, entityType, page, currentUser.Id))
 
 @router.get("/download/{attachmentId}")
 def DownloadAttachment(
     attachmentId: str,
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
+):
+    return AttachmentService.DownloadAttachment(db, attachmentId, currentUser.Id)
+
+
+@router.get("/files/{token}", summary="Stream a file through a signed download link; supports Range requests")
+def StreamDownload(
+    token: str,
+    rangeHeader: Optional[str] = Header(None, alias="Range"),
+    ifNoneMatch: Optional[str] = Header(None, alias="If-None-Match")
 ):
-    return AttachmentService.DownloadAttachment(db, attachmentId)
+    return AttachmentService.StreamDownload(token, rangeHeader, ifNoneMatch)
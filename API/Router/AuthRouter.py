@@ -1,16 +1,19 @@
 from fastapi import APIRouter, Depends
-from Services.AuthService import AuthService
-from Services.UserService import UserService
-from Schemas.UserSchema import AddUserSchema
+from sqlalchemy.ext.asyncio import AsyncSession
+from Dependencies.db import GetAsyncDb
+from Services.AuthService import LoginUserAsync
+from Services.UserService import CreateUserAsync
+from Schemas.UserSchema import AddUserSchema, UserResponseSchema
 from Schemas.AuthSchema import LoginSchema
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-@router.post("/register")
-def RegisterUser(userData: AddUserSchema, userService: UserService = Depends()):
-    return userService.CreateUser(userData)
+# bcrypt runs in the password pool; these endpoints await it instead of holding a request thread
+
+@router.post("/register", response_model=UserResponseSchema)
+async def RegisterUser(userData: AddUserSchema, db: AsyncSession = Depends(GetAsyncDb, scope="function")):
+    return await CreateUserAsync(db, userData)
 
 @router.post("/login")
-def LoginUser(userData: LoginSchema, authService: AuthService = Depends()):
-    print("Received login request:", userData)
-    return authService.LoginUser(userData)
+async def LoginUser(userData: LoginSchema, db: AsyncSession = Depends(GetAsyncDb, scope="function")):
+    return await LoginUserAsync(db, userData)
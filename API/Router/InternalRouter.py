@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends
+
+from Db.pool_metrics import poolMetrics, asyncPoolMetrics
+from Core.password_pool import passwordPool
+from Core.upload_queue import uploadQueue
+from Storage import GetStorage
+from Dependencies.auth import RequireInternalToken
+
+router = APIRouter(prefix="/internal", tags=["Internal"], dependencies=[Depends(RequireInternalToken)])
+
+@router.get("/db-pool", summary="Connection pool usage and wait-time histograms")
+def GetDbPoolStats():
+    return poolMetrics.Snapshot()
+
+@router.get("/db-pool/async", summary="Async engine pool usage and wait-time histograms")
+def GetAsyncDbPoolStats():
+    if asyncPoolMetrics.engine is None:
+        return {"pool_class": None, "detail": "Async engine not started yet"}
+    return asyncPoolMetrics.Snapshot()
+
+@router.get("/password-pool", summary="bcrypt worker pool queue depth and latency")
+def GetPasswordPoolStats():
+    return passwordPool.Snapshot()
+
+@router.get("/storage-pool", summary="Storage backend and SFTP session pool usage")
+def GetStoragePoolStats():
+    return GetStorage().Snapshot()
+
+@router.get("/upload-queue", summary="Background upload workers, queue depth and retries")
+def GetUploadQueueStats():
+    return uploadQueue.Snapshot()
@@ -1,20 +1,26 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from uuid import UUID
 
-from Models import User
-from Schemas.ProjectSchema import ProjectCreate, ProjectOut, ProjectUpdate
-from Schemas.TaskSchema import TaskResponse
-from Services.ProjectService import ProjectService
-from Dependencies.auth import GetCurrentUser
+from Schemas.ProjectSchema import (
+    ProjectCreate, ProjectOut, ProjectUpdate, ProjectMemberOut, ProjectMemberResponse, ProjectOverview,
+    AddProjectMembers, RemoveProjectMembers
+)
+from Schemas.TeamSchema import TeamResponse, MembersBulkResult
+from Schemas.TaskSchema import TaskResponse, TaskFilter
+from Core.pagination import PageParams, PageResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from Services.ProjectService import ProjectService, GetProjectTasksAsync
+from Dependencies.auth import GetCurrentPrincipal, GetCurrentPrincipalAsync, Principal
+from Dependencies.db import GetAsyncDb
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 @router.post("/create", response_model=ProjectOut)
 def CreateProject(
     projectData: ProjectCreate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
     return projectService.CreateProject(currentUser.Id, projectData)
@@ -22,7 +28,7 @@ def CreateProject(
 @router.put("/update")
 def UpdateProject(
     projectData: ProjectUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
     return projectService.UpdateProject(projectData)
@@ -30,24 +36,33 @@ def UpdateProject(
 @router.delete("/{projectId}/delete", status_code=status.HTTP_200_OK)
 def DeleteProject(
     projectId: str,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
     return projectService.SoftDeleteProject(currentUser.Id, projectId)
 
+@router.get("/{projectId}/overview", response_model=ProjectOverview, response_model_exclude_unset=True, summary="Everything a project page needs in one call")
+def GetProjectOverview(
+    projectId: UUID,
+    include: Optional[str] = Query(None, description="Comma separated sections: Members, Teams, Tasks, Risks, Budget, Scope. Defaults to all."),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    projectService: ProjectService = Depends(ProjectService)
+):
+    return projectService.GetProjectOverview(currentUser.Id, projectId, include)
+
 @router.get("/{projectId}", response_model=ProjectOut, summary="Get a project by ID")
 def GetProjectById(
     projectId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
     return projectService.GetProjectById(projectId)
 
-@router.post("/{project_id}/add-member", status_code=status.HTTP_201_CREATED)
+@router.post("/{projectId}/add-member", response_model=ProjectMemberOut, status_code=status.HTTP_201_CREATED)
 def AddMember(
     projectId: UUID,
     memberId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)):
     return projectService.AddProjectMember(currentUser.Id, projectId, memberId)
 
@@ -55,41 +70,62 @@ def AddMember(
 def RemoveMember(
     projectId: UUID,
     memberId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    projectService: ProjectService = Depends(ProjectService)
+):
+    return projectService.SoftDeleteProjectMember(currentUser.Id, projectId, memberId)
+
+@router.post("/{projectId}/add-members", response_model=MembersBulkResult, summary="Add many users to a project")
+def AddMembers(
+    projectId: UUID,
+    membersData: AddProjectMembers,
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    projectService: ProjectService = Depends(ProjectService)
+):
+    return projectService.AddProjectMembers(currentUser.Id, projectId, membersData)
+
+@router.post("/{projectId}/remove-members", response_model=MembersBulkResult, summary="Remove many members from a project")
+def RemoveMembers(
+    projectId: UUID,
+    membersData: RemoveProjectMembers,
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
-    return projectService.SoftDeleteProjectMember(projectId, memberId)
+    return projectService.SoftDeleteProjectMembers(currentUser.Id, projectId, membersData)
 
-@router.get("/{projectId}/members", summary="Get all active project members")
+@router.get("/{projectId}/members", response_model=List[ProjectMemberResponse], summary="Get all active project members")
 def GetProjectMembers(
     projectId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
     return projectService.GetProjectMembers(projectId)
 
 
-@router.get("/{projectId}/teams", summary="Get all active project teams")
+@router.get("/{projectId}/teams", response_model=List[TeamResponse], summary="Get all active project teams")
 def GetProjectTeams(
     projectId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
     return projectService.GetProjectTeams(projectId)
 
 @router.get("/{projectId}/tasks", response_model=List[TaskResponse], summary="Get all tasks of a project")
-def GetProjectTasks(
+async def GetProjectTasks(
     projectId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
-    service: ProjectService = Depends()
+    response: Response,
+    filters: TaskFilter = Depends(),
+    page: PageParams = Depends(),
+    currentUser: Principal = Depends(GetCurrentPrincipalAsync),
+    db: AsyncSession = Depends(GetAsyncDb, scope="function")
 ):
-    return service.GetProjectTasks(projectId)
+    return PageResponse(response, await GetProjectTasksAsync(db, currentUser.Id, projectId, filters, page))
 
 @router.put("/{projectId}/update", response_model=ProjectOut)
 def UpdateProject(
     projectId: UUID,
     projectData: ProjectUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     projectService: ProjectService = Depends(ProjectService)
 ):
     """Update an existing project. Only the project owner can perform this action."""
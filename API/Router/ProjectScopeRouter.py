@@ -38,43 +38,43 @@ from Schemas.ProjectScopeSchema import (
 router = APIRouter(prefix="/scope", tags=["Project Scope"])
 
 @router.post("/add/scope-management/{projectId}")
-def AddScopeManagementPlan(projectId: str, data: ScopeManagementPlanSchema, db: Session = Depends(GetDb)):
+def AddScopeManagementPlan(projectId: str, data: ScopeManagementPlanSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).AddScopeManagementPlan(projectId, data)
 
 @router.post("/add/requirement-management/{projectId}")
-def AddRequirementManagementPlan(projectId: str, data: RequirementManagementPlanSchema, db: Session = Depends(GetDb)):
+def AddRequirementManagementPlan(projectId: str, data: RequirementManagementPlanSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).AddRequirementManagementPlan(projectId, data)
 
 @router.post("/add/requirement-document/{projectId}")
-def AddRequirementDocument(projectId: str, data: RequirementDocumentSchema, db: Session = Depends(GetDb)):
+def AddRequirementDocument(projectId: str, data: RequirementDocumentSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).AddRequirementDocument(projectId, data)
 
 @router.post("/add/scope-statement/{projectId}")
-def AddScopeStatement(projectId: str, data: ProjectScopeStatementSchema, db: Session = Depends(GetDb)):
+def AddScopeStatement(projectId: str, data: ProjectScopeStatementSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).AddScopeStatement(projectId, data)
 
 @router.post("/add/wbs/{projectId}")
-def AddWorkBreakdownStructure(projectId: str, data: WorkBreakdownStructureSchema, db: Session = Depends(GetDb)):
+def AddWorkBreakdownStructure(projectId: str, data: WorkBreakdownStructureSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).AddWorkBreakdownStructure(projectId, data)
 
 @router.put("/edit/scope-management/{projectId}")
-def EditScopeManagementPlan(projectId: str, data: ScopeManagementPlanUpdateSchema, db: Session = Depends(GetDb)):
+def EditScopeManagementPlan(projectId: str, data: ScopeManagementPlanUpdateSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).EditScopeManagementPlan(projectId, data)
 
 @router.put("/edit/requirement-management/{projectId}")
-def EditRequirementManagementPlan(projectId: str, data: RequirementManagementPlanUpdateSchema, db: Session = Depends(GetDb)):
+def EditRequirementManagementPlan(projectId: str, data: RequirementManagementPlanUpdateSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).EditRequirementManagementPlan(projectId, data)
 
 @router.put("/edit/requirement-document/{projectId}")
-def EditRequirementDocument(projectId: str, data: RequirementDocumentUpdateSchema, db: Session = Depends(GetDb)):
+def EditRequirementDocument(projectId: str, data: RequirementDocumentUpdateSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).EditRequirementDocument(projectId, data)
 
 @router.put("/edit/scope-statement/{projectId}")
-def EditScopeStatement(projectId: str, data: ProjectScopeStatementUpdateSchema, db: Session = Depends(GetDb)):
+def EditScopeStatement(projectId: str, data: ProjectScopeStatementUpdateSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).EditScopeStatement(projectId, data)
 
 @router.put("/edit/wbs/{projectId}")
-def EditWorkBreakdownStructure(projectId: str, data: WorkBreakdownStructureUpdateSchema, db: Session = Depends(GetDb)):
+def EditWorkBreakdownStructure(projectId: str, data: WorkBreakdownStructureUpdateSchema, db: Session = Depends(GetDb, scope="function")):
     return ProjectScopeService(db).EditWorkBreakdownStructure(projectId, data)
 
 @router.get("/plan/{projectId}", response_model=ScopeManagementPlanSchema)
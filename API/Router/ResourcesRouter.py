@@ -1,90 +1,105 @@
-from fastapi import APIRouter, Depends, status
+from typing import List
+
+from fastapi import APIRouter, Depends, Response, status
 from uuid import UUID
 
-from Models import User
-from Services.ResourceService import ResourceService
-from Dependencies.auth import GetCurrentUser
+from sqlalchemy.ext.asyncio import AsyncSession
+from Services.ResourceService import ResourceService, GetAllResourcesByProjectIdAsync
+from Dependencies.auth import GetCurrentPrincipal, GetCurrentPrincipalAsync, Principal
+from Dependencies.db import GetAsyncDb
 from Schemas.ResourceSchema import (
-    ResourceBase, ResourceUpdate,
-    ActivityResourceBase, ActivityResourceUpdate,
-    ResourcePlanBase, ResourcePlanUpdate, ActivityResourceResponse
+    ResourceBase, ResourceUpdate, ResourceRead,
+    ActivityResourceBase, ActivityResourceBulkCreate, ActivityResourceUpdate,
+    ResourcePlanBase, ResourcePlanUpdate, ResourcePlanRead, ActivityResourceResponse, ResourceFilter
 )
+from Core.pagination import PageParams, PageResponse
 
 router = APIRouter(prefix="/resources", tags=["Resources"])
 
-@router.post("/create", status_code=status.HTTP_201_CREATED)
+@router.post("/create", response_model=ResourceRead, status_code=status.HTTP_201_CREATED)
 def CreateResource(
     resourceData: ResourceBase,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.CreateResource(currentUser.Id, resourceData)
 
 
-@router.put("/{resourceId}/update")
+@router.put("/{resourceId}/update", response_model=ResourceRead)
 def UpdateResource(
     resourceId: str,
     updateData: ResourceUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.UpdateResource(currentUser.Id, resourceId, updateData)
 
 
-@router.delete("/{resourceId}/delete", status_code=status.HTTP_200_OK)
+@router.delete("/{resourceId}/delete", response_model=ResourceRead, status_code=status.HTTP_200_OK)
 def SoftDeleteResource(
     resourceId: str,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.SoftDeleteResource(currentUser.Id, resourceId)
 
 
-@router.get("/project/{projectId}")
-def GetAllResourcesByProject(
+@router.get("/project/{projectId}", response_model=List[ResourceRead])
+async def GetAllResourcesByProject(
     projectId: str,
-    currentUser: User = Depends(GetCurrentUser),
-    service: ResourceService = Depends(ResourceService)
+    response: Response,
+    filters: ResourceFilter = Depends(),
+    page: PageParams = Depends(),
+    currentUser: Principal = Depends(GetCurrentPrincipalAsync),
+    db: AsyncSession = Depends(GetAsyncDb, scope="function")
 ):
-    return service.GetAllResourcesByProjectId(projectId)
+    return PageResponse(response, await GetAllResourcesByProjectIdAsync(db, currentUser.Id, projectId, filters, page))
 
 
-@router.get("/{resourceId}")
+@router.get("/{resourceId}", response_model=ResourceRead)
 def GetResourceById(
     resourceId: str,
     service: ResourceService = Depends(ResourceService)
 ):
     return service.GetResourceById(resourceId)
 
-@router.post("/assign", status_code=status.HTTP_201_CREATED)
+@router.post("/assign", response_model=ActivityResourceResponse, status_code=status.HTTP_201_CREATED)
 def AssignResourceToTask(
     assignmentData: ActivityResourceBase,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.CreateActivityResource(assignmentData)
 
+@router.post("/assign/bulk", response_model=List[ActivityResourceResponse], status_code=status.HTTP_201_CREATED)
+def AssignResourcesToTasks(
+    bulkData: ActivityResourceBulkCreate,
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    service: ResourceService = Depends(ResourceService)
+):
+    return service.CreateActivityResources(currentUser.Id, bulkData)
+
 
 @router.put("/assignments/{assignmentId}/update", response_model=ActivityResourceResponse)
 def UpdateActivityResource(
     assignmentId: str,
     updateData: ActivityResourceUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.UpdateActivityResource(assignmentId, updateData)
 
 
-@router.delete("/assignments/{assignmentId}/delete", status_code=status.HTTP_200_OK)
+@router.delete("/assignments/{assignmentId}/delete", response_model=ActivityResourceResponse, status_code=status.HTTP_200_OK)
 def SoftDeleteActivityResource(
     assignmentId: str,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.SoftDeleteActivityResource(assignmentId)
 
 
-@router.get("/assignments/{assignmentId}")
+@router.get("/assignments/{assignmentId}", response_model=ActivityResourceResponse)
 def GetActivityResourceById(
     assignmentId: str,
     service: ResourceService = Depends(ResourceService)
@@ -92,42 +107,42 @@ def GetActivityResourceById(
     return service.GetActivityResourceById(assignmentId)
 
 
-@router.get("/task/{taskId}/assignments")
+@router.get("/task/{taskId}/assignments", response_model=List[ActivityResourceResponse])
 def GetAllResourcesAssignedToTask(
     taskId: str,
     service: ResourceService = Depends(ResourceService)
 ):
     return service.GetAllActivityResourcesByTaskId(taskId)
 
-@router.post("/plan/create", status_code=status.HTTP_201_CREATED)
+@router.post("/plan/create", response_model=ResourcePlanRead, status_code=status.HTTP_201_CREATED)
 def CreateResourcePlan(
     planData: ResourcePlanBase,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.CreateResourcePlan(currentUser.Id, planData)
 
 
-@router.put("/plan/{planId}/update")
+@router.put("/plan/{planId}/update", response_model=ResourcePlanRead)
 def UpdateResourcePlan(
     planId: str,
     updateData: ResourcePlanUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.UpdateResourcePlan(currentUser.Id, planId, updateData)
 
 
-@router.delete("/plan/{planId}/delete", status_code=status.HTTP_200_OK)
+@router.delete("/plan/{planId}/delete", response_model=ResourcePlanRead, status_code=status.HTTP_200_OK)
 def SoftDeleteResourcePlan(
     planId: str,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: ResourceService = Depends(ResourceService)
 ):
     return service.SoftDeleteResourcePlan(currentUser.Id, planId)
 
 
-@router.get("/plan/{planId}")
+@router.get("/plan/{planId}", response_model=ResourcePlanRead)
 def GetResourcePlanById(
     planId: str,
     service: ResourceService = Depends(ResourceService)
@@ -135,7 +150,7 @@ def GetResourcePlanById(
     return service.GetResourcePlanById(planId)
 
 
-@router.get("/project/{projectId}/plans")
+@router.get("/project/{projectId}/plans", response_model=List[ResourcePlanRead])
 def GetAllResourcePlansForProject(
     projectId: str,
     service: ResourceService = Depends(ResourceService)
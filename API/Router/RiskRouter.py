@@ -1,30 +1,34 @@
-from fastapi import APIRouter, Depends, status
+from typing import List
+
+from fastapi import APIRouter, Depends, Response, status
 from uuid import UUID
 
-from Models import User
 from Schemas.RiskSchema import (
-    RiskBase, RiskUpdate,
-    RiskAnalysisBase, RiskAnalysisUpdate,
-    RiskResponsePlanBase, RiskResponsePlanUpdate
+    RiskBase, RiskUpdate, RiskRead,
+    RiskAnalysisBase, RiskAnalysisUpdate, RiskAnalysisRead,
+    RiskResponsePlanBase, RiskResponsePlanUpdate, RiskResponsePlanRead, RiskFilter
 )
-from Services.RiskService import RiskService
-from Dependencies.auth import GetCurrentUser
+from Core.pagination import PageParams, PageResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from Services.RiskService import RiskService, GetAllRisksAsync
+from Dependencies.auth import GetCurrentPrincipal, GetCurrentPrincipalAsync, Principal
+from Dependencies.db import GetAsyncDb
 
 router = APIRouter(prefix="/risks", tags=["Risks"])
 
-@router.post("/create", status_code=status.HTTP_201_CREATED)
+@router.post("/create", response_model=RiskRead, status_code=status.HTTP_201_CREATED)
 def CreateRisk(
     riskData: RiskBase,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.CreateRisk(currentUser.Id, riskData)
 
-@router.put("/{riskId}/update")
+@router.put("/{riskId}/update", response_model=RiskRead)
 def UpdateRisk(
     riskId: UUID,
     riskData: RiskUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.UpdateRisk(currentUser.Id, riskId, riskData)
@@ -33,97 +37,101 @@ def UpdateRisk(
 def DeleteRisk(
     riskId: UUID,
     projectId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.SoftDeleteRisk(currentUser.Id, riskId, projectId)
 
-@router.get("/{riskId}", summary="Get risk by ID")
+@router.get("/{riskId}", response_model=RiskRead, summary="Get risk by ID")
 def GetRiskById(
     riskId: UUID,
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.GetRiskById(riskId)
 
-@router.get("/project/{projectId}", summary="Get all risks by projectId")
-def GetAllRisksByProject(
+@router.get("/project/{projectId}", response_model=List[RiskRead], summary="Get all risks by projectId")
+async def GetAllRisksByProject(
     projectId: str,
-    riskService: RiskService = Depends(RiskService)
+    response: Response,
+    filters: RiskFilter = Depends(),
+    page: PageParams = Depends(),
+    currentUser: Principal = Depends(GetCurrentPrincipalAsync),
+    db: AsyncSession = Depends(GetAsyncDb, scope="function")
 ):
-    return riskService.GetAllRisks(projectId)
+    return PageResponse(response, await GetAllRisksAsync(db, currentUser.Id, projectId, filters, page))
 
-@router.post("/analysis/create", status_code=status.HTTP_201_CREATED)
+@router.post("/analysis/create", response_model=RiskAnalysisRead, status_code=status.HTTP_201_CREATED)
 def CreateRiskAnalysis(
     analysisData: RiskAnalysisBase,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.CreateRiskAnalysis(currentUser.Id, analysisData)
 
-@router.put("/analysis/{analysisId}/update")
+@router.put("/analysis/{analysisId}/update", response_model=RiskAnalysisRead)
 def UpdateRiskAnalysis(
     analysisId: UUID,
     analysisData: RiskAnalysisUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.UpdateRiskAnalysis(currentUser.Id, analysisId, analysisData)
 
-@router.delete("/analysis/{analysisId}/delete", status_code=status.HTTP_200_OK)
+@router.delete("/analysis/{analysisId}/delete", response_model=RiskAnalysisRead, status_code=status.HTTP_200_OK)
 def DeleteRiskAnalysis(
     analysisId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.SoftDeleteRiskAnalysis(currentUser.Id, analysisId)
 
-@router.get("/analysis/{analysisId}")
+@router.get("/analysis/{analysisId}", response_model=RiskAnalysisRead)
 def GetRiskAnalysisById(
     analysisId: UUID,
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.GetRiskAnalysisById(analysisId)
 
-@router.get("/{riskId}/analyses")
+@router.get("/{riskId}/analyses", response_model=List[RiskAnalysisRead])
 def GetAllRiskAnalyses(
     riskId: UUID,
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.GetAllRiskAnalysesByRiskId(riskId)
 
-@router.post("/response/create", status_code=status.HTTP_201_CREATED)
+@router.post("/response/create", response_model=RiskResponsePlanRead, status_code=status.HTTP_201_CREATED)
 def CreateRiskResponsePlan(
     responseData: RiskResponsePlanBase,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.CreateRiskResponsePlan(currentUser.Id, responseData)
 
-@router.put("/response/{responseId}/update")
+@router.put("/response/{responseId}/update", response_model=RiskResponsePlanRead)
 def UpdateRiskResponsePlan(
     responseId: UUID,
     responseData: RiskResponsePlanUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.UpdateRiskResponsePlan(currentUser.Id, responseId, responseData)
 
-@router.delete("/response/{responseId}/delete", status_code=status.HTTP_200_OK)
+@router.delete("/response/{responseId}/delete", response_model=RiskResponsePlanRead, status_code=status.HTTP_200_OK)
 def DeleteRiskResponsePlan(
     responseId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.SoftDeleteRiskResponsePlan(currentUser.Id, responseId)
 
-@router.get("/response/{responseId}")
+@router.get("/response/{responseId}", response_model=RiskResponsePlanRead)
 def GetRiskResponsePlanById(
     responseId: UUID,
     riskService: RiskService = Depends(RiskService)
 ):
     return riskService.GetRiskResponsePlanById(responseId)
 
-@router.get("/{riskId}/responses")
+@router.get("/{riskId}/responses", response_model=List[RiskResponsePlanRead])
 def GetAllRiskResponsePlans(
     riskId: UUID,
     riskService: RiskService = Depends(RiskService)
@@ -1,24 +1,52 @@
-from fastapi import APIRouter, Depends
-from typing import List, Union
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional, Union
 from uuid import UUID
-from Schemas.TaskSchema import TaskCreate, TaskUpdate, TaskResponse, TaskTreeResponse
-from Services.TaskService import TaskService
-from Dependencies.auth import GetCurrentUser
-from Models import User
+from Core.pagination import PageParams, PageResponse
+from Schemas.TaskSchema import (
+    TaskCreate, TaskUpdate, TaskFilter, TaskResponse, TaskTreeResponse, TaskTreeNodeResponse,
+    TaskBulkCreate, TaskBulkUpdate, TaskBulkResponse
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from Services.TaskService import TaskService, GetAllTasksAsync
+from Dependencies.auth import GetCurrentPrincipal, Principal
+from Dependencies.db import GetAsyncDb
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 @router.post("/", response_model=TaskResponse)
 def Add(
     myData: TaskCreate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     taskService: TaskService = Depends(TaskService)
 ):
     return taskService.Add(currentUser.Id, myData)
 
+@router.post("/bulk", response_model=TaskBulkResponse)
+def AddMany(
+    myData: TaskBulkCreate,
+    atomic: bool = Query(False, description="Reject the whole batch if any row fails validation"),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    taskService: TaskService = Depends(TaskService)
+):
+    return taskService.AddMany(currentUser.Id, myData, atomic)
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+def UpdateMany(
+    myData: TaskBulkUpdate,
+    atomic: bool = Query(False, description="Reject the whole batch if any row fails validation"),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    taskService: TaskService = Depends(TaskService)
+):
+    return taskService.UpdateMany(currentUser.Id, myData, atomic)
+
 @router.get("/", response_model=List[TaskResponse])
-def GetAll(taskService: TaskService = Depends(TaskService)):
-    return taskService.GetAll()
+async def GetAll(
+    response: Response,
+    filters: TaskFilter = Depends(),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(GetAsyncDb, scope="function")
+):
+    return PageResponse(response, await GetAllTasksAsync(db, filters, page))
 
 @router.get("/{taskId}", response_model=TaskResponse)
 def GetById(taskId: UUID, taskService: TaskService = Depends(TaskService)):
@@ -28,7 +56,7 @@ def GetById(taskId: UUID, taskService: TaskService = Depends(TaskService)):
 def Update(
     taskId: UUID,
     myData: TaskUpdate,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     taskService: TaskService = Depends(TaskService)
 ):
     return taskService.Update(taskId, myData, currentUser.Id)
@@ -36,23 +64,25 @@ def Update(
 @router.delete("/{taskId}", response_model=dict)
 def Remove(
     taskId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     taskService: TaskService = Depends(TaskService)
 ):
-    return taskService.Remove(currentUser.Id, taskId)
+    return taskService.SoftDeleteTask(currentUser.Id, taskId)
 
 @router.get("/{taskId}/subtasks", response_model=List[TaskResponse])
 def GetSubtasks(
     taskId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     taskService: TaskService = Depends(TaskService)
 ):
     return taskService.GetSubtasks(taskId)
 
-@router.get("/{taskId}/tree", response_model=TaskTreeResponse, summary="Get full task tree including all nested subtasks")
+@router.get("/{taskId}/tree", response_model=Union[TaskTreeResponse, List[TaskTreeNodeResponse]], summary="Get full task tree including all nested subtasks")
 def GetTaskTree(
     taskId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    maxDepth: Optional[int] = Query(None, ge=0, description="Deepest subtask level to include, root is level 0"),
+    flat: bool = Query(False, description="Return the subtree as a flat list ordered by depth"),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     taskService: TaskService = Depends(TaskService)
 ):
-    return taskService.GetTaskTree(taskId)
+    return taskService.GetTaskTree(taskId, maxDepth, flat)
@@ -1,11 +1,14 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
 from typing import List
 
-from Dependencies.auth import GetCurrentUser
-from Models import User
-from Schemas.TeamSchema import TeamCreate, TeamResponse, TeamUpdate, AddTeamMember, RemoveTeamMember
+from Dependencies.auth import GetCurrentPrincipal, Principal
+from Schemas.TaskSchema import TaskResponse
+from Schemas.TeamSchema import (
+    TeamCreate, TeamResponse, TeamUpdate, AddTeamMember, AddTeamMembers, RemoveTeamMembers, TeamFilter, MembersBulkResult
+)
+from Core.pagination import PageParams, PageResponse
 from Services.TeamService import TeamService
 
 router = APIRouter(
@@ -16,18 +19,24 @@ router = APIRouter(
 
 @router.post("/", response_model=TeamResponse, summary="Create a new team")
 def CreateTeam(teamData: TeamCreate,
-                currentUser: User = Depends(GetCurrentUser),
+                currentUser: Principal = Depends(GetCurrentPrincipal),
                 service: TeamService = Depends()):
     return service.AddTeam(currentUser.Id, teamData.ProjectId, teamData)
 
 @router.get("/", response_model=List[TeamResponse], summary="Get all teams")
-def ListTeams(currentUser: User = Depends(GetCurrentUser), service: TeamService = Depends()):
-    return service.GetAllTeams()
+def ListTeams(
+    response: Response,
+    filters: TeamFilter = Depends(),
+    page: PageParams = Depends(),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    service: TeamService = Depends()
+):
+    return PageResponse(response, service.GetAllTeams(filters, page))
 
-@router.get("/{team_id}", response_model=TeamResponse, summary="Get a specific team")
+@router.get("/{teamId}", response_model=TeamResponse, summary="Get a specific team")
 def GetTeam(teamId: UUID,
             service: TeamService = Depends(),
-            currentUser: User = Depends(GetCurrentUser)):
+            currentUser: Principal = Depends(GetCurrentPrincipal)):
     team = service.GetTeamById(teamId)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
@@ -36,13 +45,13 @@ def GetTeam(teamId: UUID,
 @router.put("/{teamId}", response_model=TeamResponse, summary="Update a team")
 def UpdateTeam(teamId: UUID,
                 teamData: TeamUpdate,
-                currentUser: User = Depends(GetCurrentUser),
+                currentUser: Principal = Depends(GetCurrentPrincipal),
                 service: TeamService = Depends()):
     return service.UpdateTeam(currentUser.Id, teamId, teamData)
 
-@router.delete("/{team_id}", status_code=204, summary="Soft delete a team")
+@router.delete("/{teamId}", status_code=204, summary="Soft delete a team")
 def DeleteTeam(teamId: UUID,
-                currentUser: User = Depends(GetCurrentUser),
+                currentUser: Principal = Depends(GetCurrentPrincipal),
                 service: TeamService = Depends()):
     success = service.RemoveTeam(currentUser.Id, teamId)
     if not success:
@@ -51,25 +60,42 @@ def DeleteTeam(teamId: UUID,
 @router.post("/members", summary="Add a member to a team")
 def AddTeamMember(
     addTeamMemberSchema: AddTeamMember,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: TeamService = Depends()
 ):
     return service.AddMember(currentUser.Id, addTeamMemberSchema)
 
-@router.delete("/{team_id}/members/{user_id}", summary="Remove a member from a team")
+@router.post("/{teamId}/add-members", response_model=MembersBulkResult, summary="Add many members to a team")
+def AddTeamMembers(
+    teamId: UUID,
+    membersData: AddTeamMembers,
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    service: TeamService = Depends()
+):
+    return service.AddMembers(currentUser.Id, teamId, membersData)
+
+@router.post("/{teamId}/remove-members", response_model=MembersBulkResult, summary="Remove many members from a team")
+def RemoveTeamMembers(
+    teamId: UUID,
+    membersData: RemoveTeamMembers,
+    currentUser: Principal = Depends(GetCurrentPrincipal),
+    service: TeamService = Depends()
+):
+    return service.RemoveMembers(currentUser.Id, teamId, membersData)
+
+@router.delete("/{teamId}/members/{userId}", summary="Remove a member from a team")
 def RemoveTeamMember(
-    removeTeamMemberSchema: RemoveTeamMember,
-    currentUser: User = Depends(GetCurrentUser),
+    teamId: UUID,
+    userId: UUID,
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: TeamService = Depends()
 ):
-    return service.RemoveMember(currentUser.Id,
-                                removeTeamMemberSchema.TeamId,
-                                removeTeamMemberSchema.UserIdToBeRemoved)
+    return service.RemoveMember(currentUser.Id, teamId, userId)
 
-@router.get("/{team_id}/tasks", summary="Get all tasks for a team")
+@router.get("/{teamId}/tasks", response_model=List[TaskResponse], summary="Get all tasks for a team")
 def GetTeamTasks(
     teamId: UUID,
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     service: TeamService = Depends()
 ):
     return service.GetTeamTasks(teamId)
\ No newline at end of file
@@ -1,73 +1,80 @@
-from fastapi import APIRouter, Depends, UploadFile, File, status
+from typing import List
+
+from fastapi import APIRouter, Depends, Response, UploadFile, File, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from Dependencies.db import GetDb
-from Dependencies.auth import GetCurrentUser
-from Models import User
-from Services.UserService import UserService
+from Dependencies.db import GetDb, GetAsyncDb
+from Dependencies.auth import GetCurrentPrincipal, Principal
+from Services.UserService import UserService, UpdatePasswordAsync
 from Schemas.UserSchema import UpdatePasswordSchema, UserResponseSchema
+from Schemas.TaskSchema import TaskFilter, TaskResponse
+from Schemas.ProjectSchema import ProjectSummary
+from Schemas.TeamSchema import TeamResponse
+from Schemas.AttachmentSchema import AttachmentStatusResponse
+from Core.pagination import PageParams, PageResponse
 
 router = APIRouter(
     prefix="/users",
     tags=["Users"]
 )
 
-@router.get("/{userId}/projects", summary="Get all projects of the user")
+@router.get("/{userId}/projects", response_model=List[ProjectSummary], summary="Get all projects of the user")
 def GetUserProjects(
     userId: UUID,
     userService: UserService = Depends(),):
     return userService.GetUserProjects(userId)
 
-@router.get("/{userId}/teams", summary="Get all teams of the user")
+@router.get("/{userId}/teams", response_model=List[TeamResponse], summary="Get all teams of the user")
 def GetUserTeams(
     userId: UUID,
     userService: UserService = Depends()):
     return userService.GetUserTeams(userId)
 
-@router.get("/projects", summary="Get all projects of the current user")
+@router.get("/projects", response_model=List[ProjectSummary], summary="Get all projects of the current user")
 def GetUserProjects(
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     userService: UserService = Depends()):
     return userService.GetUserProjects(currentUser.Id)
 
-@router.get("/teams", summary="Get all teams of the current user")
+@router.get("/teams", response_model=List[TeamResponse], summary="Get all teams of the current user")
 def GetUserTeams(
-    currentUser: User = Depends(GetCurrentUser),
+    currentUser: Principal = Depends(GetCurrentPrincipal),
     userService: UserService = Depends()):
     return userService.GetUserTeams(currentUser.Id)
 
-@router.get("/{userId}/tasks/assigned", summary="Get all tasks assigned to the user")
-def GetAssignedTasks(userId: UUID, userService: UserService = Depends()):
-    return userService.GetUserAssignedTasks(userId)
+@router.get("/{userId}/tasks/assigned", response_model=List[TaskResponse], summary="Get all tasks assigned to the user")
+def GetAssignedTasks(userId: UUID, response: Response, filters: TaskFilter = Depends(), page: PageParams = Depends(), userService: UserService = Depends()):
+    return PageResponse(response, userService.GetUserAssignedTasks(userId, filters, page))
 
-@router.get("/{userId}/tasks/created", summary="Get all tasks created by the user")
-def GetCreatedTasks(userId: UUID, userService: UserService = Depends()):
-    return userService.GetUserCreatedTasks(userId)
+@router.get("/{userId}/tasks/created", response_model=List[TaskResponse], summary="Get all tasks created by the user")
+def GetCreatedTasks(userId: UUID, response: Response, filters: TaskFilter = Depends(), page: PageParams = Depends(), userService: UserService = Depends()):
+    return PageResponse(response, userService.GetUserCreatedTasks(userId, filters, page))
 
-@router.get("/tasks/assigned", summary="Get all tasks assigned to current user")
-def GetAssignedTasksCurrent(currentUser: User = Depends(GetCurrentUser), userService: UserService = Depends()):
-    return userService.GetUserAssignedTasks(currentUser.Id)
+@router.get("/tasks/assigned", response_model=List[TaskResponse], summary="Get all tasks assigned to current user")
+def GetAssignedTasksCurrent(response: Response, filters: TaskFilter = Depends(), page: PageParams = Depends(), currentUser: Principal = Depends(GetCurrentPrincipal), userService: UserService = Depends()):
+    return PageResponse(response, userService.GetUserAssignedTasks(currentUser.Id, filters, page))
 
-@router.get("/tasks/created", summary="Get all tasks created by current user")
-def GetCreatedTasksCurrent(currentUser: User = Depends(GetCurrentUser), userService: UserService = Depends()):
-    return userService.GetUserCreatedTasks(currentUser.Id)
+@router.get("/tasks/created", response_model=List[TaskResponse], summary="Get all tasks created by current user")
+def GetCreatedTasksCurrent(response: Response, filters: TaskFilter = Depends(), page: PageParams = Depends(), currentUser: Principal = Depends(GetCurrentPrincipal), userService: UserService = Depends()):
+    return PageResponse(response, userService.GetUserCreatedTasks(currentUser.Id, filters, page))
 
-@router.post("/reset-password", summary="Change the forgetten password")
-def ResetPassword(request: UpdatePasswordSchema, userService: UserService = Depends()):
-    return userService.UpdatePassword(request.Email, request.NewPassword)
+@router.post("/reset-password", response_model=UserResponseSchema, summary="Change the forgetten password")
+async def ResetPassword(request: UpdatePasswordSchema, db: AsyncSession = Depends(GetAsyncDb, scope="function")):
+    return await UpdatePasswordAsync(db, request.Email, request.NewPassword)
 
 @router.get("/get-user", response_model=UserResponseSchema)
 def GetCurrentUserData(
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
     return UserService.GetCurrentUserData(db, currentUser)
 
-@router.post("/upload/profile-picture", status_code=status.HTTP_201_CREATED)
+@router.post("/upload/profile-picture", response_model=AttachmentStatusResponse, status_code=status.HTTP_201_CREATED)
 def UploadProfilePicture(
     file: UploadFile = File(...),
-    db: Session = Depends(GetDb),
-    currentUser: str = Depends(GetCurrentUser)
+    db: Session = Depends(GetDb, scope="function"),
+    currentUser: Principal = Depends(GetCurrentPrincipal)
 ):
     return UserService.UploadProfilePicture(
         db=db,
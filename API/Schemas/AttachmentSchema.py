@@ -1,7 +1,24 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
-from Models.Attachment import AttachmentEntityType
+from Models.Attachment import AttachmentEntityType, AttachmentStatus
+from Core.signed_urls import SignDownloadUrl
+
+
+class DownloadableSchema(BaseModel):
+    """
+    Adds a signed DownloadUrl to schemas that carry FileName, FileType, FileSize, FilePath, ContentHash and Status.
+    FilePath is only read to sign the URL and is left out of responses.
+    """
+
+    FilePath: str = Field(exclude=True)
+
+    @computed_field
+    @property
+    def DownloadUrl(self) -> Optional[str]:
+        if self.Status != AttachmentStatus.READY:
+            return None
+        return SignDownloadUrl(self.FilePath, self.FileName, self.FileType, self.FileSize, self.ContentHash)
 
 
 class AttachmentCreateSchema(BaseModel):
@@ -15,16 +32,26 @@ class AttachmentCreateSchema(BaseModel):
     ProjectId: str 
 
 
-class AttachmentResponseSchema(BaseModel):
+class AttachmentResponseSchema(DownloadableSchema):
     Id: str
     FileName: str
     FileType: Optional[str]
     FileSize: Optional[int]
-    FilePath: str
+    ContentHash: Optional[str] = None
+    Status: AttachmentStatus = AttachmentStatus.READY
     EntityType: AttachmentEntityType
     EntityId: str
     OwnerId: str
     UploadedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AttachmentStatusResponse(BaseModel):
+    Id: str
+    Status: AttachmentStatus
+    Attempts: int
+    Error: Optional[str] = None
+    FileSize: Optional[int]
+
+    model_config = ConfigDict(from_attributes=True)
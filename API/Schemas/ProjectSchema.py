@@ -1,9 +1,13 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
 from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
 
+from Schemas.UserSchema import UserSummarySchema
+from Schemas.TeamSchema import TeamResponse
+from Core.config import BULK_MAX_ITEMS
+
 
 class ProjectCreate(BaseModel):
     Name: str
@@ -60,4 +64,81 @@ class ProjectOut(BaseModel):
     OwnerId: UUID
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class ProjectSummary(BaseModel):
+    Id: UUID
+    Name: str
+    Description: Optional[str] = None
+    Deadline: Optional[datetime] = None
+    Progress: Optional[int] = 0
+    TaskTotal: int = 0
+    TaskCompleted: int = 0
+    TotalBudget: float
+    RemainingBudget: Optional[float] = None
+    CreatedAt: datetime
+    UpdatedAt: Optional[datetime] = None
+    IsDeleted: bool
+    OwnerId: UUID
+
+    class Config:
+        from_attributes = True
+
+
+class AddProjectMembers(BaseModel):
+    UserIds: List[UUID] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+    Role: Optional[str] = None
+
+class RemoveProjectMembers(BaseModel):
+    UserIds: List[UUID] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class ProjectMemberOut(BaseModel):
+    Id: str
+    ProjectId: str
+    UserId: str
+    Role: Optional[str] = None
+    JoinedAt: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectMemberResponse(ProjectMemberOut):
+    User: Optional[UserSummarySchema] = None
+
+
+class ProjectTaskCounts(BaseModel):
+    Total: int
+    Completed: int
+    ByStatus: Dict[str, int]
+    ByPriority: Dict[str, int]
+
+
+class ProjectRiskCounts(BaseModel):
+    Open: int
+    BySeverity: Dict[str, int]
+
+
+class ProjectBudget(BaseModel):
+    Total: float
+    Used: float
+    Remaining: float
+
+
+class ProjectScopeArtifacts(BaseModel):
+    ScopeManagementPlan: bool
+    RequirementManagementPlan: bool
+    RequirementDocument: bool
+    ScopeStatement: bool
+    WBS: bool
+
+
+class ProjectOverview(BaseModel):
+    Project: ProjectSummary
+    Members: Optional[List[ProjectMemberResponse]] = None
+    Teams: Optional[List[TeamResponse]] = None
+    Tasks: Optional[ProjectTaskCounts] = None
+    Risks: Optional[ProjectRiskCounts] = None
+    Budget: Optional[ProjectBudget] = None
+    Scope: Optional[ProjectScopeArtifacts] = None
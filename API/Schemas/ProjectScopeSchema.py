@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
@@ -34,15 +34,13 @@ class WorkPackageSchema(BaseModel):
     Description: Optional[str] = None
     EstimatedDuration: Optional[int] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class WorkBreakdownStructureSchema(BaseModel):
     WorkPackages: Optional[List[WorkPackageSchema]] = None
     ScopeBaselineReference: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ScopeManagementPlanUpdateSchema(BaseModel):
     ScopeDefinitionMethod: Optional[str] = None
@@ -1,8 +1,10 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 
+from Core.config import BULK_MAX_ITEMS
+
 class ResourceBase(BaseModel):
     Name: str
     Type: str  
@@ -20,12 +22,17 @@ class ResourceUpdate(BaseModel):
     Total: Optional[float]
     Available: Optional[float]
 
+class ResourceFilter(BaseModel):
+    Type: Optional[str] = None
+    Name: Optional[str] = None
+
 class ResourceRead(ResourceBase):
     Id: str
+    Unit: Optional[str] = None
+    Total: Optional[float] = None
     CreatedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ActivityResourceBase(BaseModel):
     TaskId: str
@@ -33,6 +40,14 @@ class ActivityResourceBase(BaseModel):
     Quantity: int
     EstimatedCost: int
 
+class ActivityResourceBulkItem(ActivityResourceBase):
+    # A negative cost would be written to the ledger without moving the budget it is netted into
+    Quantity: int = Field(..., gt=0)
+    EstimatedCost: int = Field(..., ge=0)
+
+class ActivityResourceBulkCreate(BaseModel):
+    Assignments: List[ActivityResourceBulkItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
 class ActivityResourceUpdate(BaseModel):
     Quantity: Optional[float]
     EstimatedCost: Optional[float]
@@ -41,20 +56,18 @@ class ActivityResourceRead(ActivityResourceBase):
     Id: str
     AssignedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ActivityResourceResponse(BaseModel):
     Id: str
     TaskId: str
     ResourceId: str
-    Quantity: Decimal
-    EstimatedCost: Decimal
+    Quantity: float
+    EstimatedCost: float
     AssignedAt: datetime
     IsDeleted: bool
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ResourcePlanBase(BaseModel):
     ProjectId: str
@@ -68,5 +81,4 @@ class ResourcePlanRead(ResourcePlanBase):
     Id: str
     CreatedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
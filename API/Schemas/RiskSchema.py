@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 
@@ -13,6 +13,10 @@ class RiskBase(BaseModel):
     OwnerId: str
     Status: Optional[str] = "Open"
 
+class RiskFilter(BaseModel):
+    Status: Optional[str] = None
+    Category: Optional[str] = None
+
 class RiskUpdate(BaseModel):
     Name: Optional[str]
     Description: Optional[str]
@@ -26,8 +30,7 @@ class RiskRead(RiskBase):
     Id: str
     IdentifiedDate: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class RiskAnalysisBase(BaseModel):
     RiskId: str
@@ -45,8 +48,7 @@ class RiskAnalysisRead(RiskAnalysisBase):
     Id: str
     AnalysisDate: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class RiskResponsePlanBase(BaseModel):
     RiskId: str
@@ -64,7 +66,7 @@ class RiskResponsePlanUpdate(BaseModel):
 
 class RiskResponsePlanRead(RiskResponsePlanBase):
     Id: str
+    Strategy: Optional[str] = None
     CreatedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
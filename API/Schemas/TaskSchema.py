@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 from uuid import UUID
 
+from Core.config import BULK_MAX_ITEMS
+
 if TYPE_CHECKING:
     from Schemas.TaskSchema import TaskTreeResponse
 
@@ -26,6 +28,26 @@ class TaskUpdate(TaskBase):
     Title: Optional[str] = None
     Status: Optional[str] = None
     Priority: Optional[str] = None
+    Completed: Optional[bool] = None
+
+class TaskBulkCreate(BaseModel):
+    Tasks: List[TaskCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkUpdateItem(TaskUpdate):
+    Id: UUID
+
+class TaskBulkUpdate(BaseModel):
+    Tasks: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskFilter(BaseModel):
+    ProjectId: Optional[UUID] = None
+    Status: Optional[str] = None
+    Priority: Optional[str] = None
+    AssigneeId: Optional[UUID] = None
+    TeamId: Optional[UUID] = None
+    Completed: Optional[bool] = None
+    DeadlineFrom: Optional[datetime] = None
+    DeadlineTo: Optional[datetime] = None
 
 class TaskResponse(TaskBase):
     Id: UUID
@@ -34,13 +56,28 @@ class TaskResponse(TaskBase):
     Completed: bool
     IsDeleted: bool
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+class TaskBulkError(BaseModel):
+    Index: int
+    StatusCode: int
+    Detail: str
+
+class TaskBulkResponse(BaseModel):
+    Tasks: List[TaskResponse]
+    Errors: List[TaskBulkError]
+
+class TaskTreeNodeResponse(TaskResponse):
+    ProjectId: UUID
+    CreatedBy: UUID
+    Depth: int = 0
+    Progress: float = 0
+    SubtaskCount: int = 0
+    SubtaskCompleted: int = 0
 
-class TaskTreeResponse(TaskResponse):
+class TaskTreeResponse(TaskTreeNodeResponse):
     Subtasks: List["TaskTreeResponse"] = []
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 TaskTreeResponse.update_forward_refs()
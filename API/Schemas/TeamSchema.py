@@ -1,8 +1,10 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
+from Core.config import BULK_MAX_ITEMS
+
 
 class TeamCreate(BaseModel):
     Name: str
@@ -15,6 +17,9 @@ class TeamUpdate(BaseModel):
     Description: Optional[str]
     ColorIndex: Optional[int]
 
+class TeamFilter(BaseModel):
+    ProjectId: Optional[UUID] = None
+
 class TeamResponse(TeamCreate):
     Id: str
     CreatedAt: datetime
@@ -30,3 +35,19 @@ class AddTeamMember(BaseModel):
 class RemoveTeamMember(BaseModel):
     TeamId: UUID
     UserIdToBeRemoved: UUID
+
+class TeamMemberEntry(BaseModel):
+    UserId: UUID
+    Role: str
+    IsLeader: bool = False
+
+class AddTeamMembers(BaseModel):
+    Members: List[TeamMemberEntry] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class RemoveTeamMembers(BaseModel):
+    UserIds: List[UUID] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class MembersBulkResult(BaseModel):
+    # Changed: users added or removed by the call, Unchanged: already members / not members
+    Changed: List[str]
+    Unchanged: List[str]
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from typing import Optional
+from Models.Attachment import AttachmentStatus
+from Schemas.AttachmentSchema import DownloadableSchema
 
 
 class AddUserSchema(BaseModel):
@@ -14,11 +16,12 @@ class UpdatePasswordSchema(BaseModel):
     NewPassword: str = Field(..., min_length=6)
 
 
-class ProfilePictureSchema(BaseModel):
+class ProfilePictureSchema(DownloadableSchema):
     FileName: str
     FileType: Optional[str]
     FileSize: Optional[int]
-    FilePath: str
+    ContentHash: Optional[str] = None
+    Status: AttachmentStatus = AttachmentStatus.READY
     OwnerId: str
 
     model_config = ConfigDict(from_attributes=True)
@@ -35,3 +38,14 @@ class UserResponseSchema(BaseModel):
     ProfilePictureUrl: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserSummarySchema(BaseModel):
+    Id: str
+    FirstName: str
+    LastName: str
+    Email: str
+    JobTitle: Optional[str] = None
+    ProfilePicture: Optional[ProfilePictureSchema] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,9 +1,21 @@
+import re
+import time
+from functools import partial
+from itertools import chain
+from typing import Optional, Tuple
+from urllib.parse import quote
 from fastapi import HTTPException, status, UploadFile
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
-from Models.Attachment import Attachment, AttachmentEntityType
-from Repositories import AttachmentRepository
+from Models.Attachment import Attachment, AttachmentEntityType, AttachmentStatus
+from Repositories import AttachmentRepository, BlobRepository
 from Repositories.ProjectRepository import HasProjectAccess
 from Schemas.AttachmentSchema import AttachmentCreateSchema
+from Core.pagination import PageParams, Page
+from Core.upload_queue import uploadQueue
+from Core.signed_urls import VerifyDownloadToken
+from Db.session import SessionLocal
+from Storage import GetStorage
 
 
 def AddAttachment(db: Session, attachmentData: AttachmentCreateSchema, userId: str) -> Attachment:
@@ -35,17 +47,26 @@ def DeleteAttachment(db: Session, attachmentId: str, userId: str) -> bool:
 
     return AttachmentRepository.SoftDeleteAttachment(db, attachmentId)
 
-def GetAttachmentById(db: Session, attachmentId: str) -> Attachment:
+def CheckAttachmentAccess(db: Session, projectId: Optional[str], entityType: AttachmentEntityType, userId: str):
+    # Responses carry signed download links, so only project members may read them; profile pictures have no project
+    if entityType != AttachmentEntityType.USER:
+        if not HasProjectAccess(db, projectId, userId):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied to this project.")
+
+def GetAttachmentById(db: Session, attachmentId: str, userId: str) -> Attachment:
     attachment = AttachmentRepository.GetAttachmentById(db, attachmentId)
     if not attachment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attachment not found.")
+    CheckAttachmentAccess(db, attachment.ProjectId, attachment.EntityType, userId)
     return attachment
 
-def GetAttachmentsByEntity(db: Session, projectId:str, entityType: AttachmentEntityType, entityId: str) -> list[Attachment]:
-    return AttachmentRepository.GetAttachmentsByEntity(db, projectId, entityType, entityId)
+def GetAttachmentsByEntity(db: Session, projectId:str, entityType: AttachmentEntityType, entityId: str, page: PageParams, userId: str) -> Page:
+    CheckAttachmentAccess(db, projectId, entityType, userId)
+    return AttachmentRepository.GetAttachmentsByEntity(db, projectId, entityType, entityId, page)
 
-def GetAttachmentsByEntityType(db: Session, projectId:str, entityType: AttachmentEntityType) -> list[Attachment]:
-    return AttachmentRepository.GetAttachmentsByEntityType(db, projectId, entityType)
+def GetAttachmentsByEntityType(db: Session, projectId:str, entityType: AttachmentEntityType, page: PageParams, userId: str) -> Page:
+    CheckAttachmentAccess(db, projectId, entityType, userId)
+    return AttachmentRepository.GetAttachmentsByEntityType(db, projectId, entityType, page)
 
 def FileUpload(
     db: Session,
@@ -59,20 +80,135 @@ def FileUpload(
         if not HasProjectAccess(db, projectId, currentUser):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied to this project.")
 
-    return AttachmentRepository.FileUpload(
-        db=db,
-        file=file,
-        entityType=entityType,
-        entityId=entityId,
-        projectId=projectId,
-        currentUser=currentUser
+    uploadQueue.Reserve()
+    try:
+        attachment = AttachmentRepository.FileUpload(
+            db=db,
+            file=file,
+            entityType=entityType,
+            entityId=entityId,
+            projectId=projectId,
+            currentUser=currentUser
+        )
+        duplicate = AttachmentRepository.UseStoredBlob(db, attachment)
+    except BaseException:
+        uploadQueue.Release()
+        raise
+    if duplicate:
+        uploadQueue.Release()
+        return attachment
+
+    uploadQueue.SubmitAfterCommit(
+        db,
+        partial(TransferUpload, attachment.Id),
+        partial(FailUpload, attachment.Id),
+        partial(AttachmentRepository.DiscardStagedUpload, attachment.Id),
     )
+    return attachment
+
+def TransferUpload(attachmentId: str, attempt: int):
+    """Upload job: moves a staged file to storage and marks its attachment Ready. Runs outside any request."""
+    with SessionLocal() as db:
+        upload = AttachmentRepository.StartUploadAttempt(db, attachmentId, attempt)
+        if upload is None:
+            AttachmentRepository.DiscardStagedUpload(attachmentId)
+            return
+        fileName, contentHash = upload
+
+        # Another upload may have stored the same content since this one was staged
+        filePath = BlobRepository.AcquireBlob(db, contentHash)
+        if filePath is not None:
+            FinishUpload(db, attachmentId, filePath)
+            return
+        db.commit()
+
+    # No connection is held while the bytes travel
+    with open(AttachmentRepository.StagedUploadPath(attachmentId), "rb") as source:
+        stored = GetStorage().Save(source, BlobRepository.BlobName(contentHash, fileName))
+
+    with SessionLocal() as db:
+        FinishUpload(db, attachmentId, BlobRepository.RegisterBlob(db, stored.ContentHash, stored.Size, stored.Path))
 
-def DownloadAttachment(db: Session, attachmentId: str):
+def FinishUpload(db: Session, attachmentId: str, filePath: str):
+    # The blob reference is only kept if the attachment was still waiting for it
+    if AttachmentRepository.CompleteUpload(db, attachmentId, filePath):
+        db.commit()
+    else:
+        db.rollback()
+    AttachmentRepository.DiscardStagedUpload(attachmentId)
+
+def FailUpload(attachmentId: str, error: Exception):
+    detail = error.detail if isinstance(error, HTTPException) else str(error)
+    with SessionLocal() as db:
+        AttachmentRepository.FailUpload(db, attachmentId, f"{type(error).__name__}: {detail}")
+        db.commit()
+    AttachmentRepository.DiscardStagedUpload(attachmentId)
+
+def GetUploadStatus(db: Session, attachmentId: str, userId: str) -> Attachment:
+    return GetAttachmentById(db, attachmentId, userId)
+
+def DownloadAttachment(db: Session, attachmentId: str, userId: str):
     attachment = AttachmentRepository.GetAttachmentById(db, attachmentId)
     if not attachment or attachment.IsDeleted:
         raise HTTPException(status_code=404, detail="Attachment not found")
-    
+    CheckAttachmentAccess(db, attachment.ProjectId, attachment.EntityType, userId)
+    if attachment.Status != AttachmentStatus.READY:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Attachment upload is {attachment.Status.value}.")
+
     url = AttachmentRepository.DownloadAttachment(attachment)
     return {"download_url": url}
 
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+
+def ParseRange(rangeHeader: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """(start, length) of a single "bytes=" range, or None to send the whole file. Multi-range requests get the whole file."""
+    match = RANGE_PATTERN.fullmatch(rangeHeader.strip()) if rangeHeader else None
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.group(1), match.group(2)
+    if first == "":
+        start = max(0, size - int(last))
+    else:
+        start = int(first)
+        if last != "" and int(last) < start:
+            return None
+    end = min(size - 1, int(last)) if first != "" and last != "" else size - 1
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range is outside the file.",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end - start + 1
+
+def StreamDownload(token: str, rangeHeader: Optional[str], ifNoneMatch: Optional[str]) -> Response:
+    """Serves a signed download link straight from storage. Only the token is checked; the database is not involved."""
+    claims = VerifyDownloadToken(token)
+    storage = GetStorage()
+    expiresIn = max(0, int(claims["e"] - time.time()))
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": f"private, max-age={expiresIn}",
+        "Content-Disposition": f"inline; filename*=UTF-8''{quote(claims['n'])}",
+    }
+    if claims["h"]:
+        headers["ETag"] = f'"{claims["h"]}"'
+        if ifNoneMatch and headers["ETag"] in ifNoneMatch:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    try:
+        size = claims["s"] if claims["s"] is not None else storage.Size(claims["p"])
+        byteRange = ParseRange(rangeHeader, size)
+        start, length = byteRange or (0, size)
+        chunks = storage.Read(claims["p"], start, length)
+        # Open the file before answering, so a missing one is a 404 rather than a cut-off body
+        first = next(chunks, b"")
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found in storage.")
+
+    headers["Content-Length"] = str(length)
+    statusCode = status.HTTP_200_OK
+    if byteRange:
+        headers["Content-Range"] = f"bytes {start}-{start + length - 1}/{size}"
+        statusCode = status.HTTP_206_PARTIAL_CONTENT
+    return StreamingResponse(chain([first], chunks), status_code=statusCode, media_type=claims["t"] or "application/octet-stream", headers=headers)
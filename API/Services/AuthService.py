@@ -1,21 +1,15 @@
-from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from Schemas.AuthSchema import RegisterSchema, LoginSchema
-from Dependencies.auth import VerifyPassword, CreateAccessToken
-from Dependencies.db import GetDb
-from Schemas.UserSchema import AddUserSchema
-from Services.UserService import UserService
+from Schemas.AuthSchema import LoginSchema
+from Dependencies.auth import VerifyPasswordAsync, CreateAccessToken
+from Repositories.UserRepository import UserRepository
 
 
-class AuthService:
-    def __init__(self, db: Session = Depends(GetDb)):
-        self.userService = UserService(db)
+async def LoginUserAsync(db: AsyncSession, userData: LoginSchema):
+    user = await UserRepository.GetByEmailAsync(db, userData.Email)
+    if not await VerifyPasswordAsync(userData.Password, user.Password):
+        raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    def LoginUser(self, userData: LoginSchema):
-        user = self.userService.GetUserByEmail(userData.Email)
-        if not VerifyPassword(userData.Password, user.Password):
-            raise HTTPException(status_code=401, detail="Invalid email or password")
-
-        accessToken = CreateAccessToken({"sub": str(user.Id)})
-        return {"access_token": accessToken, "token_type": "bearer"}
+    accessToken = CreateAccessToken({"sub": str(user.Id)})
+    return {"access_token": accessToken, "token_type": "bearer"}
@@ -13,7 +13,7 @@ from Dependencies.db import GetDb
 verification_cache = TTLCache(maxsize=1000, ttl=120)
 
 class EmailService:
-    def __init__(self, db: Session = Depends(GetDb)):
+    def __init__(self, db: Session = Depends(GetDb, scope="function")):
         self.db = db
         self.userRepository = UserRepository(db)
         self.cache = verification_cache
@@ -20,7 +20,7 @@ from Schemas.ProjectScopeSchema import (
 
 class ProjectScopeService:
 
-    def __init__(self, db: Session = Depends(GetDb)):
+    def __init__(self, db: Session = Depends(GetDb, scope="function")):
         self.db = db
         self.projectScopeRepository = ProjectScopeRepository(db)
 
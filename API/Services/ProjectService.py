@@ -1,18 +1,24 @@
 from typing import Optional, List
+from decimal import Decimal
 
 from Models import Project, Task
 from Repositories import ProjectRepository
-from Schemas.ProjectSchema import ProjectCreate, ProjectUpdate
+from Schemas.ProjectSchema import ProjectCreate, ProjectUpdate, AddProjectMembers, RemoveProjectMembers
+from Schemas.TaskSchema import TaskFilter
+from Core.pagination import PageParams, Page
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from Dependencies.db import GetDb
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, status
 from uuid import UUID
 
 from Services.UserService import UserService
 
+OVERVIEW_SECTIONS = ("Members", "Teams", "Tasks", "Risks", "Budget", "Scope")
+
 
 class ProjectService:
-    def __init__(self, db: Session = Depends(GetDb), userService: UserService = Depends()):
+    def __init__(self, db: Session = Depends(GetDb, scope="function"), userService: UserService = Depends()):
         self.db = db
         self.userService = userService
 
@@ -50,9 +56,24 @@ class ProjectService:
             raise HTTPException(status_code=404, detail="User to be added not found")
         return ProjectRepository.AddMemberToProject(self.db, projectId, memberId)
 
-    def SoftDeleteProjectMember(self, projectId: UUID, memberId: UUID):
+    def AddProjectMembers(self, userId: UUID, projectId: UUID, membersData: AddProjectMembers) -> dict:
+        if not ProjectRepository.IsProjectOwner(self.db, userId, projectId):
+            raise HTTPException(status_code=403, detail="Only the project owner can add members.")
+        added, alreadyMembers = ProjectRepository.AddMembersToProject(self.db, projectId, membersData.UserIds, membersData.Role)
+        return {"Changed": added, "Unchanged": alreadyMembers}
+
+    def SoftDeleteProjectMember(self, userId: UUID, projectId: UUID, memberId: UUID):
+        if not ProjectRepository.IsProjectOwner(self.db, userId, projectId):
+            raise HTTPException(status_code=403, detail="Only the project owner can remove members.")
         return ProjectRepository.SoftDeleteProjectMember(self.db, projectId, memberId)
 
+    def SoftDeleteProjectMembers(self, userId: UUID, projectId: UUID, membersData: RemoveProjectMembers) -> dict:
+        if not ProjectRepository.IsProjectOwner(self.db, userId, projectId):
+            raise HTTPException(status_code=403, detail="Only the project owner can remove members.")
+        removed = ProjectRepository.SoftDeleteProjectMembers(self.db, projectId, membersData.UserIds)
+        requested = dict.fromkeys(str(memberId) for memberId in membersData.UserIds)
+        return {"Changed": removed, "Unchanged": [memberId for memberId in requested if memberId not in removed]}
+
     def GetProjectOwner(self, projectId: UUID):
         return ProjectRepository.GetProjectOwner(self.db, projectId)
 
@@ -94,6 +115,47 @@ class ProjectService:
             raise HTTPException(status_code=404, detail="Project not found")
         return ProjectRepository.GetTasks(self.db, projectId)
 
+    def GetProjectOverview(self, userId: UUID, projectId: UUID, include: Optional[str] = None) -> dict:
+        sections = self.ParseOverviewSections(include)
+
+        project = ProjectRepository.GetProjectSummary(self.db, projectId)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if not ProjectRepository.HasProjectAccess(self.db, projectId, str(userId)):
+            raise HTTPException(status_code=403, detail="You are not a member of this project.")
+
+        overview = {"Project": project}
+        if "Members" in sections:
+            overview["Members"] = ProjectRepository.GetProjectMembers(self.db, projectId)
+        if "Teams" in sections:
+            overview["Teams"] = ProjectRepository.GetProjectTeams(self.db, projectId)
+        if "Tasks" in sections:
+            overview["Tasks"] = ProjectRepository.GetTaskCounts(self.db, projectId)
+        if "Risks" in sections:
+            overview["Risks"] = ProjectRepository.GetOpenRiskCounts(self.db, projectId)
+        if "Budget" in sections:
+            total = Decimal(str(project.TotalBudget or 0))
+            remaining = Decimal(str(project.RemainingBudget or 0))
+            overview["Budget"] = {"Total": total, "Used": total - remaining, "Remaining": remaining}
+        if "Scope" in sections:
+            overview["Scope"] = ProjectRepository.GetScopeArtifacts(self.db, projectId)
+        return overview
+
+    @staticmethod
+    def ParseOverviewSections(include: Optional[str]) -> set:
+        if not include:
+            return set(OVERVIEW_SECTIONS)
+
+        byName = {section.lower(): section for section in OVERVIEW_SECTIONS}
+        requested = [name.strip().lower() for name in include.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in byName]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown overview sections: {', '.join(unknown)}. Allowed: {', '.join(OVERVIEW_SECTIONS)}"
+            )
+        return {byName[name] for name in requested}
+
 def UpdateProject(self, userId: UUID, projectId: UUID, projectData: 'ProjectUpdate'):
     """
     Update an existing project. Only the project owner can update a project.
@@ -113,5 +175,8 @@ def UpdateProject(self, userId: UUID, projectId: UUID, projectData: 'ProjectUpda
     return ProjectRepository.UpdateProject(self.db, projectId, updateData)
 
 
-
-
+async def GetProjectTasksAsync(db: AsyncSession, userId: UUID, projectId: UUID, filters: TaskFilter, page: PageParams) -> Page:
+    # Raises 404 for a missing project
+    if not await ProjectRepository.HasProjectAccessAsync(db, str(projectId), str(userId)):
+        raise HTTPException(status_code=403, detail="You are not a member of this project.")
+    return await ProjectRepository.GetTasksAsync(db, projectId, filters, page)
@@ -1,14 +1,16 @@
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from Dependencies.db import GetDb
 from Repositories import ResourceRepository, ProjectRepository
 from Schemas.ResourceSchema import (
     ResourceBase, ResourceUpdate,
-    ActivityResourceBase, ActivityResourceUpdate,
-    ResourcePlanBase, ResourcePlanUpdate
+    ActivityResourceBase, ActivityResourceBulkCreate, ActivityResourceUpdate,
+    ResourcePlanBase, ResourcePlanUpdate, ResourceFilter
 )
+from Core.pagination import PageParams, Page
 from Models.Resource import Resource
 from Models.ResourcePlan import ResourcePlan
 from Models.ActivityResource import ActivityResource
@@ -16,7 +18,7 @@ from Models.ActivityResource import ActivityResource
 from Models.Task import Task
 
 class ResourceService:
-    def __init__(self, db: Session = Depends(GetDb)):
+    def __init__(self, db: Session = Depends(GetDb, scope="function")):
         self.db = db
 
     def CreateResource(self, userId: UUID, resourceData: ResourceBase):
@@ -44,8 +46,8 @@ class ResourceService:
 
         return ResourceRepository.SoftDeleteResource(self.db, resourceId)
 
-    def GetAllResourcesByProjectId(self, projectId: str):
-        return ResourceRepository.GetAllResourcesByProjectId(self.db, projectId)
+    def GetAllResourcesByProjectId(self, projectId: str, filters: ResourceFilter, page: PageParams) -> Page:
+        return ResourceRepository.GetAllResourcesByProjectId(self.db, projectId, filters, page)
 
     def GetResourceById(self, resourceId: str):
         resource = ResourceRepository.GetResourceById(self.db, resourceId)
@@ -61,22 +63,45 @@ class ResourceService:
         task = self.db.query(Task).filter(Task.Id == assignmentData.TaskId, Task.IsDeleted == False).first()
         if not task:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
-        
-        if assignmentData.Quantity > resource.Available:
-            raise HTTPException(status_code=400, detail="Not enough available resource quantity.")
 
         return ResourceRepository.CreateActivityResource(self.db, assignmentData, task, resource)
 
+    def CreateActivityResources(self, userId: UUID, bulkData: ActivityResourceBulkCreate):
+        assignments = bulkData.Assignments
+        taskIds = {assignment.TaskId for assignment in assignments}
+        resourceIds = {assignment.ResourceId for assignment in assignments}
+
+        taskProjects = dict(self.db.query(Task.Id, Task.ProjectId).filter(Task.Id.in_(taskIds), Task.IsDeleted == False).all())
+        missingTasks = taskIds - taskProjects.keys()
+        if missingTasks:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Task not found: {', '.join(sorted(missingTasks))}.")
+
+        resourceProjects = dict(self.db.query(Resource.Id, Resource.ProjectId).filter(Resource.Id.in_(resourceIds), Resource.IsDeleted == False).all())
+        missingResources = resourceIds - resourceProjects.keys()
+        if missingResources:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Resource not found: {', '.join(sorted(missingResources))}.")
+
+        for projectId in set(taskProjects.values()):
+            if not ProjectRepository.HasProjectAccess(self.db, projectId, str(userId)):
+                raise HTTPException(status_code=403, detail="You are not allowed to assign resources in this project.")
+
+        # Access is checked on the tasks' projects only, so a resource must belong to its task's project
+        foreign = sorted({assignment.ResourceId for assignment in assignments if resourceProjects[assignment.ResourceId] != taskProjects[assignment.TaskId]})
+        if foreign:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Resource does not belong to the task's project: {', '.join(foreign)}.")
+
+        return ResourceRepository.CreateActivityResources(self.db, assignments, taskProjects)
+
     def UpdateActivityResource(self, assignmentId: str, updateData: ActivityResourceUpdate):        
         assignment = self.db.query(ActivityResource).filter(ActivityResource.Id == assignmentId, ActivityResource.IsDeleted == False).first()
         if not assignment:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Activity Resource not found.")
         
-        task = self.db.query(Task).filter(Task.Id == ActivityResource.TaskId, Task.IsDeleted == False).first()
+        task = self.db.query(Task).filter(Task.Id == assignment.TaskId, Task.IsDeleted == False).first()
         if not task:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
         
-        resource = self.db.query(Resource).filter(Resource.Id == ActivityResource.ResourceId, Resource.IsDeleted == False).first()
+        resource = self.db.query(Resource).filter(Resource.Id == assignment.ResourceId, Resource.IsDeleted == False).first()
         if not resource:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource not found.")
 
@@ -100,7 +125,10 @@ class ResourceService:
 
 
     def GetActivityResourceById(self, assignmentId: str):
-        return ResourceRepository.GetActivityResourceById(self.db, assignmentId)
+        assignment = ResourceRepository.GetActivityResourceById(self.db, assignmentId)
+        if not assignment:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Activity resource not found.")
+        return assignment
 
     def GetAllActivityResourcesByTaskId(self, taskId: str):
         return ResourceRepository.GetAllActivityResourcesByTaskId(self.db, taskId)
@@ -131,7 +159,16 @@ class ResourceService:
         return ResourceRepository.SoftDeleteResourcePlan(self.db, planId)
 
     def GetResourcePlanById(self, planId: str):
-        return ResourceRepository.GetResourcePlanById(self.db, planId)
+        plan = ResourceRepository.GetResourcePlanById(self.db, planId)
+        if not plan:
+            raise HTTPException(status_code=404, detail="Resource plan not found")
+        return plan
 
     def GetAllResourcePlansByProjectId(self, projectId: str):
         return ResourceRepository.GetAllResourcePlansByProjectId(self.db, projectId)
+
+
+async def GetAllResourcesByProjectIdAsync(db: AsyncSession, userId: UUID, projectId: str, filters: ResourceFilter, page: PageParams) -> Page:
+    if not await ProjectRepository.HasProjectAccessAsync(db, projectId, str(userId)):
+        raise HTTPException(status_code=403, detail="You are not a member of this project.")
+    return await ResourceRepository.GetAllResourcesByProjectIdAsync(db, projectId, filters, page)
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException
 from uuid import UUID
 
@@ -7,13 +8,14 @@ from Repositories import RiskRepository, ProjectRepository
 from Schemas.RiskSchema import (
     RiskBase, RiskUpdate,
     RiskAnalysisBase, RiskAnalysisUpdate,
-    RiskResponsePlanBase, RiskResponsePlanUpdate
+    RiskResponsePlanBase, RiskResponsePlanUpdate, RiskFilter
 )
+from Core.pagination import PageParams, Page
 from Dependencies.db import GetDb
 
 
 class RiskService:
-    def __init__(self, db: Session = Depends(GetDb)):
+    def __init__(self, db: Session = Depends(GetDb, scope="function")):
         self.db = db
 
     def CreateRisk(self, userId: UUID, riskData: RiskBase):
@@ -59,8 +61,8 @@ class RiskService:
             raise HTTPException(status_code=404, detail="Risk not found")
         return risk
 
-    def GetAllRisks(self, projectId: str):
-        return RiskRepository.GetAllRisks(self.db, projectId)
+    def GetAllRisks(self, projectId: str, filters: RiskFilter, page: PageParams) -> Page:
+        return RiskRepository.GetAllRisks(self.db, projectId, filters, page)
 
     def CreateRiskAnalysis(self, userId: UUID, analysisData: RiskAnalysisBase):
         risk = RiskRepository.GetRiskById(self.db, analysisData.RiskId)
@@ -154,3 +156,9 @@ class RiskService:
 
     def GetAllRiskResponsePlansByRiskId(self, riskId: UUID):
         return RiskRepository.GetAllRiskResponsePlansByRiskId(self.db, str(riskId))
+
+
+async def GetAllRisksAsync(db: AsyncSession, userId: UUID, projectId: str, filters: RiskFilter, page: PageParams) -> Page:
+    if not await ProjectRepository.HasProjectAccessAsync(db, projectId, str(userId)):
+        raise HTTPException(status_code=403, detail="You are not a member of this project.")
+    return await RiskRepository.GetAllRisksAsync(db, projectId, filters, page)
@@ -10,7 +10,7 @@ from Services.UserService import UserService
 
 class StakeholderService:
     def __init__(self,
-                 db: Session = Depends(GetDb),
+                 db: Session = Depends(GetDb, scope="function"),
                  userService: UserService = Depends(),
                  projectService: ProjectService = Depends()):
         self.repo = StakeholderRepository(db)
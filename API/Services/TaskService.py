@@ -1,19 +1,40 @@
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, Tuple
 from fastapi import HTTPException, Depends
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from Dependencies.db import GetDb
 from Models import Task
-from Schemas.TaskSchema import TaskCreate, TaskUpdate
-from Repositories.TaskRepository import TaskRepository
+from Models.Project import Project
+from Models.ProjectMember import ProjectMember
+from Models.Team import Team
+from Models.User import User
+from Schemas.TaskSchema import TaskCreate, TaskUpdate, TaskFilter, TaskBulkCreate, TaskBulkUpdate
+from Core.pagination import PageParams, Page
+from Repositories.TaskRepository import TaskRepository, GetAncestry, AncestorChain
 from Services.TeamService import TeamService
 from Services.UserService import UserService
 from Services.ProjectService import ProjectService
 
+
+@dataclass
+class BulkTaskReferences:
+    """Everything a bulk task request points at, preloaded with one IN-query per table."""
+    ProjectOwners: Dict[str, str] = field(default_factory=dict)
+    TeamIds: Set[str] = field(default_factory=set)
+    UserIds: Set[str] = field(default_factory=set)
+    Members: Set[Tuple[str, str]] = field(default_factory=set)
+    ParentProjects: Dict[str, str] = field(default_factory=dict)
+
+
+def BulkError(index: int, error: HTTPException) -> dict:
+    return {"Index": index, "StatusCode": error.status_code, "Detail": error.detail}
+
 class TaskService:
     def __init__(self,
-                 db: Session = Depends(GetDb),
+                 db: Session = Depends(GetDb, scope="function"),
                  projectService: ProjectService = Depends(ProjectService),
                  userService: UserService = Depends(UserService),
                  teamService: TeamService = Depends(TeamService),
@@ -47,17 +68,165 @@ class TaskService:
             if not self.projectService.IsProjectMember(taskData.UserId, taskData.ProjectId):
                 raise HTTPException(status_code=403, detail="Assigned user is not a member of the project")
 
+        if taskData.ParentTaskId:
+            self.ValidateParentTask(taskData.ParentTaskId, taskData.ProjectId)
+
         newTask = self.repo.Create(userId, taskData)
         return newTask
 
+    def AddMany(self, userId: UUID, bulkData: TaskBulkCreate, atomic: bool = False) -> dict:
+        """
+        Creates many tasks with the same rules as Add, checked in memory against references
+        loaded up front. Rows that fail are reported by index and the rest are inserted,
+        unless `atomic` is set, in which case any failure rejects the whole batch.
+        """
+        tasks = bulkData.Tasks
+        references = self.LoadReferences(
+            projectIds={task.ProjectId for task in tasks},
+            teamIds={task.TeamId for task in tasks if task.TeamId},
+            userIds={task.UserId for task in tasks if task.UserId and not task.TeamId},
+            parentIds={task.ParentTaskId for task in tasks if task.ParentTaskId}
+        )
+
+        valid, errors = [], []
+        for index, taskData in enumerate(tasks):
+            try:
+                self.ValidateNewTask(str(userId), taskData, references)
+            except HTTPException as error:
+                errors.append(BulkError(index, error))
+            else:
+                valid.append(taskData)
+
+        if errors and atomic:
+            raise HTTPException(status_code=400, detail=errors)
+        return {"Tasks": self.repo.CreateMany(userId, valid) if valid else [], "Errors": errors}
+
+    def UpdateMany(self, userId: UUID, bulkData: TaskBulkUpdate, atomic: bool = False) -> dict:
+        """
+        Updates many tasks with the same rules as Update, plus existence checks for the assigned
+        team and user. Rows are validated in order against the tree as earlier rows leave it, so
+        two rows can't combine into a cycle.
+        """
+        items = bulkData.Tasks
+        tasks = self.repo.GetByIds({item.Id for item in items})
+        newParentIds = {str(item.ParentTaskId) for item in items if item.ParentTaskId}
+        references = self.LoadReferences(
+            teamIds={item.TeamId for item in items if item.TeamId},
+            userIds={item.UserId for item in items if item.UserId},
+            parentIds=newParentIds
+        )
+        ancestry = GetAncestry(self.db, set(tasks) | newParentIds)
+        parentOf = {taskId: list(row) for taskId, row in ancestry.items()}
+
+        changes, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                task = self.ValidateTaskUpdate(str(userId), item, tasks, references, parentOf)
+            except HTTPException as error:
+                errors.append(BulkError(index, error))
+                continue
+            values = {
+                key: str(value) if isinstance(value, UUID) else value
+                for key, value in item.dict(exclude_unset=True, exclude={"Id"}).items()
+            }
+            if "ParentTaskId" in values:
+                parentOf[task.Id][0] = values["ParentTaskId"]
+            changes.append((task, values))
+
+        if errors and atomic:
+            raise HTTPException(status_code=400, detail=errors)
+        return {"Tasks": self.repo.UpdateMany(changes, ancestry) if changes else [], "Errors": errors}
+
+    def LoadReferences(self, projectIds=(), teamIds=(), userIds=(), parentIds=()) -> BulkTaskReferences:
+        projectIds, teamIds, userIds, parentIds = ({str(value) for value in ids} for ids in (projectIds, teamIds, userIds, parentIds))
+        references = BulkTaskReferences()
+        if projectIds:
+            references.ProjectOwners = {
+                row.Id: str(row.OwnerId)
+                for row in self.db.query(Project.Id, Project.OwnerId).filter(Project.Id.in_(projectIds), Project.IsDeleted == False)
+            }
+        if teamIds:
+            references.TeamIds = {row.Id for row in self.db.query(Team.Id).filter(Team.Id.in_(teamIds), Team.IsDeleted == False)}
+        if userIds:
+            references.UserIds = {row.Id for row in self.db.query(User.Id).filter(User.Id.in_(userIds))}
+        if projectIds and references.UserIds:
+            references.Members = {
+                (row.ProjectId, row.UserId)
+                for row in self.db.query(ProjectMember.ProjectId, ProjectMember.UserId).filter(
+                    ProjectMember.ProjectId.in_(projectIds),
+                    ProjectMember.UserId.in_(references.UserIds),
+                    ProjectMember.IsDeleted == False
+                )
+            }
+        if parentIds:
+            references.ParentProjects = {
+                row.Id: row.ProjectId
+                for row in self.db.query(Task.Id, Task.ProjectId).filter(Task.Id.in_(parentIds), Task.IsDeleted == False)
+            }
+        return references
+
+    def ValidateNewTask(self, userId: str, taskData: TaskCreate, references: BulkTaskReferences):
+        projectId = str(taskData.ProjectId)
+        if projectId not in references.ProjectOwners:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        if references.ProjectOwners[projectId] != userId:
+            raise HTTPException(status_code=403, detail="Only the project owner can create tasks")
+
+        if taskData.TeamId:
+            if str(taskData.TeamId) not in references.TeamIds:
+                raise HTTPException(status_code=404, detail="Assigned team not found")
+
+        elif taskData.UserId:
+            assigneeId = str(taskData.UserId)
+            if assigneeId == userId:
+                raise HTTPException(status_code=400, detail="You cannot assign a task to yourself")
+
+            if assigneeId not in references.UserIds:
+                raise HTTPException(status_code=404, detail="Assigned user not found")
+
+            if (projectId, assigneeId) not in references.Members:
+                raise HTTPException(status_code=403, detail="Assigned user is not a member of the project")
+
+        if taskData.ParentTaskId:
+            self.ValidateBulkParent(str(taskData.ParentTaskId), projectId, references)
+
+    def ValidateTaskUpdate(self, userId: str, item, tasks: Dict[str, Task], references: BulkTaskReferences, parentOf: Dict[str, list]) -> Task:
+        task = tasks.get(str(item.Id))
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        if str(task.CreatedBy) != userId:
+            raise HTTPException(status_code=403, detail="Only the task creator can update this task")
+
+        if item.TeamId and str(item.TeamId) not in references.TeamIds:
+            raise HTTPException(status_code=404, detail="Assigned team not found")
+
+        if item.UserId and str(item.UserId) not in references.UserIds:
+            raise HTTPException(status_code=404, detail="Assigned user not found")
+
+        if item.ParentTaskId:
+            parentId = str(item.ParentTaskId)
+            self.ValidateBulkParent(parentId, task.ProjectId, references)
+            if task.Id in AncestorChain(parentOf, parentId):
+                raise HTTPException(status_code=400, detail="A task cannot be moved under itself or one of its subtasks")
+        return task
+
+    @staticmethod
+    def ValidateBulkParent(parentTaskId: str, projectId: str, references: BulkTaskReferences):
+        if parentTaskId not in references.ParentProjects:
+            raise HTTPException(status_code=404, detail="Parent task not found")
+        if references.ParentProjects[parentTaskId] != str(projectId):
+            raise HTTPException(status_code=400, detail="Parent task belongs to a different project")
+
     def GetById(self, taskId: UUID):
         task = self.repo.GetById(taskId)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         return task
 
-    def GetAll(self):
-        return self.repo.GetAll()
+    def GetAll(self, filters: TaskFilter, page: PageParams) -> Page:
+        return self.repo.GetAll(filters, page)
 
     def Update(self, taskId: UUID, updateData: TaskUpdate, currentUserId: UUID):
         task = self.repo.GetById(taskId)
@@ -67,8 +236,20 @@ class TaskService:
         if str(task.CreatedBy) != str(currentUserId):
             raise HTTPException(status_code=403, detail="Only the task creator can update this task")
 
+        if updateData.ParentTaskId:
+            self.ValidateParentTask(updateData.ParentTaskId, task.ProjectId)
+            if str(updateData.ParentTaskId) in self.repo.GetSubtreeIds(taskId):
+                raise HTTPException(status_code=400, detail="A task cannot be moved under itself or one of its subtasks")
+
         return self.repo.Update(taskId, updateData)
 
+    def ValidateParentTask(self, parentTaskId: UUID, projectId: UUID):
+        parent = self.repo.GetById(parentTaskId)
+        if not parent:
+            raise HTTPException(status_code=404, detail="Parent task not found")
+        if str(parent.ProjectId) != str(projectId):
+            raise HTTPException(status_code=400, detail="Parent task belongs to a different project")
+
     def SoftDeleteTask(self, userId: UUID, taskId: UUID):
         task = self.repo.GetById(taskId)
         if not task:
@@ -87,8 +268,12 @@ class TaskService:
 
         return self.repo.GetSubtasks(parentTaskId)
 
-    def GetTaskTree(self, taskId: UUID):
-        tree = self.repo.GetTaskTree(taskId)
+    def GetTaskTree(self, taskId: UUID, maxDepth: Optional[int] = None, flat: bool = False):
+        tree = self.repo.GetTaskTree(taskId, maxDepth, flat)
         if not tree:
             raise HTTPException(status_code=404, detail="Task not found")
         return tree
+
+
+async def GetAllTasksAsync(db: AsyncSession, filters: TaskFilter, page: PageParams) -> Page:
+    return await TaskRepository.GetAllAsync(db, filters, page)
@@ -5,7 +5,8 @@ from fastapi import Depends, HTTPException
 from Models import TeamMember, Team
 from Repositories.TeamRepository import TeamRepository
 import Repositories.ProjectRepository as ProjectRepository
-from Schemas.TeamSchema import TeamCreate, TeamUpdate, AddTeamMember
+from Schemas.TeamSchema import TeamCreate, TeamUpdate, AddTeamMember, AddTeamMembers, RemoveTeamMembers, TeamFilter
+from Core.pagination import PageParams, Page
 from sqlalchemy.orm import Session
 from Dependencies.db import GetDb
 from uuid import UUID
@@ -16,7 +17,7 @@ class TeamService:
     def __init__(
         self,
         teamRepository: TeamRepository = Depends(),
-        db: Session = Depends(GetDb)
+        db: Session = Depends(GetDb, scope="function")
     ):
         self.db = db
         self.repo = teamRepository
@@ -35,13 +36,12 @@ class TeamService:
             IsLeader=True
         )
         self.db.add(member)
-        self.db.commit()
-        self.db.refresh(member)
+        self.db.flush()
 
         return createdTeam
 
-    def GetAllTeams(self):
-        return self.repo.GetAll()
+    def GetAllTeams(self, filters: TeamFilter, page: PageParams) -> Page:
+        return self.repo.GetAll(filters, page)
 
     def GetTeamById(self, teamId: UUID) -> Optional[Team]:
         return self.repo.GetById(teamId)
@@ -105,6 +105,25 @@ class TeamService:
 
         return {"message": "Team member removed successfully"}
 
+    def AddMembers(self, userId: UUID, teamId: UUID, membersData: AddTeamMembers) -> dict:
+        self.GetOwnedTeam(userId, teamId, "Only the creator of the team can add members.")
+        added, alreadyMembers = self.repo.AddMembers(teamId, membersData.Members)
+        return {"Changed": added, "Unchanged": alreadyMembers}
+
+    def RemoveMembers(self, userId: UUID, teamId: UUID, membersData: RemoveTeamMembers) -> dict:
+        self.GetOwnedTeam(userId, teamId, "Only the creator of the team can remove members.")
+        removed = self.repo.SoftDeleteMembers(teamId, membersData.UserIds)
+        requested = dict.fromkeys(str(memberId) for memberId in membersData.UserIds)
+        return {"Changed": removed, "Unchanged": [memberId for memberId in requested if memberId not in removed]}
+
+    def GetOwnedTeam(self, userId: UUID, teamId: UUID, forbiddenDetail: str) -> Team:
+        team = self.GetTeamById(teamId)
+        if not team:
+            raise HTTPException(status_code=404, detail="Team not found")
+        if team.CreatedBy != str(userId):
+            raise HTTPException(status_code=403, detail=forbiddenDetail)
+        return team
+
     def GetTeamMembers(self, teamId: UUID):
         team = self.GetTeamById(teamId)
         if not team:
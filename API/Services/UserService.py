@@ -1,5 +1,6 @@
 from fastapi import Depends, HTTPException, status, UploadFile
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from pydantic import EmailStr
 from Services.EmailService import EmailService
@@ -7,30 +8,18 @@ from Services.EmailService import EmailService
 from Repositories.UserRepository import UserRepository
 from Schemas.UserSchema import AddUserSchema
 from Schemas.UserSchema import UserResponseSchema
+from Schemas.TaskSchema import TaskFilter
+from Core.pagination import PageParams, Page
 from Dependencies.db import GetDb
-from Dependencies.auth import HashPassword
+from Dependencies.auth import HashPasswordAsync
 from Models.User import User
 
 
 class UserService:
-    def __init__(self, db: Session = Depends(GetDb)):
+    def __init__(self, db: Session = Depends(GetDb, scope="function")):
         self.db = db
         self.repo = UserRepository(db)
 
-    def CreateUser(self, userData: AddUserSchema):
-        try:
-            self.GetUserByEmail(userData.Email)
-            raise HTTPException(status_code=400, detail="Email is already registered")
-        except HTTPException as e:
-            if e.status_code != 404:
-                raise e
-
-        if not EmailService().IsEmailVerified(userData.Email):
-            raise HTTPException(status_code=400, detail="Email is not verified")
-
-        hashedPassword = HashPassword(userData.Password)
-        return self.repo.Create(userData, hashedPassword)
-
     def GetUserById(self, userId: UUID):
         return self.repo.GetById(userId)
 
@@ -46,26 +35,12 @@ class UserService:
     def GetUserTeams(self, userId: UUID):
         return self.repo.GetUserTeams(userId)
 
-    def GetUserAssignedTasks(self, userId: UUID):
-        return self.repo.GetUserAssignedTasks(userId)
+    def GetUserAssignedTasks(self, userId: UUID, filters: TaskFilter, page: PageParams) -> Page:
+        return self.repo.GetUserAssignedTasks(userId, filters, page)
 
-    def GetUserCreatedTasks(self, userId: UUID):
-        return self.repo.GetUserCreatedTasks(userId)
+    def GetUserCreatedTasks(self, userId: UUID, filters: TaskFilter, page: PageParams) -> Page:
+        return self.repo.GetUserCreatedTasks(userId, filters, page)
 
-    def UpdatePassword(self, email: str, newPassword: str):
-        hashedPassword = HashPassword(newPassword)
-        user = self.repo.GetByEmail(email)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User with this email does not exist."
-            )
-
-        if not EmailService().IsEmailVerified(email):
-            raise HTTPException(status_code=400, detail="Email is not verified")
-        
-        return self.repo.UpdatePassword(user, hashedPassword)
-    
     @staticmethod
     def GetCurrentUserData(db: Session, currentUser: User) -> UserResponseSchema:
         return UserRepository.GetCurrentUserData(db, currentUser)
@@ -83,4 +58,34 @@ class UserService:
             db=db,
             file=file,
             currentUser=user
-        )
\ No newline at end of file
+        )
+
+
+async def CreateUserAsync(db: AsyncSession, userData: AddUserSchema):
+    try:
+        await UserRepository.GetByEmailAsync(db, userData.Email)
+        raise HTTPException(status_code=400, detail="Email is already registered")
+    except HTTPException as e:
+        if e.status_code != 404:
+            raise e
+
+    if not EmailService().IsEmailVerified(userData.Email):
+        raise HTTPException(status_code=400, detail="Email is not verified")
+
+    hashedPassword = await HashPasswordAsync(userData.Password)
+    return await UserRepository.CreateAsync(db, userData, hashedPassword)
+
+async def UpdatePasswordAsync(db: AsyncSession, email: str, newPassword: str):
+    user = await UserRepository.GetByEmailAsync(db, email)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User with this email does not exist."
+        )
+
+    if not EmailService().IsEmailVerified(email):
+        raise HTTPException(status_code=400, detail="Email is not verified")
+
+    # Only requests that passed both checks take a slot in the password pool
+    hashedPassword = await HashPasswordAsync(newPassword)
+    return await UserRepository.UpdatePasswordAsync(db, user, hashedPassword)
@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+from Core.config import (
+    STORAGE_BACKEND, UPLOAD_FOLDER,
+    SFTP_HOST, SFTP_PORT, SFTP_USER, SFTP_PASSWORD, SFTP_HOME_DIR, SFTP_REMOTE_DIR,
+    SFTP_POOL_SIZE, SFTP_DOWNLOAD_POOL_SIZE, SFTP_POOL_IDLE_TIMEOUT, SFTP_POOL_HEALTH_CHECK_AFTER, SFTP_POOL_WAIT_TIMEOUT,
+)
+from Storage.base import StorageBackend, StoredFile, CopyInChunks
+from Storage.local import LocalStorage
+from Storage.sftp import SftpStorage
+
+
+@lru_cache(maxsize=None)
+def GetStorage() -> StorageBackend:
+    """The backend selected by STORAGE_BACKEND, created once per worker on first use."""
+    if STORAGE_BACKEND == "local":
+        return LocalStorage(UPLOAD_FOLDER)
+    if STORAGE_BACKEND == "sftp":
+        return SftpStorage(
+            SFTP_HOST, SFTP_PORT, SFTP_USER, SFTP_PASSWORD, SFTP_HOME_DIR, SFTP_REMOTE_DIR,
+            SFTP_POOL_SIZE, SFTP_DOWNLOAD_POOL_SIZE, SFTP_POOL_IDLE_TIMEOUT, SFTP_POOL_HEALTH_CHECK_AFTER, SFTP_POOL_WAIT_TIMEOUT,
+        )
+    raise ValueError(f"Unknown STORAGE_BACKEND {STORAGE_BACKEND!r}, expected 'sftp' or 'local'")
@@ -0,0 +1,48 @@
+import hashlib
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator, Tuple
+
+from Core.config import UPLOAD_CHUNK_SIZE
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    Path: str
+    Size: int
+    ContentHash: str
+
+
+def CopyInChunks(source: BinaryIO, write: Callable[[bytes], object]) -> Tuple[int, str]:
+    """Copies source into write() UPLOAD_CHUNK_SIZE bytes at a time. Returns (size, sha256 hex)."""
+    size, digest = 0, hashlib.sha256()
+    for chunk in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b""):
+        digest.update(chunk)
+        size += len(chunk)
+        write(chunk)
+    return size, digest.hexdigest()
+
+
+class StorageBackend:
+    """Where uploaded files live. Paths returned by Save are what Attachment.FilePath stores."""
+
+    name = "base"
+
+    def Save(self, source: BinaryIO, fileName: str) -> StoredFile:
+        raise NotImplementedError
+
+    def Size(self, path: str) -> int:
+        raise NotImplementedError
+
+    def Read(self, path: str, start: int, length: int) -> Iterator[bytes]:
+        """Yields length bytes from offset start, UPLOAD_CHUNK_SIZE at a time. A missing file raises FileNotFoundError."""
+        raise NotImplementedError
+
+    def Delete(self, path: str):
+        """Removes a stored file; one that is already gone is not an error."""
+        raise NotImplementedError
+
+    def Snapshot(self) -> dict:
+        return {"backend": self.name}
+
+    def Shutdown(self):
+        pass
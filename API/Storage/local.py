@@ -0,0 +1,53 @@
+import os
+import tempfile
+from typing import BinaryIO, Iterator
+
+from Core.config import UPLOAD_CHUNK_SIZE
+from Storage.base import StorageBackend, StoredFile, CopyInChunks
+
+
+class LocalStorage(StorageBackend):
+    """Keeps uploads in a directory on this machine. Files appear under their final name only once complete."""
+
+    name = "local"
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def Save(self, source: BinaryIO, fileName: str) -> StoredFile:
+        os.makedirs(self.root, exist_ok=True)
+        fd, tempPath = tempfile.mkstemp(dir=self.root, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as target:
+                size, contentHash = CopyInChunks(source, target.write)
+            os.replace(tempPath, os.path.join(self.root, fileName))
+        except BaseException:
+            if os.path.exists(tempPath):
+                os.unlink(tempPath)
+            raise
+        return StoredFile(fileName, size, contentHash)
+
+    def LocalPath(self, path: str) -> str:
+        return os.path.join(self.root, os.path.basename(path))
+
+    def Size(self, path: str) -> int:
+        return os.path.getsize(self.LocalPath(path))
+
+    def Read(self, path: str, start: int, length: int) -> Iterator[bytes]:
+        with open(self.LocalPath(path), "rb") as source:
+            source.seek(start)
+            while length > 0:
+                chunk = source.read(min(UPLOAD_CHUNK_SIZE, length))
+                if not chunk:
+                    break
+                length -= len(chunk)
+                yield chunk
+
+    def Delete(self, path: str):
+        try:
+            os.remove(self.LocalPath(path))
+        except FileNotFoundError:
+            pass
+
+    def Snapshot(self) -> dict:
+        return {"backend": self.name, "root": os.path.abspath(self.root)}
@@ -0,0 +1,265 @@
+import posixpath
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock
+from typing import BinaryIO, Callable, Iterator, List, Tuple
+
+from fastapi import HTTPException, status
+
+from Core.config import UPLOAD_CHUNK_SIZE
+from Db.pool_metrics import Histogram
+from Storage.base import StorageBackend, StoredFile, CopyInChunks
+
+
+class SftpSession:
+    __slots__ = ("transport", "client", "lastUsed")
+
+    def __init__(self, transport, client):
+        self.transport = transport
+        self.client = client
+        self.lastUsed = time.monotonic()
+
+    def Close(self):
+        try:
+            self.client.close()
+        finally:
+            self.transport.close()
+
+
+class SftpPool:
+    """
+    Bounded pool of authenticated SFTP sessions. Each session serves one transfer at a time;
+    idle ones are reused most-recent-first, probed before reuse once they have been idle for
+    healthCheckAfter seconds, and closed after idleTimeout. A session that raised is discarded.
+    """
+
+    def __init__(self, connect: Callable[[], Tuple[object, object]], size: int, idleTimeout: float, healthCheckAfter: float, waitTimeout: float,
+                 purpose: str = "uploads"):
+        self.connect = connect
+        self.purpose = purpose
+        self.size = size
+        self.idleTimeout = idleTimeout
+        self.healthCheckAfter = healthCheckAfter
+        self.waitTimeout = waitTimeout
+        self.admission = BoundedSemaphore(size)
+        self.idle = deque()
+        self.lock = Lock()
+        self.inUse = 0
+        self.opened = 0
+        self.reused = 0
+        self.evicted = 0
+        self.discarded = 0
+        self.failedChecks = 0
+        self.rejected = 0
+        self.connectLatency = Histogram()
+        self.waitLatency = Histogram()
+
+    @contextmanager
+    def Session(self):
+        start = time.perf_counter()
+        if not self.admission.acquire(timeout=self.waitTimeout):
+            with self.lock:
+                self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Too many {self.purpose} in progress, please retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+        with self.lock:
+            self.inUse += 1
+            self.waitLatency.Observe((time.perf_counter() - start) * 1000)
+
+        session = None
+        try:
+            session = self.Checkout()
+            yield session.client
+        except (FileNotFoundError, PermissionError, GeneratorExit):
+            # The server answered, or a download was closed between chunks; the session itself is fine
+            raise
+        except BaseException:
+            # The channel may be mid-transfer or dead; never hand it to the next transfer
+            if session is not None:
+                self.Discard(session)
+                session = None
+            raise
+        finally:
+            if session is not None:
+                self.Checkin(session)
+            with self.lock:
+                self.inUse -= 1
+            self.admission.release()
+
+    def Checkout(self) -> SftpSession:
+        while True:
+            now = time.monotonic()
+            with self.lock:
+                expired = self.TakeExpired(now)
+                session = self.idle.pop() if self.idle else None
+            self.CloseAll(expired)
+            if session is None:
+                return self.Open()
+            if self.IsHealthy(session, now):
+                with self.lock:
+                    self.reused += 1
+                return session
+            with self.lock:
+                self.failedChecks += 1
+            self.Discard(session)
+
+    def Checkin(self, session: SftpSession):
+        session.lastUsed = time.monotonic()
+        with self.lock:
+            self.idle.append(session)
+            expired = self.TakeExpired(session.lastUsed)
+        self.CloseAll(expired)
+
+    def Open(self) -> SftpSession:
+        start = time.perf_counter()
+        transport, client = self.connect()
+        with self.lock:
+            self.opened += 1
+            self.connectLatency.Observe((time.perf_counter() - start) * 1000)
+        return SftpSession(transport, client)
+
+    def IsHealthy(self, session: SftpSession, now: float) -> bool:
+        if not session.transport.is_active():
+            return False
+        if now - session.lastUsed < self.healthCheckAfter:
+            return True
+        try:
+            session.client.normalize(".")
+            return True
+        except Exception:
+            return False
+
+    def TakeExpired(self, now: float) -> List[SftpSession]:
+        # Oldest sessions sit at the left end; caller holds the lock
+        expired = []
+        while self.idle and now - self.idle[0].lastUsed >= self.idleTimeout:
+            expired.append(self.idle.popleft())
+        self.evicted += len(expired)
+        return expired
+
+    def Discard(self, session: SftpSession):
+        with self.lock:
+            self.discarded += 1
+        self.CloseAll([session])
+
+    def CloseAll(self, sessions: List[SftpSession]):
+        for session in sessions:
+            try:
+                session.Close()
+            except Exception:
+                pass
+
+    def Shutdown(self):
+        with self.lock:
+            sessions, self.idle = list(self.idle), deque()
+        self.CloseAll(sessions)
+
+    def Snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "size": self.size,
+                "in_use": self.inUse,
+                "idle": len(self.idle),
+                "opened": self.opened,
+                "reused": self.reused,
+                "evicted": self.evicted,
+                "discarded": self.discarded,
+                "failed_health_checks": self.failedChecks,
+                "rejected": self.rejected,
+                "connect_latency": self.connectLatency.Snapshot(),
+                "wait_latency": self.waitLatency.Snapshot(),
+            }
+
+
+class SftpStorage(StorageBackend):
+    """
+    Uploads to remoteDir over pooled SFTP sessions. Stored paths are relative to homeDir, e.g. /attachments/x.pdf.
+    Downloads have a pool of their own, so slow readers cannot starve the upload workers.
+    """
+
+    name = "sftp"
+
+    def __init__(self, host: str, port: int, username: str, password: str, homeDir: str, remoteDir: str,
+                 poolSize: int, downloadPoolSize: int, idleTimeout: float, healthCheckAfter: float, waitTimeout: float):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.homeDir = homeDir
+        self.remoteDir = remoteDir
+        self.pool = SftpPool(self.Connect, poolSize, idleTimeout, healthCheckAfter, waitTimeout)
+        self.downloads = SftpPool(self.Connect, downloadPoolSize, idleTimeout, healthCheckAfter, waitTimeout, "downloads")
+
+    def Connect(self):
+        # paramiko pulls in most of cryptography; only pay for it when a file is actually uploaded
+        import paramiko
+
+        transport = paramiko.Transport((self.host, self.port))
+        try:
+            transport.connect(username=self.username, password=self.password)
+            client = paramiko.SFTPClient.from_transport(transport)
+            # remoteDir lives outside the web root and may not exist on a fresh host
+            try:
+                client.stat(self.remoteDir)
+            except FileNotFoundError:
+                client.mkdir(self.remoteDir, 0o700)
+            return transport, client
+        except BaseException:
+            transport.close()
+            raise
+
+    def Save(self, source: BinaryIO, fileName: str) -> StoredFile:
+        remotePath = posixpath.join(self.remoteDir, fileName)
+        with self.pool.Session() as sftp:
+            try:
+                with sftp.open(remotePath, "wb") as remote:
+                    remote.set_pipelined(True)
+                    size, contentHash = CopyInChunks(source, remote.write)
+            except BaseException:
+                try:
+                    sftp.remove(remotePath)
+                except Exception:
+                    pass
+                raise
+        return StoredFile("/" + posixpath.relpath(remotePath, self.homeDir), size, contentHash)
+
+    def RemotePath(self, path: str) -> str:
+        # Stored paths come back through download tokens; never let one reach outside remoteDir
+        remotePath = posixpath.normpath(posixpath.join(self.homeDir, path.lstrip("/")))
+        remoteDir = posixpath.normpath(self.remoteDir)
+        if posixpath.commonpath([remotePath, remoteDir]) != remoteDir or remotePath == remoteDir:
+            raise FileNotFoundError(f"{path} is outside the upload directory")
+        return remotePath
+
+    def Size(self, path: str) -> int:
+        remotePath = self.RemotePath(path)
+        with self.downloads.Session() as sftp:
+            return sftp.stat(remotePath).st_size
+
+    def Read(self, path: str, start: int, length: int) -> Iterator[bytes]:
+        remotePath = self.RemotePath(path)
+        # Holds a download session for as long as the client keeps reading
+        with self.downloads.Session() as sftp:
+            with sftp.open(remotePath, "rb") as remote:
+                for offset in range(start, start + length, UPLOAD_CHUNK_SIZE):
+                    # readv pipelines the chunk's requests instead of one round trip per 32 KiB read
+                    yield from remote.readv([(offset, min(UPLOAD_CHUNK_SIZE, start + length - offset))])
+
+    def Delete(self, path: str):
+        remotePath = self.RemotePath(path)
+        with self.pool.Session() as sftp:
+            try:
+                sftp.remove(remotePath)
+            except FileNotFoundError:
+                pass
+
+    def Snapshot(self) -> dict:
+        return {"backend": self.name, "host": self.host, **self.pool.Snapshot(), "downloads": self.downloads.Snapshot()}
+
+    def Shutdown(self):
+        self.pool.Shutdown()
+        self.downloads.Shutdown()
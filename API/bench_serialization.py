@@ -0,0 +1,94 @@
+"""
+Serialization time and bytes on the wire for a large task listing (default: a 10k-task project).
+
+    python bench_serialization.py
+    python bench_serialization.py --tasks 50000 --runs 3
+
+Serializers compared:
+  jsonable_encoder + json   FastAPI's generic encoder, used by endpoints without a response_model
+  pydantic dump_json        what FastAPI does for endpoints with a response_model (List[TaskResponse])
+  orjson                    pydantic dump_python + orjson, only if orjson is installed
+Then the response body is compressed the way CompressionMiddleware does it.
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+import main  # noqa: F401  registers and configures every mapper
+from Core.compression import Compress, brotli
+from Models.Task import Task
+from Schemas.TaskSchema import TaskResponse
+
+
+def MakeTasks(count: int) -> List[Task]:
+    now, projectId, userId = datetime.now(), str(uuid.uuid4()), str(uuid.uuid4())
+    return [
+        Task(
+            Id=str(uuid.uuid4()), ProjectId=projectId, CreatedBy=userId, UserId=userId,
+            Title=f"Task {i}", Description="Prepare the quarterly report and review it with the team",
+            Cost=125.5, Status="In Progress", StatusColorHex="#FFAA00", Priority="High", PriorityColorHex="#FF0000",
+            Deadline=now + timedelta(days=i % 30), CreatedAt=now - timedelta(minutes=i), UpdatedAt=None,
+            Completed=i % 4 == 0, IsDeleted=False,
+        )
+        for i in range(count)
+    ]
+
+
+def Best(function, runs: int):
+    best, result = float("inf"), None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def Main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    tasks = MakeTasks(args.tasks)
+    adapter = TypeAdapter(List[TaskResponse])
+    validated = adapter.validate_python(tasks, from_attributes=True)
+
+    serializers = {
+        "jsonable_encoder + json": lambda: json.dumps(
+            jsonable_encoder(adapter.dump_python(validated)), ensure_ascii=False, separators=(",", ":")
+        ).encode(),
+        "pydantic dump_json": lambda: adapter.dump_json(validated),
+    }
+    try:
+        import orjson
+        serializers["orjson"] = lambda: orjson.dumps(adapter.dump_python(validated, mode="json"))
+    except ImportError:
+        pass
+
+    validateMs, _ = Best(lambda: adapter.validate_python(tasks, from_attributes=True), args.runs)
+    print(f"{args.tasks} tasks, ORM -> TaskResponse validation {validateMs:8.1f} ms\n")
+    print(f"{'serializer':<26}{'time':>10}{'bytes':>12}")
+    body = b""
+    for name, serializer in serializers.items():
+        elapsed, output = Best(serializer, args.runs)
+        body = body or output
+        print(f"{name:<26}{elapsed:>8.1f}ms{len(output):>12,}")
+
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+    print(f"\n{'encoding':<26}{'time':>10}{'bytes':>12}{'ratio':>8}")
+    print(f"{'identity':<26}{0:>8.1f}ms{len(body):>12,}{1:>8.2f}")
+    for encoding in encodings:
+        elapsed, compressed = Best(lambda: Compress(body, encoding), args.runs)
+        print(f"{encoding:<26}{elapsed:>8.1f}ms{len(compressed):>12,}{len(body) / len(compressed):>8.2f}")
+    if brotli is None:
+        print("(install brotli to compare br)")
+
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,76 @@
+"""
+Measures how fast a fresh API worker becomes useful: the import time of `main`
+and the time from spawning uvicorn until the first request is answered.
+
+    python bench_startup.py                 # 5 runs against GET /
+    python bench_startup.py --runs 10 --path /docs
+
+Uses the same environment as the API (DATABASE_URL, DB_POOL_PREWARM, ...).
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_SNIPPET = "import time; started = time.perf_counter(); import main; print(time.perf_counter() - started)"
+
+
+def FreePort() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def ImportTime() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET], cwd=API_DIR, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def TimeToFirstRequest(path: str, timeout: float) -> float:
+    port = FreePort()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=API_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=1):
+                    return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                if server.poll() is not None:
+                    raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+                time.sleep(0.01)
+        raise TimeoutError(f"No response from {path} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def Report(name: str, samples):
+    samples = [sample * 1000 for sample in samples]
+    print(f"{name:<24} median {statistics.median(samples):8.1f} ms   min {min(samples):8.1f} ms   max {max(samples):8.1f} ms")
+
+
+def Main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    Report("import main", [ImportTime() for _ in range(args.runs)])
+    Report(f"first request {args.path}", [TimeToFirstRequest(args.path, args.timeout) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,166 @@
+"""
+Measures the per-upload cost of the storage backends against a local SFTP stand-in
+(an in-process paramiko server writing to a temp directory), so it needs no network:
+
+    python bench_storage.py                          # 50 uploads of 4 KiB
+    python bench_storage.py --uploads 200 --size 1048576 --threads 4
+
+"fresh" opens, authenticates and closes one SFTP session per upload, as uploads did before
+the session pool; "pooled" is SftpStorage with its default pool; "local" is LocalStorage.
+A real host adds its network round trips on top of the handshake, so the gap only grows there.
+"""
+import argparse
+import io
+import logging
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import paramiko
+
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, API_DIR)
+
+from Core.config import SFTP_POOL_SIZE, SFTP_DOWNLOAD_POOL_SIZE, SFTP_POOL_IDLE_TIMEOUT, SFTP_POOL_HEALTH_CHECK_AFTER, SFTP_POOL_WAIT_TIMEOUT
+from Storage import LocalStorage, SftpStorage
+
+USER, PASSWORD = "bench", "bench"
+
+
+class StandInServer(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        if (username, password) == (USER, PASSWORD):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class StandInHandle(paramiko.SFTPHandle):
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(os.fstat(self.writefile.fileno()))
+
+
+class StandInSftp(paramiko.SFTPServerInterface):
+    """Serves the real filesystem; the benchmark only ever touches its temp directory."""
+
+    def open(self, path, flags, attr):
+        try:
+            fd = os.open(path, flags, 0o644)
+        except OSError as error:
+            return paramiko.SFTPServer.convert_errno(error.errno)
+        handle = StandInHandle(flags)
+        handle.writefile = handle.readfile = os.fdopen(fd, "r+b" if flags & os.O_RDWR else ("wb" if flags & os.O_WRONLY else "rb"))
+        return handle
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError as error:
+            return paramiko.SFTPServer.convert_errno(error.errno)
+        return paramiko.SFTP_OK
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(path))
+        except OSError as error:
+            return paramiko.SFTPServer.convert_errno(error.errno)
+
+    lstat = stat
+
+    def mkdir(self, path, attr):
+        try:
+            os.mkdir(path, attr.st_mode or 0o700)
+        except OSError as error:
+            return paramiko.SFTPServer.convert_errno(error.errno)
+        return paramiko.SFTP_OK
+
+    def canonicalize(self, path):
+        return os.path.normpath(os.path.join("/", path))
+
+
+def StartStandIn(hostKey: paramiko.PKey) -> int:
+    listener = socket.socket()
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(64)
+
+    def Serve():
+        while True:
+            sock, _ = listener.accept()
+            transport = paramiko.Transport(sock)
+            transport.add_server_key(hostKey)
+            transport.set_subsystem_handler("sftp", paramiko.SFTPServer, StandInSftp)
+            transport.start_server(server=StandInServer())
+
+    threading.Thread(target=Serve, daemon=True).start()
+    return listener.getsockname()[1]
+
+
+def SftpBackend(port: int, remoteDir: str, idleTimeout: float) -> SftpStorage:
+    return SftpStorage(
+        "127.0.0.1", port, USER, PASSWORD, os.path.dirname(remoteDir), remoteDir,
+        SFTP_POOL_SIZE, SFTP_DOWNLOAD_POOL_SIZE, idleTimeout, SFTP_POOL_HEALTH_CHECK_AFTER, SFTP_POOL_WAIT_TIMEOUT,
+    )
+
+
+def Run(backend, payload: bytes, uploads: int, threads: int) -> list:
+    def Upload(index: int) -> float:
+        started = time.perf_counter()
+        backend.Save(io.BytesIO(payload), f"bench-{backend.name}-{index}.bin")
+        return (time.perf_counter() - started) * 1000
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(Upload, range(uploads)))
+
+
+def Report(label: str, timings: list):
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<8} mean {statistics.mean(timings):8.2f} ms   p50 {statistics.median(timings):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=50)
+    parser.add_argument("--size", type=int, default=4096, help="bytes per upload")
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    # The stand-in logs every client disconnect as a socket error
+    logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+    payload = os.urandom(args.size)
+    port = StartStandIn(paramiko.RSAKey.generate(2048))
+
+    with tempfile.TemporaryDirectory() as root:
+        # SftpStorage creates the directory on its first connection
+        remoteDir = os.path.join(root, "attachments")
+
+        # An idle timeout of 0 evicts every session on checkin: one handshake per upload
+        fresh = SftpBackend(port, remoteDir, 0)
+        pooled = SftpBackend(port, remoteDir, SFTP_POOL_IDLE_TIMEOUT)
+        local = LocalStorage(os.path.join(root, "local"))
+
+        print(f"{args.uploads} uploads of {args.size} bytes, {args.threads} thread(s)")
+        for label, backend in (("fresh", fresh), ("pooled", pooled), ("local", local)):
+            Report(label, Run(backend, payload, args.uploads, args.threads))
+
+        snapshot = pooled.Snapshot()
+        print(f"pooled sessions opened {snapshot['opened']}, reused {snapshot['reused']}")
+        fresh.Shutdown()
+        pooled.Shutdown()
+
+
+if __name__ == "__main__":
+    main()
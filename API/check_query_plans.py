@@ -0,0 +1,199 @@
+"""
+Migrates a scratch database to head, seeds it and EXPLAINs the hot repository queries.
+Exits non-zero when any of them still needs a full table scan, or when walking a list
+page by page does not return exactly the rows of the unpaged list.
+
+    python check_query_plans.py                      # temporary SQLite file
+    python check_query_plans.py mysql+pymysql://...  # scratch MySQL database, it gets seeded
+"""
+import os
+import sys
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+if len(sys.argv) > 1:
+    os.environ["DATABASE_URL"] = sys.argv[1]
+else:
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/plans.db")
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from Core.config import DATABASE_URL
+from Core.pagination import DecodeCursor, FetchPage, Paginate
+from Models.Attachment import Attachment, AttachmentEntityType
+from Models.Project import Project
+from Models.ProjectMember import ProjectMember
+from Models.Resource import Resource
+from Models.Risk import Risk
+from Models.Task import Task
+from Models.Team import Team
+from Models.User import User
+from Repositories import AttachmentRepository, ProjectRepository, ResourceRepository, RiskRepository
+from Repositories.TaskRepository import TaskRepository
+from Repositories.TeamRepository import TeamRepository
+from Repositories.UserRepository import UserRepository
+from Schemas.ResourceSchema import ResourceFilter
+from Schemas.RiskSchema import RiskFilter
+from Schemas.TaskSchema import TaskFilter
+from Schemas.TeamSchema import TeamFilter
+
+USERS = 50
+PROJECTS = 20
+TASKS_PER_PROJECT = 200
+ROWS_PER_PROJECT = 20
+
+
+class FirstPage:
+    limit = 100
+    after = None
+
+
+class PageAfter:
+    def __init__(self, limit, after):
+        self.limit = limit
+        self.after = after
+
+
+def NewId():
+    return str(uuid.uuid4())
+
+
+def Seed(connection):
+    now = datetime.now()
+    userIds = [NewId() for _ in range(USERS)]
+    connection.execute(insert(User), [
+        {"Id": userId, "FirstName": "Plan", "LastName": "Check", "Email": f"{userId}@example.com", "Password": "x"}
+        for userId in userIds
+    ])
+
+    projectIds = [NewId() for _ in range(PROJECTS)]
+    connection.execute(insert(Project), [
+        {"Id": projectId, "Name": f"Project {i}", "OwnerId": userIds[i % USERS],
+         "TotalBudget": 0, "RemainingBudget": 0, "IsDeleted": False}
+        for i, projectId in enumerate(projectIds)
+    ])
+    connection.execute(insert(ProjectMember), [
+        {"ProjectId": projectId, "UserId": userIds[(i + j) % USERS], "IsDeleted": False}
+        for i, projectId in enumerate(projectIds) for j in range(1, 6)
+    ])
+
+    tasks, teams, risks, resources, attachments = [], [], [], [], []
+    for i, projectId in enumerate(projectIds):
+        parentId = None
+        for j in range(TASKS_PER_PROJECT):
+            taskId = NewId()
+            tasks.append({
+                "Id": taskId, "ProjectId": projectId, "ParentTaskId": parentId if j % 10 else None,
+                "UserId": userIds[j % USERS], "CreatedBy": userIds[i % USERS], "Title": f"Task {j}",
+                "Status": "Open", "Priority": "Low", "Completed": j % 3 == 0, "IsDeleted": j % 17 == 0,
+                # Rows written before CreatedAt had a default carry NULL
+                "CreatedAt": now - timedelta(minutes=j) if j % 25 else None,
+            })
+            if j % 10 == 0:
+                parentId = taskId
+        for j in range(ROWS_PER_PROJECT):
+            teams.append({"Id": NewId(), "Name": f"Team {j}", "CreatedBy": userIds[i % USERS], "ProjectId": projectId,
+                          "IsDeleted": False, "CreatedAt": now - timedelta(minutes=j)})
+            risks.append({"Id": NewId(), "ProjectId": projectId, "Name": f"Risk {j}", "Category": "Technical",
+                          "Probability": 0.5, "Severity": 0.5, "OwnerId": userIds[i % USERS], "IsDeleted": False,
+                          "IdentifiedDate": now - timedelta(days=j)})
+            resources.append({"Id": NewId(), "ProjectId": projectId, "Name": f"Resource {j}", "Type": "Material",
+                              "IsDeleted": False, "CreatedAt": now - timedelta(minutes=j)})
+            attachments.append({"Id": NewId(), "ProjectId": projectId, "EntityType": AttachmentEntityType.RISK,
+                                "EntityId": risks[-1]["Id"], "FileName": "f.txt", "FilePath": "/tmp/f.txt",
+                                "OwnerId": userIds[i % USERS], "IsDeleted": False, "UploadedAt": now - timedelta(minutes=j)})
+
+    for model, rows in ((Task, tasks), (Team, teams), (Risk, risks), (Resource, resources), (Attachment, attachments)):
+        connection.execute(insert(model), rows)
+
+    return {"projectId": projectIds[0], "userId": userIds[0], "taskId": tasks[0]["Id"], "entityId": attachments[0]["EntityId"]}
+
+
+def HotQueries(ids):
+    projectId, userId, page = ids["projectId"], ids["userId"], FirstPage()
+    subtree = TaskRepository.SubtreeCte(ids["taskId"])
+    return {
+        "active tasks": Paginate(TaskRepository.ActiveTasksQuery(TaskFilter()), page, Task.CreatedAt, Task.Id),
+        "project tasks": Paginate(ProjectRepository.ProjectTasksQuery(projectId), page, Task.CreatedAt, Task.Id),
+        "project tasks after NULL key": Paginate(ProjectRepository.ProjectTasksQuery(projectId), PageAfter(100, (None, ids["taskId"])), Task.CreatedAt, Task.Id),
+        "assigned tasks": Paginate(UserRepository.AssignedTasksQuery(userId), page, Task.CreatedAt, Task.Id),
+        "created tasks": Paginate(UserRepository.CreatedTasksQuery(userId), page, Task.CreatedAt, Task.Id),
+        "project risks": Paginate(RiskRepository.ProjectRisksQuery(projectId, RiskFilter()), page, Risk.IdentifiedDate, Risk.Id),
+        "project resources": Paginate(ResourceRepository.ProjectResourcesQuery(projectId, ResourceFilter()), page, Resource.CreatedAt, Resource.Id),
+        "project teams": Paginate(TeamRepository.ActiveTeamsQuery(TeamFilter(ProjectId=projectId)), page, Team.CreatedAt, Team.Id),
+        "entity attachments": Paginate(AttachmentRepository.AttachmentsQuery(projectId, AttachmentEntityType.RISK, ids["entityId"]), page, Attachment.UploadedAt, Attachment.Id),
+        "type attachments": Paginate(AttachmentRepository.AttachmentsQuery(projectId, AttachmentEntityType.RISK), page, Attachment.UploadedAt, Attachment.Id),
+        "project access": ProjectRepository.ProjectAccessQuery(projectId, userId),
+        "task subtree": subtree.select(),
+        "direct subtasks": select(Task.ParentTaskId, func.count(Task.Id)).where(
+            Task.ParentTaskId.in_([ids["taskId"]]), Task.IsDeleted == False
+        ).group_by(Task.ParentTaskId),
+    }
+
+
+def FullScans(connection, statement):
+    compiled = statement.compile(connection, compile_kwargs={"literal_binds": True})
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).mappings().all()
+        details = [row["detail"] for row in rows]
+        # Scans of the recursive CTE itself are expected; only base tables count
+        scans = [d for d in details if d.startswith("SCAN ") and "USING" not in d and "TaskTree" not in d]
+        return scans, details
+    rows = connection.execute(text(f"EXPLAIN {compiled}")).mappings().all()
+    details = [f"{row['table']}: type={row['type']} key={row['key']}" for row in rows]
+    scans = [f"{row['table']}" for row in rows if row["type"] == "ALL" and not str(row["table"]).startswith("<")]
+    return scans, details
+
+
+def PageWalkMismatches(engine, projectId) -> int:
+    """Walks the project's tasks in pages shorter than its run of NULL-keyed rows, and compares with the unpaged list."""
+    statement = ProjectRepository.ProjectTasksQuery(projectId)
+    with Session(engine) as db:
+        expected = [task.Id for task in db.scalars(statement.order_by(Task.CreatedAt, Task.Id))]
+        walked, page = [], PageAfter(3, None)
+        while True:
+            result = FetchPage(db, statement, page, Task.CreatedAt, Task.Id)
+            walked += [task.Id for task in result.items]
+            if not result.nextCursor:
+                break
+            page = PageAfter(3, DecodeCursor(result.nextCursor))
+    ok = walked == expected
+    print(f"{'ok' if ok else 'MISMATCH':>9}  page walk over {len(expected)} project tasks, {len(walked)} returned")
+    return 0 if ok else 1
+
+
+def Main():
+    engine = create_engine(DATABASE_URL)
+    config = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+    with engine.begin() as connection:
+        ids = Seed(connection)
+        if connection.dialect.name == "sqlite":
+            connection.execute(text("ANALYZE"))
+        else:
+            tables = ", ".join(f"`{model.__tablename__}`" for model in (User, Project, ProjectMember, Task, Team, Risk, Resource, Attachment))
+            connection.execute(text(f"ANALYZE TABLE {tables}"))
+
+    failures = 0
+    with engine.connect() as connection:
+        for name, statement in HotQueries(ids).items():
+            scans, details = FullScans(connection, statement)
+            print(f"{'FULL SCAN' if scans else 'ok':>9}  {name}")
+            for detail in details:
+                print(f"           {detail}")
+            failures += bool(scans)
+
+    print(f"{failures} queries with full table scans")
+    mismatches = PageWalkMismatches(engine, ids["projectId"])
+    return 1 if failures or mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,60 @@
+"""
+Maintenance for the attachment blob store. First resets every Blob.RefCount from the
+attachments that point at it, then removes blobs nobody references from storage.
+
+    python collect_blobs.py             # recount and collect
+    python collect_blobs.py --dry-run   # only report what would be removed
+
+Each blob is locked while its file is removed, so an upload of the same content either
+references it before the lock is taken or stores a fresh copy after the row is gone.
+"""
+import argparse
+
+from sqlalchemy import select
+
+import main  # noqa: F401  registers and configures every mapper
+from Db.session import SessionLocal
+from Models.Blob import Blob
+from Repositories.BlobRepository import RecountBlobReferences
+from Storage import GetStorage
+
+
+def Main(dryRun: bool):
+    with SessionLocal() as db:
+        corrected = RecountBlobReferences(db)
+        if dryRun:
+            db.rollback()
+        else:
+            db.commit()
+        print(f"{corrected} reference counts corrected")
+        unreferenced = db.scalars(select(Blob.ContentHash).where(Blob.RefCount == 0)).all()
+
+    storage = GetStorage()
+    removed = 0
+    for contentHash in unreferenced:
+        with SessionLocal() as db:
+            blob = db.scalars(
+                select(Blob).where(Blob.ContentHash == contentHash, Blob.RefCount == 0).with_for_update()
+            ).first()
+            if blob is None:
+                continue
+            print(f"{contentHash}: {blob.FilePath} ({blob.Size} bytes)")
+            if dryRun:
+                continue
+            try:
+                storage.Delete(blob.FilePath)
+            except Exception as error:
+                print(f"{contentHash}: not removed, {error}")
+                continue
+            db.delete(blob)
+            db.commit()
+            removed += 1
+
+    storage.Shutdown()
+    print(f"{len(unreferenced)} unreferenced blobs, {removed} removed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true")
+    Main(parser.parse_args().dry_run)
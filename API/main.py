@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.orm import configure_mappers
 import uvicorn
 
 
@@ -15,9 +16,16 @@ from Router.RiskRouter import router as risk_router
 from Router.ResourcesRouter import router as resource_router
 from Router.AttachmentRouter import router as attachment_router
 from Router.StakeholderRouter import router as stakeholder_router
+from Router.InternalRouter import router as internal_router
 
 # Database
-from Db.session import engine, Base
+from Db.session import engine, Base, PrewarmPool
+from Core.config import DB_CREATE_ALL_ON_STARTUP, DB_POOL_PREWARM
+from Core.password_pool import passwordPool
+from Core.upload_queue import uploadQueue
+from Storage import GetStorage
+from Core.pagination import NEXT_CURSOR_HEADER
+from Core.compression import CompressionMiddleware
 
 app = FastAPI(
     title="Taskup API",
@@ -25,12 +33,15 @@ app = FastAPI(
     description="Backend API for Task Management System"
 )
 
+app.add_middleware(CompressionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 def init_db():
@@ -38,7 +49,17 @@ def init_db():
 
 @app.on_event("startup")
 def on_startup():
-    init_db()
+    # Resolve every relationship now instead of inside the first request
+    configure_mappers()
+    if DB_CREATE_ALL_ON_STARTUP:
+        init_db()
+    PrewarmPool(DB_POOL_PREWARM)
+
+@app.on_event("shutdown")
+def on_shutdown():
+    passwordPool.Shutdown()
+    uploadQueue.Shutdown()
+    GetStorage().Shutdown()
 
 @app.get("/")
 def root():
@@ -55,6 +76,7 @@ app.include_router(risk_router)
 app.include_router(resource_router)
 app.include_router(attachment_router)
 app.include_router(stakeholder_router)
+app.include_router(internal_router)
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="127.0.0.1", port=8001, reload=True)
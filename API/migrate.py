@@ -0,0 +1,33 @@
+"""
+Brings the database schema to the latest Alembic revision. Run it once per deploy,
+before starting the API workers; the workers themselves no longer touch the schema.
+
+    python migrate.py            # upgrade to head
+    python migrate.py 0002       # upgrade to a specific revision
+"""
+import os
+import sys
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from Db.session import engine
+
+BASELINE_REVISION = "0001"
+
+
+def Main(revision: str = "head"):
+    config = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+        if "alembic_version" not in tables and "User" in tables:
+            # Created by create_all before migrations existed: it already has the baseline tables
+            print(f"Unversioned database, stamping {BASELINE_REVISION}")
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
+
+
+if __name__ == "__main__":
+    Main(*sys.argv[1:2])
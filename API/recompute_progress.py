@@ -0,0 +1,37 @@
+"""
+Rebuilds the task progress counters (Project.TaskTotal/TaskCompleted/Progress and
+Task.SubtaskTotal/SubtaskCompleted) from the live tasks. Migration 0003 backfills
+them; run this any time the counters are suspected to have drifted.
+
+    python recompute_progress.py                 # every live project
+    python recompute_progress.py <projectId> ... # only these projects
+"""
+import sys
+
+from sqlalchemy import select
+
+import main  # noqa: F401  registers and configures every mapper
+from Db.session import SessionLocal
+from Models.Project import Project
+from Repositories.TaskRepository import RecomputeProgressCounters
+
+
+def Main(projectIds=None):
+    with SessionLocal() as db:
+        if not projectIds:
+            projectIds = db.scalars(select(Project.Id).where(Project.IsDeleted == False)).all()
+
+        corrected = 0
+        for projectId in projectIds:
+            # One transaction per project keeps locks short on large backfills
+            rows = RecomputeProgressCounters(db, projectId)
+            db.commit()
+            corrected += rows
+            if rows:
+                print(f"{projectId}: corrected {rows} rows")
+
+    print(f"{len(projectIds)} projects checked, {corrected} rows corrected")
+
+
+if __name__ == "__main__":
+    Main(sys.argv[1:])
@@ -0,0 +1,35 @@
+"""
+Compares every project's RemainingBudget with the sum of its BudgetLedger entries.
+
+    python reconcile_budget.py                   # report drift, exit 1 if there is any
+    python reconcile_budget.py --fix             # reset drifted balances from the ledger
+    python reconcile_budget.py --fix <projectId> # only these projects
+"""
+import argparse
+import sys
+
+import main  # noqa: F401  registers and configures every mapper
+from Db.session import SessionLocal
+from Repositories.ResourceRepository import FindBudgetDrift, ReconcileRemainingBudget
+
+
+def Main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("projectIds", nargs="*")
+    parser.add_argument("--fix", action="store_true")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        drifted = FindBudgetDrift(db, args.projectIds)
+        for projectId, remaining, balance in drifted:
+            print(f"{projectId}: RemainingBudget {remaining} != ledger {balance}")
+            if args.fix:
+                ReconcileRemainingBudget(db, projectId)
+                db.commit()
+
+    print(f"{len(drifted)} projects out of balance{', fixed' if args.fix and drifted else ''}")
+    return 1 if drifted and not args.fix else 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
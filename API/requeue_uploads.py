@@ -0,0 +1,54 @@
+"""
+Finishes attachment uploads left Pending by a worker that stopped before transferring them
+(a crash, a restart, or a shutdown with jobs still queued). Run it on the host that owns
+UPLOAD_STAGING_DIR:
+
+    python requeue_uploads.py                     # Pending for more than 10 minutes
+    python requeue_uploads.py --older-than 0      # every Pending upload
+
+Uploads are retried like the background workers do; those whose staged file is gone are marked Failed.
+"""
+import argparse
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+import main  # noqa: F401  registers and configures every mapper
+from Core.config import UPLOAD_MAX_ATTEMPTS, UPLOAD_RETRY_DELAY
+from Core.upload_queue import UploadQueue
+from Db.session import SessionLocal
+from Models.Attachment import Attachment, AttachmentStatus
+from Repositories.AttachmentRepository import StagedUploadPath
+from Services.AttachmentService import TransferUpload, FailUpload
+
+
+def Main(olderThanMinutes: float):
+    cutoff = datetime.utcnow() - timedelta(minutes=olderThanMinutes)
+    with SessionLocal() as db:
+        attachmentIds = db.scalars(
+            select(Attachment.Id).where(
+                Attachment.Status == AttachmentStatus.PENDING,
+                Attachment.UploadedAt <= cutoff
+            )
+        ).all()
+
+    # No workers: each job runs here, with the same retries and failure handling
+    queue = UploadQueue(0, 0, 0, UPLOAD_MAX_ATTEMPTS, UPLOAD_RETRY_DELAY)
+    for attachmentId in attachmentIds:
+        if not os.path.exists(StagedUploadPath(attachmentId)):
+            FailUpload(attachmentId, FileNotFoundError("staged file is missing"))
+            print(f"{attachmentId}: staged file missing, marked Failed")
+            continue
+        queue.Reserve()
+        queue.Submit(lambda attempt: TransferUpload(attachmentId, attempt), lambda error: FailUpload(attachmentId, error))
+        print(f"{attachmentId}: requeued")
+
+    snapshot = queue.Snapshot()
+    print(f"{len(attachmentIds)} pending uploads, {snapshot['completed']} completed, {snapshot['failed']} failed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--older-than", type=float, default=10, help="minutes an upload has been Pending")
+    Main(parser.parse_args().older_than)
@@ -0,0 +1,128 @@
+"""
+Hammers POST /resources/assign from many threads against a real uvicorn worker and checks
+that no budget or quantity update was lost: every accepted assignment is paid for exactly
+once, the resource is never oversubscribed and the ledger still sums to the balance.
+
+    python stress_assign.py                            # 16 threads, 400 requests
+    python stress_assign.py --threads 64 --requests 2000 --budget 5000 --cost 3
+
+Seeds its own user, project, task and resource in DATABASE_URL, which must be migrated.
+Use a scratch MySQL database for meaningful numbers; SQLite serializes every writer.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from sqlalchemy import func, select
+
+import main  # noqa: F401  registers and configures every mapper
+from bench_startup import API_DIR, FreePort
+from Db.session import SessionLocal
+from Dependencies.auth import CreateAccessToken
+from Models import Project, Task, User
+from Models.ActivityResource import ActivityResource
+from Models.BudgetLedger import BudgetLedger
+from Models.Resource import Resource
+
+
+def Seed(budget: int, available: int):
+    with SessionLocal() as db:
+        owner = User(FirstName="Stress", LastName="Test", Email=f"stress-{uuid.uuid4()}@example.com", Password="x")
+        db.add(owner)
+        db.flush()
+        project = Project(Name="Budget stress test", OwnerId=owner.Id, TotalBudget=budget, RemainingBudget=budget)
+        db.add(project)
+        db.flush()
+        db.add(BudgetLedger(ProjectId=project.Id, Amount=budget, Reason=BudgetLedger.REASON_OPENING))
+        task = Task(Title="Stress", Status="Open", Priority="Low", ProjectId=project.Id, CreatedBy=owner.Id)
+        resource = Resource(Name="Stress", Type="Material", ProjectId=project.Id, Unit="pcs", Total=available, Available=available)
+        db.add_all([task, resource])
+        db.commit()
+        return owner.Id, project.Id, task.Id, resource.Id
+
+
+def StartServer(port: int):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=API_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.perf_counter() + 30
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1):
+                return server
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.05)
+    server.terminate()
+    raise TimeoutError("uvicorn did not come up")
+
+
+def Assign(url: str, token: str, body: bytes) -> int:
+    request = urllib.request.Request(url, data=body, method="POST", headers={
+        "Authorization": f"Bearer {token}", "Content-Type": "application/json"
+    })
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+def Main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--budget", type=int, default=1000)
+    parser.add_argument("--cost", type=int, default=10)
+    parser.add_argument("--available", type=int, default=150)
+    args = parser.parse_args()
+
+    ownerId, projectId, taskId, resourceId = Seed(args.budget, args.available)
+    token = CreateAccessToken({"sub": ownerId})
+    body = json.dumps({"TaskId": taskId, "ResourceId": resourceId, "Quantity": 1, "EstimatedCost": args.cost}).encode()
+
+    port = FreePort()
+    server = StartServer(port)
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as pool:
+            statuses = Counter(pool.map(lambda _: Assign(f"http://127.0.0.1:{port}/resources/assign", token, body), range(args.requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    with SessionLocal() as db:
+        remaining = db.scalar(select(Project.RemainingBudget).where(Project.Id == projectId))
+        ledger = db.scalar(select(func.sum(BudgetLedger.Amount)).where(BudgetLedger.ProjectId == projectId))
+        available = db.scalar(select(Resource.Available).where(Resource.Id == resourceId))
+        assignments = db.scalar(select(func.count(ActivityResource.Id)).where(ActivityResource.ResourceId == resourceId))
+
+    accepted = statuses.get(201, 0)
+    expected = min(args.requests, args.budget // args.cost, args.available)
+    checks = {
+        f"accepted == {expected}": accepted == expected,
+        "only 201 and 400 responses": set(statuses) <= {201, 400},
+        "assignment rows == accepted": assignments == accepted,
+        "RemainingBudget == budget - accepted * cost": Decimal(remaining) == args.budget - accepted * args.cost,
+        "ledger sum == RemainingBudget": Decimal(ledger) == Decimal(remaining),
+        "Available == available - accepted": available == args.available - accepted,
+    }
+
+    print(f"{args.requests} requests on {args.threads} threads in {elapsed:.2f}s ({args.requests / elapsed:.0f} req/s)")
+    print(f"responses {dict(statuses)}, RemainingBudget {remaining}, ledger {ledger}, Available {available}")
+    for name, passed in checks.items():
+        print(f"{'ok' if passed else 'FAIL':>5}  {name}")
+    return 0 if all(checks.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
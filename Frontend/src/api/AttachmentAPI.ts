@@ -1,17 +1,27 @@
 import { api } from '@/lib/axios';
+import { getAllPages } from '@/lib/pagination';
 
 export interface Attachment {
   Id: string;
   FileName: string;
   FileType: string;
   FileSize: number;
-  FilePath: string;
+  Status: 'Pending' | 'Ready' | 'Failed';
+  DownloadUrl: string | null;
   EntityType: 'Scope' | 'Risk' | 'Resource' | 'Schedule' | 'Cost';
   EntityId: string;
   OwnerId: string;
   UploadedAt: string;
 }
 
+export interface UploadStatus {
+  Id: string;
+  Status: 'Pending' | 'Ready' | 'Failed';
+  Attempts: number;
+  Error?: string | null;
+  FileSize: number;
+}
+
 export interface AttachmentCreateData {
   FileName: string;
   FileType: string;
@@ -41,6 +51,14 @@ export async function uploadAttachment(file: File, entityType: string, entityId:
   return response.data;
 }
 
+/**
+ * Get the upload status of an attachment (uploads are transferred to storage in the background)
+ */
+export async function getUploadStatus(attachmentId: string): Promise<UploadStatus> {
+  const response = await api.get(`/attachments/${attachmentId}/status`);
+  return response.data;
+}
+
 /**
  * Add an attachment
  */
@@ -68,16 +86,14 @@ export async function getAttachmentById(attachmentId: string): Promise<Attachmen
  * Get all attachments for an entity
  */
 export async function getAttachmentsByEntity(projectId: string, entityType: string, entityId: string): Promise<Attachment[]> {
-  const response = await api.get(`/attachments/entity/${projectId}/${entityType}/${entityId}`);
-  return response.data;
+  return getAllPages<Attachment>(`/attachments/entity/${projectId}/${entityType}/${entityId}`);
 }
 
 /**
  * Get all attachments by entity type
  */
 export async function getAttachmentsByEntityType(projectId: string, entityType: string): Promise<Attachment[]> {
-  const response = await api.get(`/attachments/type/${projectId}/${entityType}`);
-  return response.data;
+  return getAllPages<Attachment>(`/attachments/type/${projectId}/${entityType}`);
 }
 
 /**
@@ -1,5 +1,6 @@
 // src/api/ResourceAPI.ts
 import { api } from '@/lib/axios';
+import { getAllPages } from '@/lib/pagination';
 
 export interface Resource {
   Id: string;
@@ -120,8 +121,7 @@ export async function deleteResource(resourceId: string): Promise<any> {
  */
 export async function getProjectResources(projectId: string): Promise<Resource[]> {
   try {
-    const response = await api.get(`/resources/project/${projectId}`);
-    return response.data;
+    return await getAllPages<Resource>(`/resources/project/${projectId}`);
   } catch (error) {
     console.error('Error fetching project resources:', error);
     return [];
@@ -1,5 +1,6 @@
 // Frontend/src/api/RiskAPI.ts
 import { api } from '@/lib/axios';
+import { getAllPages } from '@/lib/pagination';
 
 export interface Risk {
   Id: string;
@@ -61,8 +62,7 @@ export interface RiskResponsePlanCreateData {
 export async function getProjectRisks(projectId: string): Promise<Risk[]> {
   try {
     // Make sure the URL path matches exactly what's in your API
-    const response = await api.get(`/risks/project/${projectId}`);
-    return Array.isArray(response.data) ? response.data : [];
+    return await getAllPages<Risk>(`/risks/project/${projectId}`);
   } catch (error) {
     console.error('Error fetching project risks:', error);
     throw error;
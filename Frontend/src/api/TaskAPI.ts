@@ -1,5 +1,6 @@
 // src/api/TaskAPI.ts - Fixed version
 import { api } from '@/lib/axios';
+import { getAllPages } from '@/lib/pagination';
 
 export interface Task {
   Id: string;
@@ -57,7 +58,7 @@ export interface Attachment {
   FileName: string;
   FileType: string;
   FileSize: number;
-  FilePath: string;
+  DownloadUrl?: string | null;
   EntityType?: string;
   EntityId?: string;
   OwnerId?: string;
@@ -70,8 +71,7 @@ export interface Attachment {
  */
 export async function getAllTasks(): Promise<Task[]> {
   try {
-    const response = await api.get('/tasks/');
-    return response.data;
+    return await getAllPages<Task>('/tasks/');
   } catch (error) {
     console.error('Error fetching all tasks:', error);
     return [];
@@ -127,8 +127,7 @@ export async function deleteTask(taskId: string): Promise<any> {
  */
 export async function getUserTasks(userId: string): Promise<Task[]> {
   try {
-    const response = await api.get(`/users/${userId}/tasks/assigned`);
-    return response.data;
+    return await getAllPages<Task>(`/users/${userId}/tasks/assigned`);
   } catch (error) {
     console.error('Error fetching user tasks:', error);
     return [];
@@ -140,8 +139,7 @@ export async function getUserTasks(userId: string): Promise<Task[]> {
  */
 export async function getTasksCreatedByUser(userId: string): Promise<Task[]> {
   try {
-    const response = await api.get(`/users/${userId}/tasks/created`);
-    return response.data;
+    return await getAllPages<Task>(`/users/${userId}/tasks/created`);
   } catch (error) {
     console.error('Error fetching tasks created by user:', error);
     return [];
@@ -153,8 +151,7 @@ export async function getTasksCreatedByUser(userId: string): Promise<Task[]> {
  */
 export async function getCurrentUserTasks(): Promise<Task[]> {
   try {
-    const response = await api.get('/users/tasks/assigned');
-    return response.data;
+    return await getAllPages<Task>('/users/tasks/assigned');
   } catch (error) {
     console.error('Error fetching assigned tasks:', error);
     return [];
@@ -173,8 +170,7 @@ export async function getCurrentUserAssignedTasks(): Promise<Task[]> {
  */
 export async function getTasksCreatedByCurrentUser(): Promise<Task[]> {
   try {
-    const response = await api.get('/users/tasks/created');
-    return response.data;
+    return await getAllPages<Task>('/users/tasks/created');
   } catch (error) {
     console.error('Error fetching tasks created by current user:', error);
     return [];
@@ -201,8 +197,7 @@ export async function markTaskComplete(taskId: string): Promise<Task> {
 export async function getProjectTasks(projectId: string): Promise<Task[]> {
   try {
     // Try the direct endpoint first
-    const response = await api.get(`/projects/${projectId}/tasks`);
-    return response.data;
+    return await getAllPages<Task>(`/projects/${projectId}/tasks`);
   } catch (error) {
     console.error(`Error fetching project tasks: ${error}`);
     
@@ -228,8 +223,7 @@ export async function getTaskAttachments(taskId: string, projectId: string): Pro
   }
 
   try {
-    const response = await api.get(`/attachments/entity/${projectId}/Task/${taskId}`);
-    return response.data;
+    return await getAllPages(`/attachments/entity/${projectId}/Task/${taskId}`);
   } catch (error: any) {
     if (error?.response?.status === 404) return [];
     console.error('Failed to fetch task attachments:', error);
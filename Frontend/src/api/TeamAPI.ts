@@ -1,6 +1,7 @@
 // Frontend/src/api/TeamAPI.ts
 
 import { api } from '@/lib/axios';
+import { getAllPages } from '@/lib/pagination';
 
 export interface Team {
   Id: string;
@@ -63,8 +64,7 @@ export async function createTeam(data: TeamCreateData): Promise<Team> {
  */
 export async function getAllTeams(): Promise<Team[]> {
   try {
-    const response = await api.get('/teams/');
-    return response.data;
+    return await getAllPages<Team>('/teams/');
   } catch (error) {
     console.error('[TeamAPI] Error fetching teams:', error);
     return [];
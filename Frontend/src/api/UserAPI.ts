@@ -1,4 +1,5 @@
 import { api } from '@/lib/axios';
+import { getAllPages } from '@/lib/pagination';
 import { useUserStore } from '@/stores/userStore';
 
 export interface User {
@@ -271,32 +272,28 @@ export async function getCurrentUserTeams(): Promise<any[]> {
  * Get tasks assigned to a user
  */
 export async function getUserAssignedTasks(userId: string): Promise<any[]> {
-  const res = await api.get(`/users/${userId}/tasks/assigned`);
-  return res.data;
+  return getAllPages(`/users/${userId}/tasks/assigned`);
 }
 
 /**
  * Get tasks created by a user
  */
 export async function getUserCreatedTasks(userId: string): Promise<any[]> {
-  const res = await api.get(`/users/${userId}/tasks/created`);
-  return res.data;
+  return getAllPages(`/users/${userId}/tasks/created`);
 }
 
 /**
  * Get tasks assigned to current user
  */
 export async function getCurrentUserAssignedTasks(): Promise<any[]> {
-  const res = await api.get('/users/tasks/assigned');
-  return res.data;
+  return getAllPages('/users/tasks/assigned');
 }
 
 /**
  * Get tasks created by current user
  */
 export async function getCurrentUserCreatedTasks(): Promise<any[]> {
-  const res = await api.get('/users/tasks/created');
-  return res.data;
+  return getAllPages('/users/tasks/created');
 }
 
 /**
@@ -24,7 +24,7 @@ interface Attachment {
   FileName: string;
   FileType: string;
   FileSize: number;
-  FilePath: string;
+  DownloadUrl?: string | null;
   EntityType: string;
   EntityId: string;
   OwnerId: string;
@@ -187,7 +187,8 @@ export function ProjectAttachments({ projectId }: { projectId: string }) {
                   variant="ghost" 
                   size="sm" 
                   className="text-primary"
-                  onClick={() => window.open(attachment.FilePath, '_blank')}
+                  disabled={!attachment.DownloadUrl}
+                  onClick={() => attachment.DownloadUrl && window.open(attachment.DownloadUrl, '_blank')}
                 >
                   Download
                 </Button>
@@ -11,7 +11,7 @@ interface Attachment {
   FileName: string;
   FileType: string;
   FileSize: number;
-  FilePath: string;
+  DownloadUrl?: string | null;
   EntityType?: string;
   EntityId?: string;
   OwnerId?: string;
@@ -141,7 +141,8 @@ export function AttachmentsSection({
                   <Button
                     variant="ghost"
                     size="sm"
-                    onClick={() => window.open(attachment.FilePath, '_blank')}
+                    disabled={!attachment.DownloadUrl}
+                    onClick={() => attachment.DownloadUrl && window.open(attachment.DownloadUrl, '_blank')}
                     className="text-primary hover:text-primary/80 hover:bg-primary/10"
                   >
                     <Download className="h-4 w-4" />
@@ -0,0 +1,24 @@
+// src/lib/pagination.ts
+import { api } from '@/lib/axios';
+
+// List endpoints answer one page at a time; the cursor of the next page comes in this header
+const NEXT_CURSOR_HEADER = 'x-next-cursor';
+const PAGE_SIZE = 200;
+
+/**
+ * Fetches every page of a list endpoint by following X-Next-Cursor
+ */
+export async function getAllPages<T = any>(url: string, params: Record<string, any> = {}): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await api.get(url, {
+      params: { ...params, limit: PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+    });
+    if (Array.isArray(response.data)) {
+      items.push(...response.data);
+    }
+    cursor = response.headers[NEXT_CURSOR_HEADER];
+  } while (cursor);
+  return items;
+}